@@ -6,12 +6,22 @@ Implements HEFT algorithm for optimal task-to-node assignment in DAG workflows.
 Industry-standard dynamic per-step scheduling for heterogeneous computing.
 """
 
+import heapq
 import json
 import random
-from dataclasses import dataclass
+import sys
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
 
+try:
+    import pulp
+    PULP_AVAILABLE = True
+except ImportError:
+    PULP_AVAILABLE = False
+
+# DAGs up to this size are solved exactly by run_ilp(); larger ones use HEFT
+ILP_MAX_TASKS = 50
+
 # Cluster configuration
 NODES = {
     'master-m001': {'zone': 'R1', 'type': 'master', 'capacity': 0.8},
@@ -50,17 +60,28 @@ DEFAULT_EXEC_COSTS = {
 }
 
 
-@dataclass
 class Task:
-    """Represents a task in the DAG."""
-    id: str
-    task_type: str
-    predecessors: List[str]
-    successors: List[str]
-    upward_rank: float = 0.0
-    scheduled_node: Optional[str] = None
-    start_time: float = 0.0
-    end_time: float = 0.0
+    """Represents a task in the DAG (slotted: no per-instance __dict__)."""
+    __slots__ = ('id', 'task_type', 'predecessors', 'successors',
+                 'upward_rank', 'scheduled_node', 'start_time', 'end_time')
+    
+    def __init__(self, id: str, task_type: str, predecessors: List[str],
+                 successors: List[str], upward_rank: float = 0.0,
+                 scheduled_node: Optional[str] = None,
+                 start_time: float = 0.0, end_time: float = 0.0):
+        self.id = id
+        self.task_type = task_type
+        self.predecessors = predecessors
+        self.successors = successors
+        self.upward_rank = upward_rank
+        self.scheduled_node = scheduled_node
+        self.start_time = start_time
+        self.end_time = end_time
+    
+    def __repr__(self):
+        return (f"Task(id={self.id!r}, task_type={self.task_type!r}, "
+                f"scheduled_node={self.scheduled_node!r}, "
+                f"start_time={self.start_time}, end_time={self.end_time})")
 
 
 class HEFTScheduler:
@@ -265,21 +286,133 @@ class HEFTScheduler:
         self.schedule[task_id] = (best_node, best_start, best_end)
         return best_node, best_start, best_end
     
+    def reset(self):
+        """
+        Clear schedule state so the scheduler can be reused.
+        
+        The DAG, exec/comm cost tables and upward ranks are kept; only node
+        availability, the schedule and per-task placements are cleared.
+        """
+        for node in self.node_availability:
+            self.node_availability[node] = 0.0
+        self.schedule.clear()
+        for task in self.tasks.values():
+            task.scheduled_node = None
+            task.start_time = 0.0
+            task.end_time = 0.0
+    
     def run_heft(self) -> Dict[str, Tuple[str, float, float]]:
         """Execute HEFT algorithm."""
-        # Step 1: Define DAG
-        self.define_dag()
+        # Step 1: Define DAG (kept across runs) and clear previous schedule
+        if not self.tasks:
+            self.define_dag()
+        self.reset()
         
         # Step 2: Compute upward ranks
         self.compute_all_ranks()
         
-        # Step 3: Sort tasks by decreasing upward rank
-        sorted_tasks = sorted(self.tasks.values(), key=lambda t: t.upward_rank, reverse=True)
+        # Step 3: Max-heap of tasks keyed on upward rank
+        heap = [(-t.upward_rank, t.id) for t in self.tasks.values()]
+        heapq.heapify(heap)
+        
+        # Step 4: Schedule each task in decreasing rank order
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            self.schedule_task(task_id)
+        
+        return self.schedule
+    
+    def run_ilp(self, max_tasks: int = ILP_MAX_TASKS,
+                time_limit: Optional[int] = 60) -> Dict[str, Tuple[str, float, float]]:
+        """
+        Compute a makespan-optimal schedule with an ILP (PuLP + CBC).
+        
+        Variables: x[i,n] assigns task i to node n, start/end times per task,
+        zone-pair indicators per edge for communication cost, and ordering
+        binaries for tasks that may share a node. Falls back to run_heft()
+        when PuLP is unavailable, the DAG exceeds max_tasks, or the solver
+        does not reach an optimal/feasible solution.
+        """
+        if not self.tasks:
+            self.define_dag()
+        
+        if not PULP_AVAILABLE or len(self.tasks) > max_tasks:
+            return self.run_heft()
+        
+        task_ids = list(self.tasks)
+        nodes = list(self.nodes)
+        zones = sorted({info['zone'] for info in self.nodes.values()})
+        edges = [(p, t) for t in task_ids for p in self.tasks[t].predecessors]
+        
+        exec_cost = {(t, n): self.get_exec_cost(self.tasks[t].task_type, n)
+                     for t in task_ids for n in nodes}
+        zone_comm = {(za, zb): self.comm_costs.get((za, zb), 1.0)
+                     for za in zones for zb in zones}
+        
+        # Upper bound on makespan: everything serialized with worst-case comms
+        big_m = (sum(max(exec_cost[t, n] for n in nodes) for t in task_ids)
+                 + len(edges) * max(zone_comm.values()))
+        
+        # Tasks connected by a path are already ordered by precedence
+        reach = {t: set(self.tasks[t].successors) for t in task_ids}
+        changed = True
+        while changed:
+            changed = False
+            for t in task_ids:
+                extra = set().union(*(reach[s] for s in reach[t])) - reach[t]
+                if extra:
+                    reach[t] |= extra
+                    changed = True
+        free_pairs = [(a, b) for k, a in enumerate(task_ids) for b in task_ids[k + 1:]
+                      if b not in reach[a] and a not in reach[b]]
+        
+        prob = pulp.LpProblem('heft_ilp', pulp.LpMinimize)
+        x = pulp.LpVariable.dicts('x', (task_ids, nodes), cat='Binary')
+        start = pulp.LpVariable.dicts('start', task_ids, lowBound=0)
+        end = pulp.LpVariable.dicts('end', task_ids, lowBound=0)
+        makespan = pulp.LpVariable('makespan', lowBound=0)
+        prob += makespan
         
-        # Step 4: Schedule each task
-        for task in sorted_tasks:
-            self.schedule_task(task.id)
+        in_zone = {(t, z): pulp.lpSum(x[t][n] for n in nodes if self.nodes[n]['zone'] == z)
+                   for t in task_ids for z in zones}
         
+        for t in task_ids:
+            prob += pulp.lpSum(x[t][n] for n in nodes) == 1
+            prob += end[t] == start[t] + pulp.lpSum(exec_cost[t, n] * x[t][n] for n in nodes)
+            prob += makespan >= end[t]
+        
+        for e, (p, t) in enumerate(edges):
+            # w[za,zb] >= x_p(za) AND x_t(zb); minimization keeps it at the product
+            w = pulp.LpVariable.dicts(f'w{e}', (zones, zones), lowBound=0)
+            for za in zones:
+                for zb in zones:
+                    prob += w[za][zb] >= in_zone[p, za] + in_zone[t, zb] - 1
+            comm = pulp.lpSum(zone_comm[za, zb] * w[za][zb] for za in zones for zb in zones)
+            prob += start[t] >= end[p] + comm
+        
+        for k, (a, b) in enumerate(free_pairs):
+            order = pulp.LpVariable(f'o{k}', cat='Binary')  # 1 => a before b
+            for n in nodes:
+                shared = 2 - x[a][n] - x[b][n]
+                prob += start[b] >= end[a] - big_m * (1 - order) - big_m * shared
+                prob += start[a] >= end[b] - big_m * order - big_m * shared
+        
+        prob.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit))
+        if pulp.LpStatus[prob.status] != 'Optimal':
+            return self.run_heft()
+        
+        self.reset()
+        for t in task_ids:
+            task = self.tasks[t]
+            node = max(nodes, key=lambda n: x[t][n].value() or 0.0)
+            task.scheduled_node = node
+            task.start_time = start[t].value()
+            task.end_time = end[t].value()
+            self.node_availability[node] = max(self.node_availability[node], task.end_time)
+            self.schedule[t] = (node, task.start_time, task.end_time)
+        
+        # Keep upward ranks populated for print_schedule()
+        self.compute_all_ranks()
         return self.schedule
     
     def get_exclusion_info(self, task_id: str = None) -> Dict:
@@ -307,23 +440,27 @@ class HEFTScheduler:
         }
     
     def print_schedule(self):
-        """Print the computed schedule."""
-        print("\n" + "=" * 70)
-        print("HEFT SCHEDULE")
-        print("=" * 70)
-        print(f"{'Task':<25} {'Node':<15} {'Start':>10} {'End':>10} {'Rank':>10}")
-        print("-" * 70)
+        """Print the computed schedule (built in memory, written once)."""
+        out = [
+            "",
+            "=" * 70,
+            "HEFT SCHEDULE",
+            "=" * 70,
+            f"{'Task':<25} {'Node':<15} {'Start':>10} {'End':>10} {'Rank':>10}",
+            "-" * 70,
+        ]
         
         for task_id in sorted(self.schedule.keys(), key=lambda t: self.schedule[t][1]):
             node, start, end = self.schedule[task_id]
             rank = self.tasks[task_id].upward_rank
-            zone = self.nodes[node]['zone']
-            print(f"{task_id:<25} {node} ({zone}){' '*(15-len(node)-4)} {start:>10.1f} {end:>10.1f} {rank:>10.1f}")
+            placement = f"{node} ({self.nodes[node]['zone']})"
+            out.append(f"{task_id:<25} {placement:<15} {start:>10.1f} {end:>10.1f} {rank:>10.1f}")
         
         makespan = max(s[2] for s in self.schedule.values())
-        print("-" * 70)
-        print(f"Makespan: {makespan:.1f}s")
-        print("=" * 70)
+        out.append("-" * 70)
+        out.append(f"Makespan: {makespan:.1f}s")
+        out.append("=" * 70)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -331,7 +468,6 @@ def main():
     scheduler = HEFTScheduler()
     
     # Optionally load benchmark data
-    import sys
     if len(sys.argv) > 1:
         scheduler.load_benchmark_data(sys.argv[1])
     
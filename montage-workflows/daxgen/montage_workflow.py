@@ -18,7 +18,13 @@ Workflow Stages:
 import os
 import sys
 import argparse
+import hashlib
 import math
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from Pegasus.api import (
@@ -39,6 +45,11 @@ from Pegasus.api import (
     OS,
 )
 
+# Simulated Montage executables shipped next to the DAX generator
+LOCAL_EXEC_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'executables'
+)
+
 
 class MontageWorkflowGenerator:
     """Generates Montage astronomy workflow for Pegasus."""
@@ -66,13 +77,23 @@ class MontageWorkflowGenerator:
         self.sc = None
         self.rc = None
         
+        # (job, parents) in creation order - a valid topological order
+        self._local_plan = []
+        
     def _calculate_overlaps(self):
         """Calculate number of image overlaps."""
-        # Grid-based overlap calculation
-        side = int(math.sqrt(self.n_images))
+        # Grid-based overlap calculation (integer-exact square root)
+        side = math.isqrt(self.n_images)
         # Horizontal + vertical overlaps
         return 2 * side * (side - 1)
     
+    def _add_job(self, job, parents=()):
+        """Add a job to the workflow and record it for local execution."""
+        self.wf.add_jobs(job)
+        if parents:
+            self.wf.add_dependency(job, parents=list(parents))
+        self._local_plan.append((job, tuple(parents)))
+    
     def create_transformation_catalog(self):
         """Create transformation catalog with Montage executables."""
         self.tc = TransformationCatalog()
@@ -144,6 +165,7 @@ class MontageWorkflowGenerator:
         """Create the Montage workflow DAG."""
         run_id = f"montage-{self.degree}deg-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         self.wf = Workflow(run_id)
+        self._local_plan = []
         
         # ===== STAGE 1: mProjectPP (Parallel Reprojection) =====
         project_jobs = []
@@ -160,20 +182,17 @@ class MontageWorkflowGenerator:
             job.add_outputs(output_file, stage_out=False)
             job.add_profiles(Namespace.PEGASUS, key='label', value=f'project-{i}')
             
-            self.wf.add_jobs(job)
+            self._add_job(job)
             project_jobs.append(job)
         
         # ===== STAGE 2: mImgtbl (Generate Image Table) =====
         imgtbl_out = File('images.tbl')
         imgtbl_job = Job('mImgtbl', namespace='montage', version='6.0')
         imgtbl_job.add_args('-t', str(self.n_images), imgtbl_out)
-        for pf in projected_files:
-            imgtbl_job.add_inputs(pf)
+        imgtbl_job.add_inputs(*projected_files)
         imgtbl_job.add_outputs(imgtbl_out, stage_out=False)
         
-        self.wf.add_jobs(imgtbl_job)
-        for pj in project_jobs:
-            self.wf.add_dependency(imgtbl_job, parents=[pj])
+        self._add_job(imgtbl_job, parents=project_jobs)
         
         # ===== STAGE 3: mDiffFit (Difference Computation) =====
         difffit_jobs = []
@@ -197,21 +216,17 @@ class MontageWorkflowGenerator:
             job.add_outputs(diff_file, stage_out=False)
             job.add_outputs(fit_file, stage_out=False)
             
-            self.wf.add_jobs(job)
-            self.wf.add_dependency(job, parents=[imgtbl_job])
+            self._add_job(job, parents=[imgtbl_job])
             difffit_jobs.append(job)
         
         # ===== STAGE 4: mConcatFit (Concatenate Fits) =====
         concat_out = File('fits.tbl')
         concat_job = Job('mConcatFit', namespace='montage', version='6.0')
         concat_job.add_args('-o', concat_out)
-        for ff in fit_files:
-            concat_job.add_inputs(ff)
+        concat_job.add_inputs(*fit_files)
         concat_job.add_outputs(concat_out, stage_out=False)
         
-        self.wf.add_jobs(concat_job)
-        for dj in difffit_jobs:
-            self.wf.add_dependency(concat_job, parents=[dj])
+        self._add_job(concat_job, parents=difffit_jobs)
         
         # ===== STAGE 5: mBgModel (Background Model) =====
         bgmodel_out = File('corrections.tbl')
@@ -220,8 +235,7 @@ class MontageWorkflowGenerator:
         bgmodel_job.add_inputs(imgtbl_out, concat_out)
         bgmodel_job.add_outputs(bgmodel_out, stage_out=False)
         
-        self.wf.add_jobs(bgmodel_job)
-        self.wf.add_dependency(bgmodel_job, parents=[concat_job])
+        self._add_job(bgmodel_job, parents=[concat_job])
         
         # ===== STAGE 6: mBgExec (Apply Corrections) =====
         bgexec_jobs = []
@@ -236,21 +250,17 @@ class MontageWorkflowGenerator:
             job.add_inputs(projected_files[i-1], bgmodel_out)
             job.add_outputs(corrected_file, stage_out=False)
             
-            self.wf.add_jobs(job)
-            self.wf.add_dependency(job, parents=[bgmodel_job])
+            self._add_job(job, parents=[bgmodel_job])
             bgexec_jobs.append(job)
         
         # ===== STAGE 7: mAdd (Co-add Images) =====
         mosaic_file = File('mosaic.fits')
         add_job = Job('mAdd', namespace='montage', version='6.0')
         add_job.add_args('-o', mosaic_file)
-        for cf in corrected_files:
-            add_job.add_inputs(cf)
+        add_job.add_inputs(*corrected_files)
         add_job.add_outputs(mosaic_file, stage_out=True)
         
-        self.wf.add_jobs(add_job)
-        for bj in bgexec_jobs:
-            self.wf.add_dependency(add_job, parents=[bj])
+        self._add_job(add_job, parents=bgexec_jobs)
         
         # ===== STAGE 8: mShrink (Create Thumbnail) =====
         thumb_file = File('mosaic_thumb.fits')
@@ -259,8 +269,7 @@ class MontageWorkflowGenerator:
         shrink_job.add_inputs(mosaic_file)
         shrink_job.add_outputs(thumb_file, stage_out=True)
         
-        self.wf.add_jobs(shrink_job)
-        self.wf.add_dependency(shrink_job, parents=[add_job])
+        self._add_job(shrink_job, parents=[add_job])
         
         # ===== STAGE 9: mJPEG (Create JPEG) =====
         jpeg_file = File('mosaic.jpg')
@@ -269,8 +278,7 @@ class MontageWorkflowGenerator:
         jpeg_job.add_inputs(mosaic_file)
         jpeg_job.add_outputs(jpeg_file, stage_out=True)
         
-        self.wf.add_jobs(jpeg_job)
-        self.wf.add_dependency(jpeg_job, parents=[add_job])
+        self._add_job(jpeg_job, parents=[add_job])
         
         return self.wf
     
@@ -301,14 +309,140 @@ class MontageWorkflowGenerator:
             'max_parallel': max(n_project, n_difffit, n_bgexec),
         }
     
-    def write_all(self):
-        """Write workflow and all catalogs."""
+    def run_locally(self, workers=4, work_dir=None):
+        """
+        Execute the workflow in-process with a work-stealing thread pool.
+        
+        Each worker owns a deque of ready jobs. It pops from the tail of its
+        own deque (children of the job it just finished) and, when empty,
+        steals from the head of another worker's deque. Jobs run the
+        simulated executables in LOCAL_EXEC_DIR as subprocesses.
+        
+        Args:
+            workers: Number of worker threads
+            work_dir: Directory jobs run in (default: output_dir)
+        
+        Returns:
+            dict with job count, failed jobs and elapsed seconds
+        """
+        if self.wf is None:
+            self.create_workflow()
+        work_dir = work_dir or self.output_dir
+        os.makedirs(work_dir, exist_ok=True)
+        workers = max(1, int(workers))
+        
+        jobs = [job for job, _ in self._local_plan]
+        index = {id(job): i for i, job in enumerate(jobs)}
+        pending = [len(parents) for _, parents in self._local_plan]
+        children = [[] for _ in jobs]
+        for i, (_, parents) in enumerate(self._local_plan):
+            for parent in parents:
+                children[index[id(parent)]].append(i)
+        
+        deques = [deque() for _ in range(workers)]
+        locks = [threading.Lock() for _ in range(workers)]
+        cond = threading.Condition()
+        state = {'done': 0, 'failed': []}  # guarded by cond
+        
+        roots = [i for i, n in enumerate(pending) if n == 0]
+        for k, i in enumerate(roots):
+            deques[k % workers].append(i)
+        
+        def try_pop(w):
+            with locks[w]:
+                return deques[w].pop() if deques[w] else None
+        
+        def try_steal(w):
+            for offset in range(1, workers):
+                victim = (w + offset) % workers
+                with locks[victim]:
+                    if deques[victim]:
+                        return deques[victim].popleft()
+            return None
+        
+        def execute(i):
+            job = jobs[i]
+            argv = [sys.executable,
+                    os.path.join(LOCAL_EXEC_DIR, f'{job.transformation}.py')]
+            argv += [a.lfn if isinstance(a, File) else str(a) for a in job.args]
+            result = subprocess.run(argv, cwd=work_dir,
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL)
+            return result.returncode == 0
+        
+        def worker(w):
+            while True:
+                i = try_pop(w)
+                if i is None:
+                    i = try_steal(w)
+                if i is None:
+                    with cond:
+                        if state['done'] == len(jobs) or state['failed']:
+                            return
+                        cond.wait(timeout=0.05)
+                    continue
+                
+                ok = execute(i)
+                ready = []
+                with cond:
+                    state['done'] += 1
+                    if ok:
+                        for c in children[i]:
+                            pending[c] -= 1
+                            if pending[c] == 0:
+                                ready.append(c)
+                    else:
+                        state['failed'].append(f'{jobs[i].transformation}#{i}')
+                    if ready:
+                        with locks[w]:
+                            deques[w].extend(ready)
+                    cond.notify_all()
+        
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(worker, range(workers)))
+        
+        return {
+            'jobs': len(jobs),
+            'completed': state['done'],
+            'failed': state['failed'],
+            'elapsed': time.monotonic() - start,
+        }
+    
+    def _cache_key(self):
+        """Key identifying the generated workflow: the current inputs and this generator's source."""
+        h = hashlib.blake2b(f"{self.degree}|{self.n_images}|".encode())
+        with open(__file__, 'rb') as f:
+            h.update(f.read())
+        return h.hexdigest()[:16]
+    
+    def write_all(self, force=False):
+        """
+        Write workflow and all catalogs.
+        
+        The workflow YAML is skipped when montage.yml already exists and its
+        sidecar key matches the current degree/image count and generator
+        source (unless force); a reused montage.yml keeps the run_id it was
+        written with.
+        """
         os.makedirs(self.output_dir, exist_ok=True)
         
         # Workflow
         wf_path = os.path.join(self.output_dir, 'montage.yml')
-        self.wf.write(wf_path)
-        print(f"Workflow: {wf_path}")
+        key_path = wf_path + '.key'
+        key = self._cache_key()
+        cached_key = None
+        if not force and os.path.exists(wf_path) and os.path.exists(key_path):
+            with open(key_path) as f:
+                cached_key = f.read().strip()
+        
+        if cached_key == key:
+            print(f"Workflow: {wf_path} (unchanged, reused)")
+        else:
+            self.wf.write(wf_path)
+            with open(key_path, 'w') as f:
+                f.write(key + '\n')
+            print(f"Workflow: {wf_path}")
         
         # Transformation Catalog
         tc_path = os.path.join(self.output_dir, 'tc.yml')
@@ -342,6 +476,10 @@ def main():
                         help='Output directory')
     parser.add_argument('--stats', action='store_true',
                         help='Only print statistics')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate montage.yml even if inputs are unchanged')
+    parser.add_argument('--run-local', type=int, metavar='WORKERS', default=0,
+                        help='Execute the DAG locally with N work-stealing workers')
     
     args = parser.parse_args()
     
@@ -368,9 +506,18 @@ def main():
     
     if not args.stats:
         print(f"\nGenerating files...")
-        gen.write_all()
+        gen.write_all(force=args.force)
         print(f"\nDone!")
+    
+    if args.run_local > 0:
+        print(f"\nRunning locally with {args.run_local} workers...")
+        result = gen.run_locally(workers=args.run_local)
+        print(f"  Completed: {result['completed']}/{result['jobs']} jobs "
+              f"in {result['elapsed']:.1f}s")
+        if result['failed']:
+            print(f"  Failed: {', '.join(result['failed'])}")
+            return 1
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
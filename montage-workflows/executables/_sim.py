@@ -0,0 +1,39 @@
+"""
+Shared helpers for the simulated Montage executables.
+
+Environment:
+    MONTAGE_SIM_FAST     - if set, skip all simulated work (no sleeping)
+    MONTAGE_SIM_SPEEDUP  - divisor applied to simulated durations (default 1.0)
+"""
+
+import os
+import random
+import time
+
+
+def sim_sleep(lo, hi=None):
+    """
+    Simulate work for `lo` seconds, or uniform(lo, hi) seconds if hi is given.
+    
+    Returns the nominal (unscaled) duration so callers can report it.
+    """
+    duration = lo if hi is None else random.uniform(lo, hi)
+    if os.environ.get('MONTAGE_SIM_FAST'):
+        return duration
+    
+    try:
+        speedup = float(os.environ.get('MONTAGE_SIM_SPEEDUP', '1.0'))
+    except ValueError:
+        speedup = 1.0
+    if speedup > 0:
+        time.sleep(duration / speedup)
+    return duration
+
+
+def parse_flags(argv):
+    """One-pass map of `-x value` pairs in argv; a trailing flag maps to None."""
+    flags = {}
+    for i, arg in enumerate(argv):
+        if arg.startswith('-') and arg not in flags:
+            flags[arg] = argv[i + 1] if i + 1 < len(argv) else None
+    return flags
@@ -1,18 +1,23 @@
 #!/usr/bin/env python3
-"""mAdd - Co-add corrected images into final mosaic."""
+"""mAdd - Co-add corrected images into final mosaic.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
 from datetime import datetime
 
+from _sim import parse_flags, sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mAdd: Co-adding images into mosaic")
-    time.sleep(2)
+    sim_sleep(2)
+    now = datetime.now()
     
-    output_idx = sys.argv.index('-o') + 1 if '-o' in sys.argv else -1
-    if output_idx > 0:
-        with open(sys.argv[output_idx], 'w') as f:
-            f.write(f"MOSAIC FITS: {datetime.now()}\n")
+    output_file = parse_flags(sys.argv[1:]).get('-o')
+    if output_file:
+        with open(output_file, 'w') as f:
+            f.write(f"MOSAIC FITS: {now}\n")
             f.write("SIMULATED FITS HEADER\n")
     
     print(f"[{datetime.now()}] mAdd: Mosaic complete")
@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
-"""mBgExec - Apply background corrections."""
+"""mBgExec - Apply background corrections.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
-import random
 from datetime import datetime
 
+from _sim import sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mBgExec: Applying background correction")
-    time.sleep(random.uniform(0.5, 1.5))
+    sim_sleep(0.5, 1.5)
+    now = datetime.now()
     
     if len(sys.argv) >= 4:
         with open(sys.argv[3], 'w') as f:
-            f.write(f"CORRECTED: {datetime.now()}\n")
+            f.write(f"CORRECTED: {now}\n")
     
     print(f"[{datetime.now()}] mBgExec: Complete")
     return 0
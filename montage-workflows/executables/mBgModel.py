@@ -1,17 +1,22 @@
 #!/usr/bin/env python3
-"""mBgModel - Compute background correction model."""
+"""mBgModel - Compute background correction model.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
 from datetime import datetime
 
+from _sim import sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mBgModel: Computing background model")
-    time.sleep(1)
+    sim_sleep(1)
+    now = datetime.now()
     
     if len(sys.argv) >= 4:
         with open(sys.argv[3], 'w') as f:
-            f.write(f"BGMODEL: {datetime.now()}\n")
+            f.write(f"BGMODEL: {now}\n")
             for i in range(16):
                 f.write(f"img_{i:03d} 0.{i:02d}\n")
     
@@ -1,19 +1,24 @@
 #!/usr/bin/env python3
-"""mConcatFit - Concatenate fit files."""
+"""mConcatFit - Concatenate fit files.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
 from datetime import datetime
 
+from _sim import parse_flags, sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mConcatFit: Concatenating fits")
-    time.sleep(0.5)
+    sim_sleep(0.5)
+    now = datetime.now()
     
     # Find output file from args
-    output_idx = sys.argv.index('-o') + 1 if '-o' in sys.argv else -1
-    if output_idx > 0 and output_idx < len(sys.argv):
-        with open(sys.argv[output_idx], 'w') as f:
-            f.write(f"CONCAT: {datetime.now()}\n")
+    output_file = parse_flags(sys.argv[1:]).get('-o')
+    if output_file:
+        with open(output_file, 'w') as f:
+            f.write(f"CONCAT: {now}\n")
     
     print(f"[{datetime.now()}] mConcatFit: Complete")
     return 0
@@ -1,20 +1,23 @@
 #!/usr/bin/env python3
 """
 mDiffFit Simulator - Compute difference between overlapping images.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
 """
 
 import sys
-import time
-import random
 from datetime import datetime
 
+from _sim import sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mDiffFit: Computing difference")
-    time.sleep(random.uniform(0.5, 2))
+    sim_sleep(0.5, 2)
+    now = datetime.now()
     
     if len(sys.argv) >= 5:
         with open(sys.argv[3], 'w') as f:
-            f.write(f"DIFF: {datetime.now()}\n")
+            f.write(f"DIFF: {now}\n")
         with open(sys.argv[4], 'w') as f:
             f.write(f"FIT: a=0.1 b=0.2 c=0.3\n")
     
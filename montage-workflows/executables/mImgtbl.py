@@ -1,27 +1,30 @@
 #!/usr/bin/env python3
-"""mImgtbl - Generate image metadata table."""
+"""mImgtbl - Generate image metadata table.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
 from datetime import datetime
 
+from _sim import parse_flags, sim_sleep
+
 def main():
-    print(f"[{datetime.now()}] mImgtbl: Generating image table")
-    time.sleep(0.5)
+    now = datetime.now()
+    print(f"[{now}] mImgtbl: Generating image table")
+    sim_sleep(0.5)
     
     # Find -t flag for count
-    n_images = 16
-    if '-t' in sys.argv:
-        idx = sys.argv.index('-t') + 1
-        if idx < len(sys.argv):
-            n_images = int(sys.argv[idx])
+    n_images = int(parse_flags(sys.argv[1:]).get('-t') or 16)
     
     # Output file is last arg
     output_file = sys.argv[-1]
-    with open(output_file, 'w') as f:
-        f.write(f"| fname | crval1 | crval2 | naxis1 | naxis2 |\n")
-        for i in range(n_images):
-            f.write(f"| proj_{i:03d}.fits | {i*0.1:.2f} | {i*0.1:.2f} | 512 | 512 |\n")
+    rows = "".join(
+        f"| proj_{i:03d}.fits | {i*0.1:.2f} | {i*0.1:.2f} | 512 | 512 |\n"
+        for i in range(n_images)
+    )
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        f.write("| fname | crval1 | crval2 | naxis1 | naxis2 |\n" + rows)
     
     print(f"[{datetime.now()}] mImgtbl: Complete ({n_images} images)")
     return 0
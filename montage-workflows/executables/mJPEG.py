@@ -1,17 +1,22 @@
 #!/usr/bin/env python3
-"""mJPEG - Convert FITS to JPEG."""
+"""mJPEG - Convert FITS to JPEG.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
 from datetime import datetime
 
+from _sim import sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mJPEG: Converting to JPEG")
-    time.sleep(0.5)
+    sim_sleep(0.5)
+    now = datetime.now()
     
     if len(sys.argv) >= 3:
         with open(sys.argv[2], 'w') as f:
-            f.write(f"JPEG: {datetime.now()}\n")
+            f.write(f"JPEG: {now}\n")
     
     print(f"[{datetime.now()}] mJPEG: Complete")
     return 0
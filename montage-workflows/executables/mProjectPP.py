@@ -2,29 +2,31 @@
 """
 mProjectPP Simulator - Reproject input image to common frame.
 Simulates Montage mProjectPP operation.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
 """
 
 import sys
-import time
-import random
 from datetime import datetime
 
+from _sim import sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mProjectPP: Starting image reprojection")
     
     # Simulate processing time (1-3 seconds)
-    process_time = random.uniform(1, 3)
-    time.sleep(process_time)
+    process_time = sim_sleep(1, 3)
+    now = datetime.now()
     
     if len(sys.argv) >= 4:
         input_file = sys.argv[2]
         output_file = sys.argv[3]
-        print(f"[{datetime.now()}] mProjectPP: Reprojecting {input_file} -> {output_file}")
+        print(f"[{now}] mProjectPP: Reprojecting {input_file} -> {output_file}")
     
     # Create output file (simulated)
     if len(sys.argv) >= 4:
         with open(sys.argv[3], 'w') as f:
-            f.write(f"SIMULATED FITS: Reprojected at {datetime.now()}\n")
+            f.write(f"SIMULATED FITS: Reprojected at {now}\n")
     
     print(f"[{datetime.now()}] mProjectPP: Complete ({process_time:.2f}s)")
     return 0
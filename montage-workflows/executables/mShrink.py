@@ -1,17 +1,22 @@
 #!/usr/bin/env python3
-"""mShrink - Create thumbnail of mosaic."""
+"""mShrink - Create thumbnail of mosaic.
+
+Honors MONTAGE_SIM_FAST / MONTAGE_SIM_SPEEDUP (see _sim.py).
+"""
 
 import sys
-import time
 from datetime import datetime
 
+from _sim import sim_sleep
+
 def main():
     print(f"[{datetime.now()}] mShrink: Creating thumbnail")
-    time.sleep(0.5)
+    sim_sleep(0.5)
+    now = datetime.now()
     
     if len(sys.argv) >= 3:
         with open(sys.argv[2], 'w') as f:
-            f.write(f"THUMBNAIL: {datetime.now()}\n")
+            f.write(f"THUMBNAIL: {now}\n")
     
     print(f"[{datetime.now()}] mShrink: Complete")
     return 0
@@ -4,9 +4,9 @@ Platform Comparison: Pegasus vs Argo vs Native K8s vs GitHub Actions
 Generates comprehensive comparison charts and analysis.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 import os
+from pathlib import Path
 
 # Benchmark Results (from actual runs)
 BENCHMARK_DATA = {
@@ -29,6 +29,21 @@ BENCHMARK_DATA = {
     },
 }
 
+PLATFORMS = list(BENCHMARK_DATA.keys())
+SCALES = ('1x', '2x', '4x')
+
+
+def _column(field):
+    """(n_platforms, n_scales) array of one field; NaN where a scale is missing."""
+    return np.array([[BENCHMARK_DATA[p].get(s, {}).get(field, np.nan) for s in SCALES]
+                     for p in PLATFORMS], dtype=np.float64)
+
+
+# Struct-of-arrays view of BENCHMARK_DATA, built once at import
+_MEAN = _column('mean')
+_STD = _column('std')
+_JOBS = _column('jobs')
+
 COLORS = {
     'Argo Workflows': '#FF6B6B',
     'Native K8s': '#4ECDC4',
@@ -36,22 +51,46 @@ COLORS = {
     'Pegasus WMS': '#96CEB4',
 }
 
+# Single Figure reused by every chart (created on first use)
+_FIG = None
+
+# Fixed chart margins, used instead of a tight_layout() solve per chart
+_MARGINS = dict(left=0.08, right=0.97, top=0.88, bottom=0.12)
+
+
+def _get_ax(figsize=(12, 7)):
+    """Clear the shared figure, resize it and return a fresh Axes."""
+    global _FIG
+    if _FIG is None:
+        import matplotlib.pyplot as plt
+        plt.rcParams.update({'figure.autolayout': False})
+        _FIG = plt.figure(figsize=figsize)
+    else:
+        _FIG.clear()
+        _FIG.set_size_inches(*figsize)
+    return _FIG.add_subplot(111)
+
+
+def _close_fig():
+    """Release the shared figure."""
+    global _FIG
+    if _FIG is not None:
+        import matplotlib.pyplot as plt
+        plt.close(_FIG)
+        _FIG = None
+
 
 def create_duration_comparison(output_dir):
     """Create bar chart comparing mean durations."""
-    fig, ax = plt.subplots(figsize=(12, 7))
+    ax = _get_ax(figsize=(12, 7))
     
-    platforms = list(BENCHMARK_DATA.keys())
+    platforms = PLATFORMS
     x = np.arange(len(platforms))
     width = 0.35
     
-    # 1x scale
-    means_1x = [BENCHMARK_DATA[p]['1x']['mean'] for p in platforms]
-    stds_1x = [BENCHMARK_DATA[p]['1x']['std'] for p in platforms]
-    
-    # 2x scale
-    means_2x = [BENCHMARK_DATA[p]['2x']['mean'] for p in platforms]
-    stds_2x = [BENCHMARK_DATA[p]['2x']['std'] for p in platforms]
+    # 1x / 2x scale
+    means_1x, means_2x = _MEAN[:, 0], _MEAN[:, 1]
+    stds_1x, stds_2x = _STD[:, 0], _STD[:, 1]
     
     bars1 = ax.bar(x - width/2, means_1x, width, yerr=stds_1x, label='1x Scale', 
                    color=[COLORS[p] for p in platforms], alpha=0.8, capsize=5)
@@ -62,8 +101,7 @@ def create_duration_comparison(output_dir):
     ax.set_ylabel('Duration (seconds)', fontsize=12, fontweight='bold')
     ax.set_title('Workflow Execution Duration by Platform\n(Lower is Better)', 
                  fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(platforms, fontsize=11)
+    ax.set_xticks(x, platforms, fontsize=11)
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
     
@@ -72,23 +110,20 @@ def create_duration_comparison(output_dir):
         ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 5,
                 f'{bar.get_height():.0f}s', ha='center', va='bottom', fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/platform_duration_comparison.png', dpi=150)
-    plt.close()
+    _FIG.subplots_adjust(**_MARGINS)
+    _FIG.savefig(f'{output_dir}/platform_duration_comparison.png', dpi=150)
     print(f"Created: {output_dir}/platform_duration_comparison.png")
 
 
 def create_scaling_efficiency(output_dir):
     """Create scaling efficiency comparison."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    ax = _get_ax(figsize=(10, 6))
     
-    platforms = list(BENCHMARK_DATA.keys())
+    platforms = PLATFORMS
     
-    # Calculate scaling factor (2x time / 1x time)
-    scaling_factors = []
-    for p in platforms:
-        factor = BENCHMARK_DATA[p]['2x']['mean'] / BENCHMARK_DATA[p]['1x']['mean']
-        scaling_factors.append(factor)
+    # Calculate scaling factor (2x time / 1x time) and % of ideal parallelization
+    scaling_factors = _MEAN[:, 1] / _MEAN[:, 0]
+    efficiencies = 200.0 / scaling_factors
     
     colors = [COLORS[p] for p in platforms]
     bars = ax.bar(platforms, scaling_factors, color=colors, alpha=0.8)
@@ -105,28 +140,26 @@ def create_scaling_efficiency(output_dir):
     ax.grid(axis='y', alpha=0.3)
     
     # Add value labels
-    for bar, sf in zip(bars, scaling_factors):
-        efficiency = (2.0 / sf) * 100  # How much of ideal parallelization achieved
+    for bar, sf, efficiency in zip(bars, scaling_factors, efficiencies):
         ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.02,
                 f'{sf:.2f}x\n({efficiency:.0f}% eff)', ha='center', va='bottom', fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/scaling_efficiency.png', dpi=150)
-    plt.close()
+    _FIG.subplots_adjust(**_MARGINS)
+    _FIG.savefig(f'{output_dir}/scaling_efficiency.png', dpi=150)
     print(f"Created: {output_dir}/scaling_efficiency.png")
 
 
 def create_consistency_comparison(output_dir):
     """Create consistency (standard deviation) comparison."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    ax = _get_ax(figsize=(10, 6))
     
-    platforms = list(BENCHMARK_DATA.keys())
+    platforms = PLATFORMS
     x = np.arange(len(platforms))
     width = 0.35
     
     # Coefficient of variation (std/mean * 100) - lower is more consistent
-    cv_1x = [(BENCHMARK_DATA[p]['1x']['std'] / BENCHMARK_DATA[p]['1x']['mean']) * 100 for p in platforms]
-    cv_2x = [(BENCHMARK_DATA[p]['2x']['std'] / BENCHMARK_DATA[p]['2x']['mean']) * 100 for p in platforms]
+    cv = _STD[:, :2] / _MEAN[:, :2] * 100
+    cv_1x, cv_2x = cv[:, 0], cv[:, 1]
     
     bars1 = ax.bar(x - width/2, cv_1x, width, label='1x Scale', 
                    color=[COLORS[p] for p in platforms], alpha=0.8)
@@ -137,33 +170,31 @@ def create_consistency_comparison(output_dir):
     ax.set_ylabel('Coefficient of Variation (%)', fontsize=12, fontweight='bold')
     ax.set_title('Execution Consistency by Platform\n(Lower = More Consistent)', 
                  fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(platforms, fontsize=11)
+    ax.set_xticks(x, platforms, fontsize=11)
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/consistency_comparison.png', dpi=150)
-    plt.close()
+    _FIG.subplots_adjust(**_MARGINS)
+    _FIG.savefig(f'{output_dir}/consistency_comparison.png', dpi=150)
     print(f"Created: {output_dir}/consistency_comparison.png")
 
 
 def create_pegasus_4x_analysis(output_dir):
     """Special chart for Pegasus 4x scaling."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    ax = _get_ax(figsize=(10, 6))
     
-    scales = ['1x', '2x', '4x']
-    jobs = [7, 14, 28]
-    means = [143.45, 165.95, 174.30]
-    stds = [16.68, 13.68, 15.95]
+    row = PLATFORMS.index('Pegasus WMS')
+    scales = SCALES
+    jobs = _JOBS[row].astype(int)
+    means = _MEAN[row]
+    stds = _STD[row]
     
     # Actual performance
     ax.plot(jobs, means, 'o-', markersize=12, linewidth=3, color='#96CEB4', label='Pegasus Actual')
-    ax.fill_between(jobs, [m-s for m,s in zip(means,stds)], [m+s for m,s in zip(means,stds)], 
-                    alpha=0.2, color='#96CEB4')
+    ax.fill_between(jobs, means - stds, means + stds, alpha=0.2, color='#96CEB4')
     
     # Ideal linear (if no parallelization)
-    ideal_linear = [means[0] * (j/jobs[0]) for j in jobs]
+    ideal_linear = means[0] * jobs / jobs[0]
     ax.plot(jobs, ideal_linear, '--', color='red', linewidth=2, label='Linear Scaling (No Parallelism)')
     
     # Perfect scaling (constant time)
@@ -174,23 +205,20 @@ def create_pegasus_4x_analysis(output_dir):
     ax.set_title('Pegasus Scaling Performance: 1x → 2x → 4x', fontsize=14, fontweight='bold')
     ax.legend()
     ax.grid(alpha=0.3)
-    ax.set_xticks(jobs)
-    ax.set_xticklabels([f'{s}\n({j} jobs)' for s, j in zip(scales, jobs)])
+    ax.set_xticks(jobs, [f'{s}\n({j} jobs)' for s, j in zip(scales, jobs)])
     
     # Annotations
     for i, (j, m) in enumerate(zip(jobs, means)):
         ax.annotate(f'{m:.1f}s', (j, m), textcoords="offset points", 
                    xytext=(0, 15), ha='center', fontweight='bold', fontsize=11)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/pegasus_4x_scaling.png', dpi=150)
-    plt.close()
+    _FIG.subplots_adjust(**_MARGINS)
+    _FIG.savefig(f'{output_dir}/pegasus_4x_scaling.png', dpi=150)
     print(f"Created: {output_dir}/pegasus_4x_scaling.png")
 
 
-def create_summary_table(output_dir):
-    """Create summary text file."""
-    summary = """
+# Static summary report written by create_summary_table()
+_SUMMARY_TEXT = """
 ================================================================================
 PLATFORM COMPARISON SUMMARY
 ================================================================================
@@ -258,11 +286,15 @@ AVOID for TIME-CRITICAL: GitHub Actions
 - External dependency
 ================================================================================
 """
-    
-    with open(f'{output_dir}/comparison_summary.txt', 'w') as f:
-        f.write(summary)
-    print(f"Created: {output_dir}/comparison_summary.txt")
-    print(summary)
+
+
+def create_summary_table(output_dir):
+    """Create summary text file (echoed to stdout unless QUIET is set)."""
+    path = Path(output_dir) / 'comparison_summary.txt'
+    path.write_text(_SUMMARY_TEXT)
+    print(f"Created: {path}")
+    if not os.environ.get('QUIET'):
+        print(_SUMMARY_TEXT)
 
 
 def main():
@@ -275,9 +307,12 @@ def main():
     create_consistency_comparison(output_dir)
     create_pegasus_4x_analysis(output_dir)
     create_summary_table(output_dir)
+    _close_fig()
     
     print(f"\nAll charts saved to: {output_dir}/")
 
 
 if __name__ == '__main__':
+    import matplotlib
+    matplotlib.use('Agg')
     main()
@@ -17,9 +17,16 @@ import os
 import sys
 import json
 import csv
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from statistics import mean, median, stdev
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # All platform directories
 PLATFORM_DIRS = {
@@ -61,128 +68,162 @@ JOB_COUNTS = {
 
 
 def parse_metrics(filepath):
-    """Parse a metrics.txt file."""
-    metrics = {}
+    """Parse a metrics.txt file of KEY=VALUE lines (# starts a comment)."""
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    metrics[key.strip()] = value.strip()
-    except:
-        pass
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return {}
+    metrics = {}
+    for line in data.splitlines():
+        line = line.strip()
+        if not line or line[:1] == b'#' or b'=' not in line:
+            continue
+        key, _, value = line.partition(b'=')
+        metrics[key.strip().decode('utf-8', 'replace')] = value.strip().decode('utf-8', 'replace')
     return metrics
 
 
+def _list_subdirs(path):
+    """List non-hidden subdirectories of path with a single scandir pass."""
+    with os.scandir(path) as it:
+        return [e.path for e in it if not e.name.startswith('.') and e.is_dir()]
+
+
+def _int_mean(values):
+    """Mean of ints as statistics.mean returns it: an int when it divides evenly."""
+    total = sum(values)
+    q, r = divmod(total, len(values))
+    return q if r == 0 else total / len(values)
+
+
 def collect_platform_data(name, dir_path):
     """Collect all benchmark data for a platform."""
     if not os.path.exists(dir_path):
         return None
     
-    run_dirs = glob.glob(os.path.join(dir_path, '*'))
-    run_dirs = [d for d in run_dirs if os.path.isdir(d)]
+    run_dirs = _list_subdirs(dir_path)
     
     durations = []
     job_counts = []
+    job_config = JOB_COUNTS.get(name, {'total_jobs': 8, 'parallel_stages': 5, 'max_parallel': 3})
+    default_jobs = JOB_COUNTS.get(name, {}).get('total_jobs', 1)
     
     for run_dir in run_dirs:
-        metrics_file = os.path.join(run_dir, 'metrics.txt')
-        if os.path.exists(metrics_file):
-            metrics = parse_metrics(metrics_file)
-            status = metrics.get('STATUS', '').upper()
-            
-            if status in ['SUCCESS', 'SUCCEEDED']:
-                try:
-                    duration = int(metrics.get('DURATION_SECONDS', 0))
-                    jobs = int(metrics.get('TOTAL_JOBS', JOB_COUNTS.get(name, {}).get('total_jobs', 1)))
-                    
-                    if duration > 0:
-                        durations.append(duration)
-                        job_counts.append(jobs)
-                except:
-                    pass
+        # Open directly: a missing metrics.txt parses as {} and is skipped
+        metrics = parse_metrics(run_dir + '/metrics.txt')
+        status = metrics.get('STATUS', '').upper()
+        
+        if status in ['SUCCESS', 'SUCCEEDED']:
+            try:
+                duration = int(metrics.get('DURATION_SECONDS', 0))
+                jobs = int(metrics.get('TOTAL_JOBS', default_jobs))
+                
+                if duration > 0:
+                    durations.append(duration)
+                    job_counts.append(jobs)
+            except:
+                pass
     
     if not durations:
         return None
     
-    job_config = JOB_COUNTS.get(name, {'total_jobs': 8, 'parallel_stages': 5, 'max_parallel': 3})
-    avg_jobs = mean(job_counts) if job_counts else job_config['total_jobs']
+    avg_jobs = _int_mean(job_counts) if job_counts else job_config['total_jobs']
+    
+    d = np.sort(np.asarray(durations, dtype=np.int64))
+    n = d.size
+    m = _int_mean(durations)
     
     return {
         'name': name,
         'runs': len(durations),
         'durations': durations,
-        'mean': mean(durations),
-        'median': median(durations),
-        'stdev': stdev(durations) if len(durations) > 1 else 0,
-        'min': min(durations),
-        'max': max(durations),
+        'mean': m,
+        # Odd counts keep the integer middle value, as statistics.median did
+        'median': d[n // 2].item() if n % 2 else float(np.median(d)),
+        'stdev': float(d.std(ddof=1)) if n > 1 else 0,
+        'min': int(d.min()),
+        'max': int(d.max()),
         'total_jobs': avg_jobs,
         'parallel_stages': job_config['parallel_stages'],
         'max_parallel': job_config['max_parallel'],
         # Normalized metrics
-        'time_per_job': mean(durations) / avg_jobs,
-        'time_per_stage': mean(durations) / job_config['parallel_stages'],
+        'time_per_job': m / avg_jobs,
+        'time_per_stage': m / job_config['parallel_stages'],
     }
 
 
-def calculate_parallel_efficiency(data):
+def calculate_parallel_efficiency(all_data):
     """
-    Calculate parallel efficiency.
+    Calculate parallel efficiency for every platform with data.
     Efficiency = (Sequential Time Estimate) / (Actual Time * Max Parallel)
     
     Higher is better (100% = perfect parallelization).
+    Returns {platform: efficiency %}, computed in one vectorized pass.
     """
+    names = [name for name, data in all_data.items() if data]
+    if not names:
+        return {}
+    
+    jobs = np.array([all_data[n]['total_jobs'] for n in names], dtype=np.float64)
+    max_par = np.array([all_data[n]['max_parallel'] for n in names], dtype=np.float64)
+    means = np.array([all_data[n]['mean'] for n in names], dtype=np.float64)
+    
     # Estimate sequential time: sum of all job durations if run sequentially
     # Assume each job takes ~30s on average
     avg_job_time = 30
-    sequential_estimate = data['total_jobs'] * avg_job_time
+    sequential_estimate = jobs * avg_job_time
     
     # Perfect parallel = sequential / max_parallel
-    perfect_parallel = sequential_estimate / data['max_parallel']
+    perfect_parallel = sequential_estimate / max_par
     
     # Actual vs perfect
-    efficiency = (perfect_parallel / data['mean']) * 100 if data['mean'] > 0 else 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efficiency = np.where(means > 0, perfect_parallel / means * 100, 0.0)
     
-    return min(efficiency, 100)  # Cap at 100%
+    efficiency = np.minimum(efficiency, 100.0)  # Cap at 100%
+    return dict(zip(names, efficiency.tolist()))
 
 
-def compare_all_platforms(all_data):
+def compare_all_platforms(all_data, efficiency_data=None):
     """Generate comparison across all platforms."""
+    if efficiency_data is None:
+        efficiency_data = calculate_parallel_efficiency(all_data)
+    
+    # Build the whole report, then write it to stdout once
+    buf = []
+    ap = buf.append
     
-    print("=" * 100)
-    print("COMPREHENSIVE PLATFORM COMPARISON")
-    print("=" * 100)
+    ap("=" * 100)
+    ap("COMPREHENSIVE PLATFORM COMPARISON")
+    ap("=" * 100)
     
     # Table 1: Absolute Performance
-    print("\n📊 TABLE 1: ABSOLUTE PERFORMANCE (Wall-Clock Time)")
-    print("-" * 100)
-    print(f"{'Platform':<25} {'Runs':<6} {'Mean (s)':<10} {'Median (s)':<10} {'StdDev':<10} {'Jobs':<6}")
-    print("-" * 100)
+    ap("\n📊 TABLE 1: ABSOLUTE PERFORMANCE (Wall-Clock Time)")
+    ap("-" * 100)
+    ap(f"{'Platform':<25} {'Runs':<6} {'Mean (s)':<10} {'Median (s)':<10} {'StdDev':<10} {'Jobs':<6}")
+    ap("-" * 100)
     
     for name in sorted(all_data.keys()):
         data = all_data[name]
         if data:
-            print(f"{name:<25} {data['runs']:<6} {data['mean']:<10.1f} {data['median']:<10.1f} {data['stdev']:<10.1f} {data['total_jobs']:<6.0f}")
+            ap(f"{name:<25} {data['runs']:<6} {data['mean']:<10.1f} {data['median']:<10.1f} {data['stdev']:<10.1f} {data['total_jobs']:<6.0f}")
     
     # Table 2: Normalized Performance (Time Per Job)
-    print("\n📊 TABLE 2: NORMALIZED PERFORMANCE (Time Per Job)")
-    print("-" * 100)
-    print(f"{'Platform':<25} {'Time/Job (s)':<12} {'Time/Stage (s)':<14} {'Efficiency':<12}")
-    print("-" * 100)
+    ap("\n📊 TABLE 2: NORMALIZED PERFORMANCE (Time Per Job)")
+    ap("-" * 100)
+    ap(f"{'Platform':<25} {'Time/Job (s)':<12} {'Time/Stage (s)':<14} {'Efficiency':<12}")
+    ap("-" * 100)
     
-    efficiency_data = {}
     for name in sorted(all_data.keys()):
         data = all_data[name]
         if data:
-            efficiency = calculate_parallel_efficiency(data)
-            efficiency_data[name] = efficiency
-            print(f"{name:<25} {data['time_per_job']:<12.1f} {data['time_per_stage']:<14.1f} {efficiency:<10.1f}%")
+            efficiency = efficiency_data[name]
+            ap(f"{name:<25} {data['time_per_job']:<12.1f} {data['time_per_stage']:<14.1f} {efficiency:<10.1f}%")
     
     # Table 3: Scaling Analysis
-    print("\n📊 TABLE 3: SCALING ANALYSIS (1x → 2x → 4x)")
-    print("-" * 100)
+    ap("\n📊 TABLE 3: SCALING ANALYSIS (1x → 2x → 4x)")
+    ap("-" * 100)
     
     platforms = ['Argo', 'NativeK8s', 'GitHubActions', 'Pegasus']
     
@@ -192,24 +233,24 @@ def compare_all_platforms(all_data):
         data_4x = all_data.get(f'{platform}_4x')
         
         if data_1x:
-            print(f"\n{platform}:")
-            print(f"  1x: {data_1x['mean']:.1f}s ({data_1x['total_jobs']:.0f} jobs)")
+            ap(f"\n{platform}:")
+            ap(f"  1x: {data_1x['mean']:.1f}s ({data_1x['total_jobs']:.0f} jobs)")
             
             if data_2x:
                 scaling = data_2x['mean'] / data_1x['mean']
                 job_ratio = data_2x['total_jobs'] / data_1x['total_jobs']
                 efficiency = job_ratio / scaling * 100 if scaling > 0 else 0
-                print(f"  2x: {data_2x['mean']:.1f}s ({data_2x['total_jobs']:.0f} jobs) - Scaling: {scaling:.2f}x - Efficiency: {efficiency:.0f}%")
+                ap(f"  2x: {data_2x['mean']:.1f}s ({data_2x['total_jobs']:.0f} jobs) - Scaling: {scaling:.2f}x - Efficiency: {efficiency:.0f}%")
             
             if data_4x:
                 scaling = data_4x['mean'] / data_1x['mean']
                 job_ratio = data_4x['total_jobs'] / data_1x['total_jobs']
                 efficiency = job_ratio / scaling * 100 if scaling > 0 else 0
-                print(f"  4x: {data_4x['mean']:.1f}s ({data_4x['total_jobs']:.0f} jobs) - Scaling: {scaling:.2f}x - Efficiency: {efficiency:.0f}%")
+                ap(f"  4x: {data_4x['mean']:.1f}s ({data_4x['total_jobs']:.0f} jobs) - Scaling: {scaling:.2f}x - Efficiency: {efficiency:.0f}%")
     
     # Table 4: Pegasus Clustering Impact
-    print("\n📊 TABLE 4: PEGASUS JOB CLUSTERING IMPACT")
-    print("-" * 100)
+    ap("\n📊 TABLE 4: PEGASUS JOB CLUSTERING IMPACT")
+    ap("-" * 100)
     
     for scale in ['1x', '2x']:
         base = all_data.get(f'Pegasus_{scale}')
@@ -217,16 +258,19 @@ def compare_all_platforms(all_data):
         
         if base and clustered:
             improvement = (base['mean'] - clustered['mean']) / base['mean'] * 100
-            print(f"Pegasus {scale}:")
-            print(f"  Without Clustering: {base['mean']:.1f}s")
-            print(f"  With Clustering:    {clustered['mean']:.1f}s")
-            print(f"  Improvement:        {improvement:.1f}%")
+            ap(f"Pegasus {scale}:")
+            ap(f"  Without Clustering: {base['mean']:.1f}s")
+            ap(f"  With Clustering:    {clustered['mean']:.1f}s")
+            ap(f"  Improvement:        {improvement:.1f}%")
     
+    sys.stdout.write("\n".join(buf) + "\n")
     return efficiency_data
 
 
-def generate_comparison_report(all_data, output_dir):
+def generate_comparison_report(all_data, output_dir, efficiency_data=None):
     """Generate detailed comparison report."""
+    if efficiency_data is None:
+        efficiency_data = calculate_parallel_efficiency(all_data)
     
     report = {
         'generated': datetime.now().isoformat(),
@@ -236,7 +280,7 @@ def generate_comparison_report(all_data, output_dir):
     
     for name, data in all_data.items():
         if data:
-            efficiency = calculate_parallel_efficiency(data)
+            efficiency = efficiency_data[name]
             report['platforms'][name] = {
                 'runs': data['runs'],
                 'mean': data['mean'],
@@ -249,8 +293,12 @@ def generate_comparison_report(all_data, output_dir):
     
     # Save JSON
     json_path = os.path.join(output_dir, 'pegasus_comparison.json')
-    with open(json_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(report, f, indent=2)
     print(f"\n📄 Report saved: {json_path}")
     
     # Save CSV
@@ -258,15 +306,11 @@ def generate_comparison_report(all_data, output_dir):
     with open(csv_path, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['Platform', 'Runs', 'Mean_s', 'Median_s', 'StdDev', 'Total_Jobs', 'Time_Per_Job', 'Efficiency_%'])
-        
-        for name, data in sorted(all_data.items()):
-            if data:
-                efficiency = calculate_parallel_efficiency(data)
-                writer.writerow([
-                    name, data['runs'], round(data['mean'], 1), round(data['median'], 1),
-                    round(data['stdev'], 1), data['total_jobs'], round(data['time_per_job'], 1),
-                    round(efficiency, 1)
-                ])
+        writer.writerows([
+            name, data['runs'], round(data['mean'], 1), round(data['median'], 1),
+            round(data['stdev'], 1), data['total_jobs'], round(data['time_per_job'], 1),
+            round(efficiency_data[name], 1)
+        ] for name, data in sorted(all_data.items()) if data)
     
     print(f"📄 CSV saved: {csv_path}")
 
@@ -283,8 +327,12 @@ def main():
     print("\nCollecting data from all platforms...")
     all_data = {}
     
-    for name, dir_path in PLATFORM_DIRS.items():
-        data = collect_platform_data(name, dir_path)
+    # Directory scans are I/O-bound: collect platforms concurrently, in order
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(lambda kv: (kv[0], collect_platform_data(*kv)),
+                              PLATFORM_DIRS.items()))
+    
+    for name, data in results:
         if data:
             all_data[name] = data
             print(f"  ✓ {name}: {data['runs']} runs, mean {data['mean']:.1f}s")
@@ -293,10 +341,10 @@ def main():
             print(f"  ✗ {name}: No data")
     
     # Generate comparison
-    compare_all_platforms(all_data)
+    efficiency_data = compare_all_platforms(all_data)
     
     # Save reports
-    generate_comparison_report(all_data, output_dir)
+    generate_comparison_report(all_data, output_dir, efficiency_data)
     
     print("\n" + "=" * 60)
     print("COMPARISON COMPLETE!")
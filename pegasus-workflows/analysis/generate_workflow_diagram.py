@@ -4,140 +4,105 @@ Generate Pegasus Workflow Visualization
 Creates HTML/SVG diagram of the Montage-pattern rack resiliency workflow.
 """
 
+import functools
 import os
 
+# (subgraph id, header, node prefix, node label) for the five Montage stages
+_STAGE_HEADERS = (
+    ('Stage1', 'Stage 1: Health Checks (mProjectPP)', 'HC', 'Health Check'),
+    ('Stage2', 'Stage 2: Node Failure Sim (mDiff)', 'NS', 'Node Sim'),
+    ('Stage3', 'Stage 3: Interim Health Check (mFitPlane)', 'IC', 'Interim Check'),
+    ('Stage4', 'Stage 4: Rack Failure Sim (mBackground)', 'RS', 'Rack Sim'),
+    ('Stage5', 'Stage 5: Final Health Check (mImgtbl)', 'FC', 'Final Check'),
+)
+
+
+def _stage_block(stage_id, header, prefix, label, count):
+    """Mermaid subgraph holding count nodes named prefix1..prefixN."""
+    nodes = "\n".join(f"        {prefix}{i}[{label} {i}]" for i in range(1, count + 1))
+    return f'    subgraph {stage_id}["{header}"]\n{nodes}\n    end\n'
+
+
+@functools.lru_cache(maxsize=8)
 def generate_mermaid_diagram(scale='1x'):
     """Generate Mermaid diagram for the workflow."""
-    configs = {
-        '1x': {'hc': 3, 'ns': 1, 'ic': 1, 'rs': 1, 'fc': 1},
-        '2x': {'hc': 6, 'ns': 2, 'ic': 2, 'rs': 2, 'fc': 2},
-        '4x': {'hc': 12, 'ns': 4, 'ic': 4, 'rs': 4, 'fc': 4},
-    }
-    cfg = configs.get(scale, configs['1x'])
-    
-    mermaid = f"""flowchart TD
-    subgraph Stage1["Stage 1: Health Checks (mProjectPP)"]
-"""
-    # Health checks
-    for i in range(1, cfg['hc'] + 1):
-        mermaid += f"        HC{i}[Health Check {i}]\n"
-    
-    mermaid += """    end
-    
-    subgraph Stage2["Stage 2: Node Failure Sim (mDiff)"]
-"""
-    # Node sims
-    for i in range(1, cfg['ns'] + 1):
-        mermaid += f"        NS{i}[Node Sim {i}]\n"
-    
-    mermaid += """    end
-    
-    subgraph Stage3["Stage 3: Interim Health Check (mFitPlane)"]
-"""
-    # Interim checks
-    for i in range(1, cfg['ic'] + 1):
-        mermaid += f"        IC{i}[Interim Check {i}]\n"
-    
-    mermaid += """    end
-    
-    subgraph Stage4["Stage 4: Rack Failure Sim (mBackground)"]
-"""
-    # Rack sims
-    for i in range(1, cfg['rs'] + 1):
-        mermaid += f"        RS{i}[Rack Sim {i}]\n"
-    
-    mermaid += """    end
-    
-    subgraph Stage5["Stage 5: Final Health Check (mImgtbl)"]
-"""
-    # Final checks
-    for i in range(1, cfg['fc'] + 1):
-        mermaid += f"        FC{i}[Final Check {i}]\n"
-    
-    mermaid += "    end\n\n"
-    
-    # Dependencies: HC -> NS
-    for hc in range(1, cfg['hc'] + 1):
-        for ns in range(1, cfg['ns'] + 1):
-            mermaid += f"    HC{hc} --> NS{ns}\n"
-    
-    # NS -> IC
-    for ns in range(1, cfg['ns'] + 1):
-        for ic in range(1, cfg['ic'] + 1):
-            mermaid += f"    NS{ns} --> IC{ic}\n"
-    
-    # IC -> RS
-    for ic in range(1, cfg['ic'] + 1):
-        for rs in range(1, cfg['rs'] + 1):
-            mermaid += f"    IC{ic} --> RS{rs}\n"
-    
-    # RS -> FC
-    for rs in range(1, cfg['rs'] + 1):
-        for fc in range(1, cfg['fc'] + 1):
-            mermaid += f"    RS{rs} --> FC{fc}\n"
-    
-    return mermaid
+    # Montage pattern at scale k: 3k health checks, k of every other stage
+    try:
+        k = max(int(scale.rstrip('x')), 1)
+    except ValueError:
+        k = 1
+    cfg = {'hc': 3 * k, 'ns': k, 'ic': k, 'rs': k, 'fc': k}
+    
+    blocks = [_stage_block(stage_id, header, prefix, label, cfg[prefix.lower()])
+              for stage_id, header, prefix, label in _STAGE_HEADERS]
+    parts = ["flowchart TD\n", "    \n".join(blocks), "\n"]
+    
+    # Dependencies, one line per stage transition: "A1 & A2 --> B1 & B2"
+    # expands to every A -> B pair (Mermaid 8.7+)
+    for src, dst in (('HC', 'NS'), ('NS', 'IC'), ('IC', 'RS'), ('RS', 'FC')):
+        parts.append("    " + " & ".join(f"{src}{i}" for i in range(1, cfg[src.lower()] + 1)) + " --> "
+                     + " & ".join(f"{dst}{j}" for j in range(1, cfg[dst.lower()] + 1)) + "\n")
+    
+    return "".join(parts)
 
 
-def generate_html_visualization(output_dir='/app/output'):
-    """Generate complete HTML visualization with all scales."""
-    
-    html = """<!DOCTYPE html>
+# Page template; {diagram_1x}/{diagram_2x} are filled in by generate_html_visualization
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <title>Pegasus Rack Resiliency Workflow - Montage Pattern</title>
     <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
     <style>
-        body { 
+        body {{ 
             font-family: 'Segoe UI', Arial, sans-serif; 
             margin: 20px; 
             background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
             color: #fff;
             min-height: 100vh;
-        }
-        h1 { 
+        }}
+        h1 {{ 
             text-align: center; 
             color: #00d4ff;
             text-shadow: 0 0 10px rgba(0,212,255,0.5);
-        }
-        h2 { color: #ff6b6b; margin-top: 30px; }
-        .container { max-width: 1200px; margin: 0 auto; }
-        .diagram { 
+        }}
+        h2 {{ color: #ff6b6b; margin-top: 30px; }}
+        .container {{ max-width: 1200px; margin: 0 auto; }}
+        .diagram {{ 
             background: rgba(255,255,255,0.05); 
             padding: 20px; 
             border-radius: 15px; 
             margin: 20px 0;
             border: 1px solid rgba(255,255,255,0.1);
-        }
-        .mermaid { text-align: center; }
-        .stats { 
+        }}
+        .mermaid {{ text-align: center; }}
+        .stats {{ 
             display: grid; 
             grid-template-columns: repeat(3, 1fr); 
             gap: 20px; 
             margin: 30px 0;
-        }
-        .stat-card {
+        }}
+        .stat-card {{
             background: linear-gradient(135deg, rgba(0,212,255,0.2), rgba(255,107,107,0.2));
             padding: 20px;
             border-radius: 10px;
             text-align: center;
             border: 1px solid rgba(255,255,255,0.2);
-        }
-        .stat-value { font-size: 2em; font-weight: bold; color: #00d4ff; }
-        .stat-label { color: #aaa; }
-        table { 
+        }}
+        .stat-value {{ font-size: 2em; font-weight: bold; color: #00d4ff; }}
+        .stat-label {{ color: #aaa; }}
+        table {{ 
             width: 100%; 
             border-collapse: collapse; 
             margin: 20px 0;
             background: rgba(255,255,255,0.05);
             border-radius: 10px;
             overflow: hidden;
-        }
-        th, td { padding: 12px; text-align: left; border-bottom: 1px solid rgba(255,255,255,0.1); }
-        th { background: rgba(0,212,255,0.2); color: #00d4ff; }
-        tr:hover { background: rgba(255,255,255,0.05); }
-        .legend { margin: 20px 0; padding: 15px; background: rgba(255,255,255,0.05); border-radius: 10px; }
-        .legend span { margin-right: 20px; }
+        }}
+        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid rgba(255,255,255,0.1); }}
+        th {{ background: rgba(0,212,255,0.2); color: #00d4ff; }}
+        tr:hover {{ background: rgba(255,255,255,0.05); }}
+        .legend {{ margin: 20px 0; padding: 15px; background: rgba(255,255,255,0.05); border-radius: 10px; }}
+        .legend span {{ margin-right: 20px; }}
     </style>
 </head>
 <body>
@@ -172,14 +137,14 @@ def generate_html_visualization(output_dir='/app/output'):
         <h2>1x Scale Workflow (7 Jobs)</h2>
         <div class="diagram">
             <div class="mermaid">
-""" + generate_mermaid_diagram('1x') + """
+{diagram_1x}
             </div>
         </div>
         
         <h2>2x Scale Workflow (14 Jobs)</h2>
         <div class="diagram">
             <div class="mermaid">
-""" + generate_mermaid_diagram('2x') + """
+{diagram_2x}
             </div>
         </div>
         
@@ -232,19 +197,42 @@ def generate_html_visualization(output_dir='/app/output'):
     </div>
     
     <script>
-        mermaid.initialize({ 
-            startOnLoad: true,
+        mermaid.initialize({{ 
+            startOnLoad: false,
             theme: 'dark',
-            flowchart: { curve: 'basis' }
-        });
+            flowchart: {{ curve: 'basis' }}
+        }});
+        
+        // Render each diagram only when it scrolls near the viewport
+        const observer = new IntersectionObserver((entries) => {{
+            entries.forEach((entry) => {{
+                if (entry.isIntersecting) {{
+                    observer.unobserve(entry.target);
+                    mermaid.run({{ nodes: [entry.target] }});
+                }}
+            }});
+        }}, {{ rootMargin: '200px' }});
+        document.querySelectorAll('.mermaid').forEach((el) => observer.observe(el));
     </script>
 </body>
 </html>
 """
+
+
+def generate_html_visualization(output_dir='/app/output'):
+    """Generate complete HTML visualization with all scales."""
+    
+    diagrams = {scale: generate_mermaid_diagram(scale) for scale in ('1x', '2x')}
+    html = _HTML_TEMPLATE.format(diagram_1x=diagrams['1x'], diagram_2x=diagrams['2x'])
+    
+    # Standalone Mermaid sources for tools that render .mmd files directly
+    for scale, diagram in diagrams.items():
+        with open(os.path.join(output_dir, f'pegasus_workflow_{scale}.mmd'), 'w') as f:
+            f.write(diagram)
     
     output_path = os.path.join(output_dir, 'pegasus_workflow_visualization.html')
-    with open(output_path, 'w') as f:
-        f.write(html)
+    with open(output_path, 'wb', buffering=1 << 16) as f:
+        f.write(html.encode('utf-8'))
     print(f"Visualization saved to: {output_path}")
     return output_path
 
@@ -4,48 +4,49 @@ Pegasus Benchmark Visualization
 Generates charts comparing 1x, 2x, 4x workflow performance.
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
+# pandas, numpy and matplotlib are imported where they are used, so that
+# importing this module stays cheap
 import os
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # Configuration
 RESULTS_FILE = "/app/output/benchmarks/pegasus_benchmark_results.csv"
 OUTPUT_DIR = "/app/output/benchmarks/charts"
+CHART_DPI = int(os.environ.get('CHART_DPI', '100'))
 
 def load_results():
     """Load benchmark results."""
+    import pandas as pd
     if not os.path.exists(RESULTS_FILE):
         print(f"Results file not found: {RESULTS_FILE}")
         return None
     
-    df = pd.read_csv(RESULTS_FILE)
-    df = df[df['status'] == 'Success']  # Only successful runs
+    df = pd.read_csv(RESULTS_FILE,
+                     usecols=['scale', 'status', 'duration_seconds', 'run_number'],
+                     dtype={'scale': pd.CategoricalDtype(['1x', '2x', '4x'], ordered=True),
+                            'status': 'category',
+                            'duration_seconds': 'float32',
+                            'run_number': 'int32'})
+    df = df[df['status'] == 'Success'].drop(columns='status')  # Only successful runs
     return df
 
-def create_duration_comparison(df):
+def create_duration_comparison(ax, stats):
     """Create bar chart comparing average duration by scale."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    import numpy as np
+    fig = ax.figure
     
     scales = ['1x', '2x', '4x']
     colors = ['#4CAF50', '#2196F3', '#FF9800']
     
-    means = []
-    stds = []
-    for scale in scales:
-        data = df[df['scale'] == scale]['duration_seconds']
-        means.append(data.mean())
-        stds.append(data.std())
+    means = stats['mean'].tolist()
+    stds = stats['std'].tolist()
     
     x = np.arange(len(scales))
-    bars = ax.bar(x, means, yerr=stds, color=colors, capsize=5, alpha=0.8)
+    bars = ax.bar(x, means, yerr=stds, color=colors, capsize=5, alpha=0.8, tick_label=scales)
     
     ax.set_xlabel('Workflow Scale', fontsize=12)
     ax.set_ylabel('Duration (seconds)', fontsize=12)
     ax.set_title('Pegasus Workflow Duration by Scale', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(scales)
     
     # Add value labels
     for bar, mean in zip(bars, means):
@@ -53,19 +54,32 @@ def create_duration_comparison(df):
                 f'{mean:.1f}s', ha='center', va='bottom', fontweight='bold')
     
     ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}/duration_comparison.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{OUTPUT_DIR}/duration_comparison.png', dpi=CHART_DPI)
     print(f"Created: {OUTPUT_DIR}/duration_comparison.png")
 
-def create_duration_boxplot(df):
+def _box_stats(a, label):
+    """Five-number summary for ax.bxp, using boxplot's 1.5*IQR whisker rule."""
+    import numpy as np
+    if a.size == 0:
+        return {'med': np.nan, 'q1': np.nan, 'q3': np.nan, 'whislo': np.nan,
+                'whishi': np.nan, 'fliers': a, 'label': label}
+    q1, med, q3 = np.percentile(a, [25, 50, 75])
+    reach = 1.5 * (q3 - q1)
+    inside = a[(a >= q1 - reach) & (a <= q3 + reach)]
+    return {'med': med, 'q1': q1, 'q3': q3,
+            'whislo': inside.min(), 'whishi': inside.max(),
+            'fliers': a[(a < inside.min()) | (a > inside.max())], 'label': label}
+
+def create_duration_boxplot(ax, groups):
     """Create box plot of duration distribution."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    import numpy as np
+    fig = ax.figure
     
     scales = ['1x', '2x', '4x']
-    data = [df[df['scale'] == s]['duration_seconds'].values for s in scales]
+    bxpstats = [_box_stats(groups.get(s, np.empty(0)), s) for s in scales]
     
-    bp = ax.boxplot(data, labels=scales, patch_artist=True)
+    bp = ax.bxp(bxpstats, patch_artist=True)
     
     colors = ['#4CAF50', '#2196F3', '#FF9800']
     for patch, color in zip(bp['boxes'], colors):
@@ -77,24 +91,23 @@ def create_duration_boxplot(df):
     ax.set_title('Pegasus Duration Distribution by Scale', fontsize=14, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}/duration_boxplot.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{OUTPUT_DIR}/duration_boxplot.png', dpi=CHART_DPI)
     print(f"Created: {OUTPUT_DIR}/duration_boxplot.png")
 
-def create_scaling_analysis(df):
+def create_scaling_analysis(ax, stats):
     """Analyze how duration scales with job count."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    import numpy as np
+    fig = ax.figure
     
-    scales = ['1x', '2x', '4x']
-    job_counts = [7, 14, 28]  # Based on workflow structure
+    job_counts = np.array([7, 14, 28])  # Based on workflow structure
     
-    means = [df[df['scale'] == s]['duration_seconds'].mean() for s in scales]
+    means = stats['mean'].to_numpy()
     
     ax.plot(job_counts, means, 'o-', markersize=10, linewidth=2, color='#2196F3')
     
     # Add ideal linear scaling line
-    ideal = [means[0] * (jc / job_counts[0]) for jc in job_counts]
+    ideal = means[0] * job_counts / job_counts[0]
     ax.plot(job_counts, ideal, '--', color='gray', label='Linear scaling', alpha=0.7)
     
     ax.set_xlabel('Number of Jobs', fontsize=12)
@@ -107,20 +120,20 @@ def create_scaling_analysis(df):
         ax.annotate(f'{m:.1f}s', (jc, m), textcoords="offset points", 
                    xytext=(0,10), ha='center', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}/scaling_analysis.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{OUTPUT_DIR}/scaling_analysis.png', dpi=CHART_DPI)
     print(f"Created: {OUTPUT_DIR}/scaling_analysis.png")
 
-def create_run_timeline(df):
+def create_run_timeline(ax, runs):
     """Show duration over time for all runs."""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    import numpy as np
+    fig = ax.figure
     
     colors = {'1x': '#4CAF50', '2x': '#2196F3', '4x': '#FF9800'}
     
     for scale in ['1x', '2x', '4x']:
-        data = df[df['scale'] == scale].sort_values('run_number')
-        ax.plot(data['run_number'], data['duration_seconds'], 
+        arr = runs.get(scale, np.empty((0, 2)))
+        ax.plot(arr[:, 0], arr[:, 1], 
                 'o-', label=scale, color=colors[scale], markersize=6, alpha=0.8)
     
     ax.set_xlabel('Run Number', fontsize=12)
@@ -129,25 +142,51 @@ def create_run_timeline(df):
     ax.legend()
     ax.grid(alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}/run_timeline.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{OUTPUT_DIR}/run_timeline.png', dpi=CHART_DPI)
     print(f"Created: {OUTPUT_DIR}/run_timeline.png")
 
-def print_summary(df):
+def _reset_ax(fig, figsize):
+    """Clear the shared figure, resize it and return a fresh Axes."""
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    return fig.add_subplot(111)
+
+# Worker-local Figure, created on first use in each process
+_FIG = None
+
+def _render_one(job):
+    """Render one chart; top-level so ProcessPoolExecutor can pickle it."""
+    global _FIG
+    if _FIG is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _FIG = plt.figure()
+    tag, data = job
+    func, figsize = _CHARTS[tag]
+    func(_reset_ax(_FIG, figsize), data)
+
+_CHARTS = {
+    'duration': (create_duration_comparison, (10, 6)),
+    'boxplot': (create_duration_boxplot, (10, 6)),
+    'scaling': (create_scaling_analysis, (10, 6)),
+    'timeline': (create_run_timeline, (12, 6)),
+}
+
+def print_summary(stats):
     """Print statistical summary."""
     print("\n" + "="*60)
     print("PEGASUS BENCHMARK SUMMARY")
     print("="*60)
     
-    for scale in ['1x', '2x', '4x']:
-        data = df[df['scale'] == scale]['duration_seconds']
+    for scale, row in stats.iterrows():
         print(f"\n{scale} Workflow:")
-        print(f"  Runs: {len(data)}")
-        print(f"  Mean: {data.mean():.2f}s")
-        print(f"  Std:  {data.std():.2f}s")
-        print(f"  Min:  {data.min():.2f}s")
-        print(f"  Max:  {data.max():.2f}s")
+        print(f"  Runs: {row['count']:.0f}")
+        print(f"  Mean: {row['mean']:.2f}s")
+        print(f"  Std:  {row['std']:.2f}s")
+        print(f"  Min:  {row['min']:.2f}s")
+        print(f"  Max:  {row['max']:.2f}s")
     
     print("\n" + "="*60)
 
@@ -163,13 +202,22 @@ def main():
     
     print(f"Found {len(df)} successful runs")
     
-    print("\nGenerating visualizations...")
-    create_duration_comparison(df)
-    create_duration_boxplot(df)
-    create_scaling_analysis(df)
-    create_run_timeline(df)
-    
-    print_summary(df)
+    # Per-scale statistics and duration arrays from one groupby pass
+    by_scale = df.groupby('scale', observed=True)['duration_seconds']
+    stats = by_scale.agg(['mean', 'std', 'min', 'max', 'count']).reindex(['1x', '2x', '4x'])
+    stats['count'] = stats['count'].fillna(0)
+    groups = {s: g.values for s, g in by_scale}
+    # (run_number, duration) pairs per scale, already in run order
+    runs = {s: g.sort_values('run_number')[['run_number', 'duration_seconds']].to_numpy()
+            for s, g in df.groupby('scale', observed=True, sort=False)}
+    
+    # Flush before the pool starts so forked workers don't inherit buffered output
+    print("\nGenerating visualizations...", flush=True)
+    jobs = [('duration', stats), ('boxplot', groups), ('scaling', stats), ('timeline', runs)]
+    with ProcessPoolExecutor(max_workers=4) as ex:
+        list(ex.map(_render_one, jobs))
+    
+    print_summary(stats)
     
     print(f"\nCharts saved to: {OUTPUT_DIR}/")
 
@@ -11,9 +11,18 @@ Montage Pattern Mapping:
   mImgtbl       → final-health-check (catalog generation)
 """
 
+import contextlib
+import functools
+import io
+import itertools
 import os
 import sys
-from datetime import datetime
+import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+import yaml
 from Pegasus.api import (
     Workflow,
     Job,
@@ -28,8 +37,36 @@ from Pegasus.api import (
     Operation,
     ReplicaCatalog,
     Properties,
+    Namespace,
+    Arch,
+    OS,
 )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# libyaml-backed dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+# Stage widths plus derived totals for one scale
+_ScaleCfg = namedtuple('_ScaleCfg', ['health_checks', 'node_sims', 'interim_checks',
+                                     'rack_sims', 'final_checks', 'total', 'max_parallel'])
+
+
+@functools.lru_cache(maxsize=None)
+def _file(lfn):
+    """Shared File object per logical file name."""
+    return File(lfn)
+
+
+# Round-robin failure targets
+TARGET_NODES = ('worker-w001', 'worker-w002', 'worker-w003', 'worker-w004')
+TARGET_RACKS = ('R1', 'R2', 'R3')
+
 
 class RackResiliencyDAXGenerator:
     """
@@ -37,6 +74,9 @@ class RackResiliencyDAXGenerator:
     Supports different scales (1x, 2x, 4x) and job clustering.
     """
     
+    __slots__ = ('scale', 'cluster_factor', 'output_dir', 'barriers', 'cluster_strategy',
+                 'config', 'scale_cfg', 'wf', '_producers', 'tc', 'sc', 'rc')
+    
     SCALE_CONFIGS = {
         '1x': {
             'health_checks': 3,
@@ -61,6 +101,13 @@ class RackResiliencyDAXGenerator:
         },
     }
     
+    # Derived per-scale totals, computed once when the class is defined
+    _SCALE_CACHE = {
+        k: _ScaleCfg(**v, total=sum(v.values()),
+                     max_parallel=max(v['health_checks'], v['node_sims'], v['rack_sims']))
+        for k, v in SCALE_CONFIGS.items()
+    }
+    
     # Montage-style transformation names
     TRANSFORMATIONS = {
         'health_check': 'rack_resiliency::health-check:1.0',
@@ -68,7 +115,8 @@ class RackResiliencyDAXGenerator:
         'rack_sim': 'rack_resiliency::rack-failure-sim:1.0',
     }
     
-    def __init__(self, scale='1x', cluster_factor=1, output_dir='.'):
+    def __init__(self, scale='1x', cluster_factor=1, output_dir='.', barriers=False,
+                 cluster_strategy='horizontal'):
         """
         Initialize DAX generator.
         
@@ -76,13 +124,21 @@ class RackResiliencyDAXGenerator:
             scale: Workflow scale ('1x', '2x', '4x')
             cluster_factor: Job clustering factor (1=no clustering, 10=cluster 10 jobs)
             output_dir: Output directory for generated files
+            barriers: Join stage boundaries through a no-op barrier job when that
+                      needs fewer edges (mConcatFit-style fan-in)
+            cluster_strategy: pegasus-plan clustering mode, 'horizontal' (clusters.size
+                              per transformation) or 'label' (one cluster per stage label)
         """
         self.scale = scale
         self.cluster_factor = cluster_factor
         self.output_dir = output_dir
+        self.barriers = barriers
+        self.cluster_strategy = cluster_strategy
         self.config = self.SCALE_CONFIGS.get(scale, self.SCALE_CONFIGS['1x'])
+        self.scale_cfg = self._SCALE_CACHE.get(scale, self._SCALE_CACHE['1x'])
         
         self.wf = None
+        self._producers = {}
         self.tc = None
         self.sc = None
         self.rc = None
@@ -117,6 +173,7 @@ class RackResiliencyDAXGenerator:
             pfn=sim_script,
             is_stageable=False
         )
+        node_sim.add_profiles(Namespace.PEGASUS, key='clusters.size', value=self.cluster_factor)
         node_sim.add_sites(
             TransformationSite('condorpool', sim_script, is_stageable=False)
         )
@@ -130,6 +187,7 @@ class RackResiliencyDAXGenerator:
             pfn=sim_script,
             is_stageable=False
         )
+        rack_sim.add_profiles(Namespace.PEGASUS, key='clusters.size', value=self.cluster_factor)
         rack_sim.add_sites(
             TransformationSite('condorpool', sim_script, is_stageable=False)
         )
@@ -177,12 +235,48 @@ class RackResiliencyDAXGenerator:
         # Add kubeconfig as input file
         self.rc.add_replica(
             'local',
-            File('kubeconfig'),
+            _file('kubeconfig'),
             '/root/.kube/config'
         )
         
         return self.rc
     
+    def _needs_barrier(self, n_parents, n_children):
+        """True if a barrier job needs fewer edges than the full N x M fan-in."""
+        return self.barriers and n_parents * n_children > n_parents + n_children
+    
+    def _barrier_count(self):
+        """Number of barrier jobs create_workflow() inserts for this config."""
+        counts = list(self.config.values())
+        return sum(self._needs_barrier(a, b) for a, b in zip(counts, counts[1:]))
+    
+    def _depend_on_outputs(self, child, names):
+        """Make child depend on whichever jobs produce the named outputs."""
+        child_parents = [self._producers[n] for n in names]
+        self.wf.add_dependency(child, parents=child_parents)
+    
+    def _stage_inputs(self, outputs, n_children, name):
+        """
+        Names the next stage's jobs depend on: the previous stage's outputs, or
+        a single barrier job that depends on them (N + M edges instead of N x M).
+        """
+        names = [f.lfn for f in outputs]
+        if not self._needs_barrier(len(names), n_children):
+            return names
+        barrier = Job('health-check', namespace='rack_resiliency', version='1.0')
+        barrier.add_args('barrier')
+        if self.cluster_factor > 1:
+            barrier.add_profiles(Namespace.PEGASUS, key='label', value=f'barrier-{name}')
+        self.wf.add_jobs(barrier)
+        self._depend_on_outputs(barrier, names)
+        # Barriers write no file; index them under their label instead
+        self._producers[f'barrier-{name}'] = barrier
+        return [f'barrier-{name}']
+    
+    def _run_id(self):
+        """Workflow name: scale plus generation timestamp."""
+        return f"rack-resiliency-{self.scale}-{time.strftime('%Y%m%d-%H%M%S')}"
+    
     def create_workflow(self):
         """
         Create the Pegasus workflow DAX using Montage-style pattern.
@@ -205,25 +299,30 @@ class RackResiliencyDAXGenerator:
             FINAL-HC-1, ... (depends on RACK-SIM)
         """
         
-        run_id = f"rack-resiliency-{self.scale}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        self.wf = Workflow(run_id)
+        self.wf = Workflow(self._run_id())
+        self._producers = {}
+        ns_pegasus = Namespace.PEGASUS
+        # Stage labels only matter to the clusterer; skip them when it is off
+        label_jobs = self.cluster_factor > 1
         
         # Input files
-        kubeconfig = File('kubeconfig')
+        kubeconfig = _file('kubeconfig')
         
         # ===== STAGE 1: Parallel Health Checks (mProjectPP pattern) =====
         health_check_jobs = []
         health_check_outputs = []
         
         for i in range(1, self.config['health_checks'] + 1):
-            output_file = File(f'health-check-{i}.log')
+            output_file = _file(f'health-check-{i}.log')
             health_check_outputs.append(output_file)
             
             job = Job('health-check', namespace='rack_resiliency', version='1.0')
             job.add_args('health-check', '--stabilization-time=10')
             job.add_inputs(kubeconfig)
             job.add_outputs(output_file, stage_out=True)
-            job.add_profiles(Namespace.PEGASUS, key='label', value=f'health-check-{i}')
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-hc')
             
             health_check_jobs.append(job)
             self.wf.add_jobs(job)
@@ -232,173 +331,263 @@ class RackResiliencyDAXGenerator:
         node_sim_jobs = []
         node_sim_outputs = []
         
-        target_nodes = ['worker-w001', 'worker-w002', 'worker-w003', 'worker-w004']
+        node_targets = [TARGET_NODES[i % len(TARGET_NODES)] for i in range(self.config['node_sims'])]
         
-        for i in range(1, self.config['node_sims'] + 1):
-            output_file = File(f'node-sim-{i}.log')
+        health_check_inputs = self._stage_inputs(health_check_outputs, self.config['node_sims'], 'hc')
+        for i, target_node in enumerate(node_targets, 1):
+            output_file = _file(f'node-sim-{i}.log')
             node_sim_outputs.append(output_file)
             
-            target_node = target_nodes[(i - 1) % len(target_nodes)]
-            
             job = Job('node-failure-sim', namespace='rack_resiliency', version='1.0')
             job.add_args('node-failure', target_node, '--stabilization-time=30')
             job.add_inputs(kubeconfig)
             job.add_outputs(output_file, stage_out=True)
-            job.add_profiles(Namespace.PEGASUS, key='label', value=f'node-sim-{i}')
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-node-sim')
             
             # Add job to workflow FIRST
             self.wf.add_jobs(job)
             node_sim_jobs.append(job)
             
             # Then add dependencies: wait for all health checks
-            for hc_job in health_check_jobs:
-                self.wf.add_dependency(job, parents=[hc_job])
+            self._depend_on_outputs(job, health_check_inputs)
         
         # ===== STAGE 3: Interim Health Checks (mFitPlane pattern) =====
         interim_hc_jobs = []
         interim_hc_outputs = []
         
+        node_sim_inputs = self._stage_inputs(node_sim_outputs, self.config['interim_checks'], 'node-sim')
         for i in range(1, self.config['interim_checks'] + 1):
-            output_file = File(f'interim-hc-{i}.log')
+            output_file = _file(f'interim-hc-{i}.log')
             interim_hc_outputs.append(output_file)
             
             job = Job('health-check', namespace='rack_resiliency', version='1.0')
             job.add_args('health-check', '--stabilization-time=10')
             job.add_inputs(kubeconfig)
             job.add_outputs(output_file, stage_out=True)
-            job.add_profiles(Namespace.PEGASUS, key='label', value=f'interim-hc-{i}')
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-interim-hc')
             
             # Add job to workflow FIRST
             self.wf.add_jobs(job)
             interim_hc_jobs.append(job)
             
             # Then add dependencies: wait for node simulations
-            for ns_job in node_sim_jobs:
-                self.wf.add_dependency(job, parents=[ns_job])
+            self._depend_on_outputs(job, node_sim_inputs)
         
         # ===== STAGE 4: Rack Failure Simulations (mBackground pattern) =====
         rack_sim_jobs = []
         rack_sim_outputs = []
         
-        target_racks = ['R1', 'R2', 'R3']
+        rack_targets = [TARGET_RACKS[i % len(TARGET_RACKS)] for i in range(self.config['rack_sims'])]
         
-        for i in range(1, self.config['rack_sims'] + 1):
-            output_file = File(f'rack-sim-{i}.log')
+        interim_hc_inputs = self._stage_inputs(interim_hc_outputs, self.config['rack_sims'], 'interim-hc')
+        for i, target_rack in enumerate(rack_targets, 1):
+            output_file = _file(f'rack-sim-{i}.log')
             rack_sim_outputs.append(output_file)
             
-            target_rack = target_racks[(i - 1) % len(target_racks)]
-            
             job = Job('rack-failure-sim', namespace='rack_resiliency', version='1.0')
             job.add_args('rack-failure', target_rack, '--stabilization-time=30')
             job.add_inputs(kubeconfig)
             job.add_outputs(output_file, stage_out=True)
-            job.add_profiles(Namespace.PEGASUS, key='label', value=f'rack-sim-{i}')
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-rack-sim')
             
             # Add job to workflow FIRST
             self.wf.add_jobs(job)
             rack_sim_jobs.append(job)
             
             # Then add dependencies: wait for interim health checks
-            for ihc_job in interim_hc_jobs:
-                self.wf.add_dependency(job, parents=[ihc_job])
+            self._depend_on_outputs(job, interim_hc_inputs)
         
         # ===== STAGE 5: Final Health Checks (mImgtbl pattern) =====
         final_hc_jobs = []
         
+        rack_sim_inputs = self._stage_inputs(rack_sim_outputs, self.config['final_checks'], 'rack-sim')
         for i in range(1, self.config['final_checks'] + 1):
-            output_file = File(f'final-hc-{i}.log')
+            output_file = _file(f'final-hc-{i}.log')
             
             job = Job('health-check', namespace='rack_resiliency', version='1.0')
             job.add_args('health-check', '--stabilization-time=10')
             job.add_inputs(kubeconfig)
             job.add_outputs(output_file, stage_out=True)
-            job.add_profiles(Namespace.PEGASUS, key='label', value=f'final-hc-{i}')
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-final-hc')
             
             # Add job to workflow FIRST
             self.wf.add_jobs(job)
             final_hc_jobs.append(job)
             
             # Then add dependencies: wait for rack simulations
-            for rs_job in rack_sim_jobs:
-                self.wf.add_dependency(job, parents=[rs_job])
+            self._depend_on_outputs(job, rack_sim_inputs)
         
         return self.wf
     
     def get_workflow_stats(self):
         """Get workflow statistics for comparison."""
-        total_jobs = (
-            self.config['health_checks'] +
-            self.config['node_sims'] +
-            self.config['interim_checks'] +
-            self.config['rack_sims'] +
-            self.config['final_checks']
-        )
+        barrier_jobs = self._barrier_count()
+        total_jobs = self.scale_cfg.total + barrier_jobs
         
         parallel_stages = 5  # HC, NodeSim, InterimHC, RackSim, FinalHC
-        max_parallel = max(
-            self.config['health_checks'],
-            self.config['node_sims'],
-            self.config['rack_sims']
-        )
+        max_parallel = self.scale_cfg.max_parallel
         
         return {
             'scale': self.scale,
             'total_jobs': total_jobs,
+            'barrier_jobs': barrier_jobs,
             'parallel_stages': parallel_stages,
             'max_parallel_jobs': max_parallel,
             'cluster_factor': self.cluster_factor,
+            'cluster_strategy': self.cluster_strategy,
             'effective_jobs': total_jobs // self.cluster_factor if self.cluster_factor > 1 else total_jobs,
             'breakdown': self.config,
         }
     
-    def write_dax(self, filename=None):
-        """Write the DAX workflow to file."""
+    def _job_records(self):
+        """
+        Yield (job, parent_ids) for every job of create_workflow(), in the same
+        order and with the same ids, as plain Pegasus 5.0 YAML job dicts.
+        """
+        next_id = ('ID%07d' % n for n in itertools.count(1)).__next__
+        
+        def record(job_id, name, args, label, output=None):
+            job = {
+                'type': 'job',
+                'namespace': 'rack_resiliency',
+                'version': '1.0',
+                'name': name,
+                'id': job_id,
+                'arguments': list(args),
+            }
+            if output:
+                job['uses'] = [
+                    {'lfn': 'kubeconfig', 'type': 'input'},
+                    {'lfn': output, 'type': 'output', 'stageOut': True, 'registerReplica': True},
+                ]
+            if self.cluster_factor > 1:
+                job['profiles'] = {'pegasus': {'label': label}}
+            return job
+        
+        c = self.config
+        # (transformation, per-job arguments, output prefix, stage label, barrier name)
+        stages = (
+            ('health-check', [('health-check', '--stabilization-time=10')] * c['health_checks'],
+             'health-check', 'stage-hc', 'hc'),
+            ('node-failure-sim', [('node-failure', TARGET_NODES[i % len(TARGET_NODES)], '--stabilization-time=30')
+                                  for i in range(c['node_sims'])],
+             'node-sim', 'stage-node-sim', 'node-sim'),
+            ('health-check', [('health-check', '--stabilization-time=10')] * c['interim_checks'],
+             'interim-hc', 'stage-interim-hc', 'interim-hc'),
+            ('rack-failure-sim', [('rack-failure', TARGET_RACKS[i % len(TARGET_RACKS)], '--stabilization-time=30')
+                                  for i in range(c['rack_sims'])],
+             'rack-sim', 'stage-rack-sim', 'rack-sim'),
+            ('health-check', [('health-check', '--stabilization-time=10')] * c['final_checks'],
+             'final-hc', 'stage-final-hc', None),
+        )
+        
+        parents = []
+        barrier_name = None
+        for name, arg_lists, prefix, label, next_barrier in stages:
+            if parents and self._needs_barrier(len(parents), len(arg_lists)):
+                barrier_id = next_id()
+                yield record(barrier_id, 'health-check', ['barrier'], f'barrier-{barrier_name}'), parents
+                parents = [barrier_id]
+            ids = []
+            for i, args in enumerate(arg_lists, 1):
+                job_id = next_id()
+                yield record(job_id, name, args, label, f'{prefix}-{i}.log'), parents
+                ids.append(job_id)
+            parents, barrier_name = ids, next_barrier
+    
+    def write_dax_stream(self, filepath):
+        """
+        Write the DAX as Pegasus 5.0 YAML straight from _job_records(), one job
+        at a time, without building a Workflow object.
+        """
+        children = defaultdict(list)
+        with open(filepath, 'w') as f:
+            yaml.safe_dump({'pegasus': '5.0', 'name': self._run_id()}, f, sort_keys=False)
+            f.write('jobs:\n')
+            for job, parent_ids in self._job_records():
+                yaml.safe_dump([job], f, default_flow_style=False, sort_keys=False)
+                for parent_id in parent_ids:
+                    children[parent_id].append(job['id'])
+            if children:
+                f.write('jobDependencies:\n')
+                yaml.safe_dump([{'id': parent_id, 'children': kids} for parent_id, kids in children.items()],
+                               f, default_flow_style=False, sort_keys=False)
+    
+    def write_dax_fast(self, filepath):
+        """
+        Assemble the whole DAX as one dict from _job_records() and dump it in a
+        single C-level call: JSON via orjson (JSON is valid YAML, so
+        pegasus-plan reads it as-is), else YAML via the libyaml dumper.
+        """
+        jobs = []
+        children = defaultdict(list)
+        for job, parent_ids in self._job_records():
+            jobs.append(job)
+            for parent_id in parent_ids:
+                children[parent_id].append(job['id'])
+        dax = {'pegasus': '5.0', 'name': self._run_id(), 'jobs': jobs}
+        if children:
+            dax['jobDependencies'] = [{'id': parent_id, 'children': kids}
+                                      for parent_id, kids in children.items()]
+        
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(dax))
+        else:
+            with open(filepath, 'w') as f:
+                yaml.dump(dax, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+    
+    def write_dax(self, filename=None, fast=False):
+        """
+        Write the DAX workflow to file. Without a prior create_workflow() the
+        DAX is streamed by write_dax_stream(), or dumped in one go by
+        write_dax_fast() if fast is set.
+        """
         if filename is None:
             filename = f'rack-resiliency-{self.scale}.dax'
         
         filepath = os.path.join(self.output_dir, filename)
-        self.wf.write(filepath)
+        if self.wf is None and fast:
+            self.write_dax_fast(filepath)
+        elif self.wf is None:
+            self.write_dax_stream(filepath)
+        else:
+            self.wf.write(filepath)
         
         print(f"DAX written to: {filepath}")
         return filepath
     
     def write_catalogs(self):
-        """Write all catalogs to files."""
-        if self.tc:
-            tc_path = os.path.join(self.output_dir, 'tc.txt')
-            self.tc.write(tc_path)
-            print(f"Transformation Catalog: {tc_path}")
-        
-        if self.sc:
-            sc_path = os.path.join(self.output_dir, 'sites.yml')
-            self.sc.write(sc_path)
-            print(f"Site Catalog: {sc_path}")
-        
-        if self.rc:
-            rc_path = os.path.join(self.output_dir, 'rc.txt')
-            self.rc.write(rc_path)
-            print(f"Replica Catalog: {rc_path}")
+        """Write all catalogs to files (independent writes, done concurrently)."""
+        catalogs = [
+            (cat, os.path.join(self.output_dir, name), label)
+            for cat, name, label in ((self.tc, 'tc.txt', 'Transformation Catalog'),
+                                     (self.sc, 'sites.yml', 'Site Catalog'),
+                                     (self.rc, 'rc.txt', 'Replica Catalog'))
+            if cat
+        ]
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            list(ex.map(lambda c: c[0].write(c[1]), catalogs))
+        for _, path, label in catalogs:
+            print(f"{label}: {path}")
 
 
-def main():
-    """Generate DAX workflows for all scales."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='Generate Pegasus DAX for Rack Resiliency')
-    parser.add_argument('--scale', choices=['1x', '2x', '4x', 'all'], default='1x',
-                        help='Workflow scale')
-    parser.add_argument('--cluster', type=int, default=1,
-                        help='Job clustering factor')
-    parser.add_argument('--output', default='.',
-                        help='Output directory')
-    parser.add_argument('--stats', action='store_true',
-                        help='Print workflow statistics only')
-    
-    args = parser.parse_args()
-    
-    scales = ['1x', '2x', '4x'] if args.scale == 'all' else [args.scale]
-    
-    for scale in scales:
+def generate_one(scale, args):
+    """
+    Generate one scale's DAX from the parsed CLI args.
+    Returns the progress report instead of printing it, so parallel runs
+    can be reported in scale order.
+    """
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
         print(f"\n{'='*60}")
         print(f"Generating {scale} Workflow (Cluster Factor: {args.cluster})")
         print('='*60)
@@ -406,12 +595,18 @@ def main():
         generator = RackResiliencyDAXGenerator(
             scale=scale,
             cluster_factor=args.cluster,
-            output_dir=args.output
+            output_dir=args.output,
+            barriers=args.barriers,
+            cluster_strategy=args.cluster_strategy
         )
         
         stats = generator.get_workflow_stats()
         print(f"\nWorkflow Statistics:")
         print(f"  Total Jobs: {stats['total_jobs']}")
+        if stats['barrier_jobs']:
+            print(f"  Barrier Jobs: {stats['barrier_jobs']}")
+        if args.cluster > 1:
+            print(f"  Plan with: pegasus-plan --cluster {stats['cluster_strategy']}")
         print(f"  Max Parallel: {stats['max_parallel_jobs']}")
         print(f"  Effective Jobs (clustered): {stats['effective_jobs']}")
         print(f"  Breakdown:")
@@ -419,15 +614,60 @@ def main():
             print(f"    {stage}: {count}")
         
         if not args.stats:
-            generator.create_transformation_catalog()
-            generator.create_site_catalog()
-            generator.create_replica_catalog()
-            generator.create_workflow()
-            generator.write_dax()
-            generator.write_catalogs()
+            if not (args.stream or args.fast):
+                generator.create_workflow()
+            generator.write_dax(fast=args.fast)
+    return out.getvalue()
+
+
+def write_shared_catalogs(args):
+    """The catalogs do not depend on scale: build and write them once per run."""
+    generator = RackResiliencyDAXGenerator(cluster_factor=args.cluster, output_dir=args.output,
+                                           cluster_strategy=args.cluster_strategy)
+    generator.create_transformation_catalog()
+    generator.create_site_catalog()
+    generator.create_replica_catalog()
+    generator.write_catalogs()
+
+
+def main():
+    """Generate DAX workflows for all scales."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate Pegasus DAX for Rack Resiliency')
+    parser.add_argument('--scale', choices=['1x', '2x', '4x', 'all'], default='1x',
+                        help='Workflow scale')
+    parser.add_argument('--cluster', type=int, default=1,
+                        help='Job clustering factor')
+    parser.add_argument('--output', default='.',
+                        help='Output directory')
+    parser.add_argument('--cluster-strategy', choices=['horizontal', 'label'], default='horizontal',
+                        help='Clustering mode to pass to pegasus-plan --cluster')
+    parser.add_argument('--barriers', action='store_true',
+                        help='Join wide stage boundaries through a barrier job')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream the DAX YAML without building a Workflow object')
+    parser.add_argument('--fast', action='store_true',
+                        help='Dump the DAX in one call (orjson/libyaml) without a Workflow object')
+    parser.add_argument('--stats', action='store_true',
+                        help='Print workflow statistics only')
+    
+    args = parser.parse_args()
+    
+    scales = ['1x', '2x', '4x'] if args.scale == 'all' else [args.scale]
+    
+    if len(scales) == 1:
+        print(generate_one(scales[0], args), end='')
+    else:
+        # Scales share nothing, so generate them in parallel
+        with Pool(min(len(scales), os.cpu_count() or 1)) as pool:
+            reports = pool.starmap(generate_one, [(scale, args) for scale in scales])
+        for report in reports:
+            print(report, end='')
+    
+    if not args.stats:
+        write_shared_catalogs(args)
 
 
 if __name__ == '__main__':
-    # Import Pegasus namespace for profiles
-    from Pegasus.api import Namespace, Arch, OS
     main()
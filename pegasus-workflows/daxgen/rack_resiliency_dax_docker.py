@@ -4,9 +4,12 @@ Rack Resiliency DAX Generator for Docker - Simplified Version
 Generates Pegasus DAX workflow for running inside Docker container.
 """
 
+import functools
 import os
 import sys
-from datetime import datetime
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from Pegasus.api import (
     Workflow,
     Job,
@@ -26,9 +29,28 @@ from Pegasus.api import (
 )
 
 
+# Stage widths plus derived totals for one scale
+_ScaleCfg = namedtuple('_ScaleCfg', ['health_checks', 'node_sims', 'interim_checks',
+                                     'rack_sims', 'final_checks', 'total', 'max_parallel'])
+
+
+@functools.lru_cache(maxsize=None)
+def _file(lfn):
+    """Shared File object per logical file name."""
+    return File(lfn)
+
+
+# Round-robin failure targets
+TARGET_NODES = ('worker-w001', 'worker-w002', 'worker-w003', 'worker-w004')
+TARGET_RACKS = ('R1', 'R2', 'R3')
+
+
 class RackResiliencyDAXGenerator:
     """Generates Pegasus DAX workflows for rack resiliency simulation."""
     
+    __slots__ = ('scale', 'cluster_factor', 'output_dir', 'barriers', 'cluster_strategy',
+                 'config', 'scale_cfg', 'wf', '_producers', 'tc', 'sc', 'rc')
+    
     SCALE_CONFIGS = {
         '1x': {
             'health_checks': 3,
@@ -53,13 +75,25 @@ class RackResiliencyDAXGenerator:
         },
     }
     
-    def __init__(self, scale='1x', cluster_factor=1, output_dir='.'):
+    # Derived per-scale totals, computed once when the class is defined
+    _SCALE_CACHE = {
+        k: _ScaleCfg(**v, total=sum(v.values()),
+                     max_parallel=max(v['health_checks'], v['node_sims'], v['rack_sims']))
+        for k, v in SCALE_CONFIGS.items()
+    }
+    
+    def __init__(self, scale='1x', cluster_factor=1, output_dir='.', barriers=False,
+                 cluster_strategy='horizontal'):
         self.scale = scale
         self.cluster_factor = cluster_factor
         self.output_dir = output_dir
+        self.barriers = barriers
+        self.cluster_strategy = cluster_strategy
         self.config = self.SCALE_CONFIGS.get(scale, self.SCALE_CONFIGS['1x'])
+        self.scale_cfg = self._SCALE_CACHE.get(scale, self._SCALE_CACHE['1x'])
         
         self.wf = None
+        self._producers = {}
         self.tc = None
         self.sc = None
         self.rc = None
@@ -91,6 +125,7 @@ class RackResiliencyDAXGenerator:
             pfn=sim_script,
             is_stageable=False
         )
+        node_sim.add_profiles(Namespace.PEGASUS, key='clusters.size', value=self.cluster_factor)
         
         # Rack failure simulation
         rack_sim = Transformation(
@@ -101,6 +136,7 @@ class RackResiliencyDAXGenerator:
             pfn=sim_script,
             is_stageable=False
         )
+        rack_sim.add_profiles(Namespace.PEGASUS, key='clusters.size', value=self.cluster_factor)
         
         self.tc.add_transformations(health_check, node_sim, rack_sim)
         return self.tc
@@ -129,80 +165,132 @@ class RackResiliencyDAXGenerator:
         self.rc = ReplicaCatalog()
         return self.rc
     
+    def _needs_barrier(self, n_parents, n_children):
+        """True if a barrier job needs fewer edges than the full N x M fan-in."""
+        return self.barriers and n_parents * n_children > n_parents + n_children
+    
+    def _barrier_count(self):
+        """Number of barrier jobs create_workflow() inserts for this config."""
+        counts = list(self.config.values())
+        return sum(self._needs_barrier(a, b) for a, b in zip(counts, counts[1:]))
+    
+    def _depend_on_outputs(self, child, names):
+        """Make child depend on whichever jobs produce the named outputs."""
+        child_parents = [self._producers[n] for n in names]
+        self.wf.add_dependency(child, parents=child_parents)
+    
+    def _stage_inputs(self, outputs, n_children, name):
+        """
+        Names the next stage's jobs depend on: the previous stage's outputs, or
+        a single barrier job that depends on them (N + M edges instead of N x M).
+        """
+        names = [f.lfn for f in outputs]
+        if not self._needs_barrier(len(names), n_children):
+            return names
+        barrier = Job('health-check', namespace='rack_resiliency', version='1.0')
+        barrier.add_args('barrier')
+        if self.cluster_factor > 1:
+            barrier.add_profiles(Namespace.PEGASUS, key='label', value=f'barrier-{name}')
+        self.wf.add_jobs(barrier)
+        self._depend_on_outputs(barrier, names)
+        # Barriers write no file; index them under their label instead
+        self._producers[f'barrier-{name}'] = barrier
+        return [f'barrier-{name}']
+    
     def create_workflow(self):
         """Create the Pegasus workflow DAX."""
-        run_id = f"rack-resiliency-{self.scale}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        run_id = f"rack-resiliency-{self.scale}-{time.strftime('%Y%m%d-%H%M%S')}"
         self.wf = Workflow(run_id)
+        self._producers = {}
+        ns_pegasus = Namespace.PEGASUS
+        # Stage labels only matter to the clusterer; skip them when it is off
+        label_jobs = self.cluster_factor > 1
         
         # Stage 1: Health Checks (parallel)
-        health_check_jobs = []
+        health_check_outputs = []
         for i in range(1, self.config['health_checks'] + 1):
-            output_file = File(f'health-check-{i}.log')
+            output_file = _file(f'health-check-{i}.log')
             job = Job('health-check', namespace='rack_resiliency', version='1.0')
             job.add_args('health-check', '--stabilization-time=5')
             job.add_outputs(output_file, stage_out=True)
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-hc')
             self.wf.add_jobs(job)
-            health_check_jobs.append(job)
+            health_check_outputs.append(output_file)
         
         # Stage 2: Node Failure Simulations
-        node_sim_jobs = []
-        target_nodes = ['worker-w001', 'worker-w002', 'worker-w003', 'worker-w004']
-        for i in range(1, self.config['node_sims'] + 1):
-            output_file = File(f'node-sim-{i}.log')
-            target_node = target_nodes[(i - 1) % len(target_nodes)]
+        node_sim_outputs = []
+        node_targets = [TARGET_NODES[i % len(TARGET_NODES)] for i in range(self.config['node_sims'])]
+        health_check_inputs = self._stage_inputs(health_check_outputs, self.config['node_sims'], 'hc')
+        for i, target_node in enumerate(node_targets, 1):
+            output_file = _file(f'node-sim-{i}.log')
             job = Job('node-failure-sim', namespace='rack_resiliency', version='1.0')
             job.add_args('node-failure', target_node, '--stabilization-time=10')
             job.add_outputs(output_file, stage_out=True)
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-node-sim')
             self.wf.add_jobs(job)
-            for hc_job in health_check_jobs:
-                self.wf.add_dependency(job, parents=[hc_job])
-            node_sim_jobs.append(job)
+            self._depend_on_outputs(job, health_check_inputs)
+            node_sim_outputs.append(output_file)
         
         # Stage 3: Interim Health Checks
-        interim_hc_jobs = []
+        interim_hc_outputs = []
+        node_sim_inputs = self._stage_inputs(node_sim_outputs, self.config['interim_checks'], 'node-sim')
         for i in range(1, self.config['interim_checks'] + 1):
-            output_file = File(f'interim-hc-{i}.log')
+            output_file = _file(f'interim-hc-{i}.log')
             job = Job('health-check', namespace='rack_resiliency', version='1.0')
             job.add_args('health-check', '--stabilization-time=5')
             job.add_outputs(output_file, stage_out=True)
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-interim-hc')
             self.wf.add_jobs(job)
-            for ns_job in node_sim_jobs:
-                self.wf.add_dependency(job, parents=[ns_job])
-            interim_hc_jobs.append(job)
+            self._depend_on_outputs(job, node_sim_inputs)
+            interim_hc_outputs.append(output_file)
         
         # Stage 4: Rack Failure Simulations
-        rack_sim_jobs = []
-        target_racks = ['R1', 'R2', 'R3']
-        for i in range(1, self.config['rack_sims'] + 1):
-            output_file = File(f'rack-sim-{i}.log')
-            target_rack = target_racks[(i - 1) % len(target_racks)]
+        rack_sim_outputs = []
+        rack_targets = [TARGET_RACKS[i % len(TARGET_RACKS)] for i in range(self.config['rack_sims'])]
+        interim_hc_inputs = self._stage_inputs(interim_hc_outputs, self.config['rack_sims'], 'interim-hc')
+        for i, target_rack in enumerate(rack_targets, 1):
+            output_file = _file(f'rack-sim-{i}.log')
             job = Job('rack-failure-sim', namespace='rack_resiliency', version='1.0')
             job.add_args('rack-failure', target_rack, '--stabilization-time=10')
             job.add_outputs(output_file, stage_out=True)
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-rack-sim')
             self.wf.add_jobs(job)
-            for ihc_job in interim_hc_jobs:
-                self.wf.add_dependency(job, parents=[ihc_job])
-            rack_sim_jobs.append(job)
+            self._depend_on_outputs(job, interim_hc_inputs)
+            rack_sim_outputs.append(output_file)
         
         # Stage 5: Final Health Checks
+        rack_sim_inputs = self._stage_inputs(rack_sim_outputs, self.config['final_checks'], 'rack-sim')
         for i in range(1, self.config['final_checks'] + 1):
-            output_file = File(f'final-hc-{i}.log')
+            output_file = _file(f'final-hc-{i}.log')
             job = Job('health-check', namespace='rack_resiliency', version='1.0')
             job.add_args('health-check', '--stabilization-time=5')
             job.add_outputs(output_file, stage_out=True)
+            self._producers[output_file.lfn] = job
+            if label_jobs:
+                job.add_profiles(ns_pegasus, key='label', value='stage-final-hc')
             self.wf.add_jobs(job)
-            for rs_job in rack_sim_jobs:
-                self.wf.add_dependency(job, parents=[rs_job])
+            self._depend_on_outputs(job, rack_sim_inputs)
         
         return self.wf
     
     def get_workflow_stats(self):
         """Get workflow statistics."""
-        total_jobs = sum(self.config.values())
+        barrier_jobs = self._barrier_count()
+        total_jobs = self.scale_cfg.total + barrier_jobs
         return {
             'scale': self.scale,
             'total_jobs': total_jobs,
+            'barrier_jobs': barrier_jobs,
             'cluster_factor': self.cluster_factor,
+            'cluster_strategy': self.cluster_strategy,
             'breakdown': self.config,
         }
     
@@ -216,19 +304,18 @@ class RackResiliencyDAXGenerator:
         return filepath
     
     def write_catalogs(self):
-        """Write all catalogs to files."""
-        if self.tc:
-            tc_path = os.path.join(self.output_dir, 'tc.txt')
-            self.tc.write(tc_path)
-            print(f"Transformation Catalog: {tc_path}")
-        if self.sc:
-            sc_path = os.path.join(self.output_dir, 'sites.yml')
-            self.sc.write(sc_path)
-            print(f"Site Catalog: {sc_path}")
-        if self.rc:
-            rc_path = os.path.join(self.output_dir, 'rc.txt')
-            self.rc.write(rc_path)
-            print(f"Replica Catalog: {rc_path}")
+        """Write all catalogs to files (independent writes, done concurrently)."""
+        catalogs = [
+            (cat, os.path.join(self.output_dir, name), label)
+            for cat, name, label in ((self.tc, 'tc.txt', 'Transformation Catalog'),
+                                     (self.sc, 'sites.yml', 'Site Catalog'),
+                                     (self.rc, 'rc.txt', 'Replica Catalog'))
+            if cat
+        ]
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            list(ex.map(lambda c: c[0].write(c[1]), catalogs))
+        for _, path, label in catalogs:
+            print(f"{label}: {path}")
 
 
 def main():
@@ -238,6 +325,8 @@ def main():
     parser.add_argument('--scale', choices=['1x', '2x', '4x'], default='1x')
     parser.add_argument('--cluster', type=int, default=1)
     parser.add_argument('--output', default='/app/output')
+    parser.add_argument('--cluster-strategy', choices=['horizontal', 'label'], default='horizontal')
+    parser.add_argument('--barriers', action='store_true')
     parser.add_argument('--stats', action='store_true')
     
     args = parser.parse_args()
@@ -249,12 +338,18 @@ def main():
     generator = RackResiliencyDAXGenerator(
         scale=args.scale,
         cluster_factor=args.cluster,
-        output_dir=args.output
+        output_dir=args.output,
+        barriers=args.barriers,
+        cluster_strategy=args.cluster_strategy
     )
     
     stats = generator.get_workflow_stats()
     print(f"\nWorkflow Statistics:")
     print(f"  Total Jobs: {stats['total_jobs']}")
+    if stats['barrier_jobs']:
+        print(f"  Barrier Jobs: {stats['barrier_jobs']}")
+    if args.cluster > 1:
+        print(f"  Plan with: pegasus-plan --cluster {stats['cluster_strategy']}")
     print(f"  Breakdown:")
     for stage, count in stats['breakdown'].items():
         print(f"    {stage}: {count}")
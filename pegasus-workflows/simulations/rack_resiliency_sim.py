@@ -20,46 +20,59 @@ def health_check(stabilization_time=10):
 def node_failure(node_name, stabilization_time=30):
     """Simulate a node failure."""
     print(f"[{datetime.now()}] Simulating node failure: {node_name}")
-    time.sleep(stabilization_time / 2)
     print(f"[{datetime.now()}] Node {node_name} marked as failed")
-    time.sleep(stabilization_time / 2)
+    time.sleep(stabilization_time)
     print(f"[{datetime.now()}] Node {node_name} recovered")
     return 0
 
 def rack_failure(rack_name, stabilization_time=30):
     """Simulate a rack failure."""
     print(f"[{datetime.now()}] Simulating rack failure: {rack_name}")
-    time.sleep(stabilization_time / 2)
     print(f"[{datetime.now()}] Rack {rack_name} marked as failed")
-    time.sleep(stabilization_time / 2)
+    time.sleep(stabilization_time)
     print(f"[{datetime.now()}] Rack {rack_name} recovered")
     return 0
 
+def _exit(code):
+    """Flush output and exit without interpreter teardown (short jobs)."""
+    sys.stdout.flush()
+    os._exit(code)
+
+# command -> (handler, default target); barrier has no handler
+COMMANDS = {
+    'health-check': (health_check, None),
+    'node-failure': (node_failure, 'worker-001'),
+    'rack-failure': (rack_failure, 'R1'),
+    'barrier': (None, None),
+}
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: rack_resiliency_sim.py <command> [args...]")
-        print("Commands: health-check, node-failure, rack-failure")
-        sys.exit(1)
+        print("Commands: health-check, node-failure, rack-failure, barrier")
+        _exit(1)
     
     command = sys.argv[1]
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}")
+        _exit(1)
+    handler, default_target = COMMANDS[command]
+    if handler is None:
+        # Stage-join point inserted by the DAX generator; nothing to do
+        _exit(0)
     
-    # Parse stabilization time from args
-    stab_time = 10
-    for arg in sys.argv[2:]:
-        if arg.startswith('--stabilization-time='):
-            stab_time = int(arg.split('=')[1])
+    # --key=value options; the target is the first argument, if not an option
+    args = sys.argv[2:]
+    options = dict(a[2:].split('=', 1) for a in args if a.startswith('--') and '=' in a)
+    stab_time = int(options.get('stabilization-time', 10))
+    if os.environ.get('PEGASUS_DRYRUN', '0') != '0':
+        # Benchmarking engine overhead only: skip the stabilization waits
+        stab_time = 0
     
-    if command == 'health-check':
-        sys.exit(health_check(stab_time))
-    elif command == 'node-failure':
-        node_name = sys.argv[2] if len(sys.argv) > 2 and not sys.argv[2].startswith('--') else 'worker-001'
-        sys.exit(node_failure(node_name, stab_time))
-    elif command == 'rack-failure':
-        rack_name = sys.argv[2] if len(sys.argv) > 2 and not sys.argv[2].startswith('--') else 'R1'
-        sys.exit(rack_failure(rack_name, stab_time))
-    else:
-        print(f"Unknown command: {command}")
-        sys.exit(1)
+    if default_target is None:
+        _exit(handler(stab_time))
+    target = args[0] if args and not args[0].startswith('--') else default_target
+    _exit(handler(target, stab_time))
 
 if __name__ == '__main__':
     main()
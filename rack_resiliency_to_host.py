@@ -579,7 +579,7 @@ if __name__ == "__main__":
     try:
         # Parse command line arguments
         parser = argparse.ArgumentParser(description="Rack Resiliency Simulation Tool")
-        parser.add_argument("action", choices=["health-check", "simulate-node", "simulate-rack", "recover-node", "recover-rack"], 
+        parser.add_argument("action", choices=["health-check", "simulate-node", "simulate-rack", "recover-node", "recover-rack", "barrier"], 
                            help="Action to perform")
         parser.add_argument("--stabilization-time", type=int, default=60,
                            help="Time (in seconds) to wait for the cluster to stabilize after a failure")
@@ -602,6 +602,8 @@ if __name__ == "__main__":
             simulate_random_zone_failure(downtime=downtime, stabilization_time=stabilization_time)
         elif action in ("recover-node", "recover-rack"):
             logging.info(f"Recovery action ({action}) is a no-op.")
+        elif action == "barrier":
+            logging.info("Barrier reached; nothing to do.")
         else:
             logging.error(f"Unknown action: {action}")
             sys.exit(1)
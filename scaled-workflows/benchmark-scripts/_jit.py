@@ -0,0 +1,100 @@
+"""
+Numeric helpers shared by the benchmark analysis scripts.
+Compiled with Numba when it is installed; plain Python otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: leave the function uncompiled."""
+        return lambda f: f
+
+
+@njit(cache=True)
+def _quantile(sorted_arr, q):
+    """Linear-interpolated quantile (numpy's default) of a sorted array."""
+    k = (sorted_arr.shape[0] - 1) * q
+    f = int(k)
+    c = min(f + 1, sorted_arr.shape[0] - 1)
+    return sorted_arr[f] + (sorted_arr[c] - sorted_arr[f]) * (k - f)
+
+
+@njit(cache=True)
+def stats_and_iqr(sorted_arr):
+    """
+    Summary statistics of a non-empty, sorted 1-D array:
+    (min, max, mean, std, p5, p25, p50, p75, p95, p99, lower_iqr, upper_iqr).
+    Mean and sample std (ddof=1) come from one Welford pass; the IQR fences
+    are Q1 - 1.5*IQR and Q3 + 1.5*IQR.
+    """
+    n = sorted_arr.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = float(sorted_arr[i])
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    
+    p25 = _quantile(sorted_arr, 0.25)
+    p75 = _quantile(sorted_arr, 0.75)
+    iqr = p75 - p25
+    return (sorted_arr[0], sorted_arr[n - 1], mean, std,
+            _quantile(sorted_arr, 0.05), p25, _quantile(sorted_arr, 0.5), p75,
+            _quantile(sorted_arr, 0.95), _quantile(sorted_arr, 0.99),
+            p25 - 1.5 * iqr, p75 + 1.5 * iqr)
+
+
+@njit(cache=True)
+def classify_durations(durs, timed, edges, fast_below, n_show):
+    """
+    One pass over a duration array: (bucket_counts, n_fast, first_fast).
+    Bucket i counts durations in [edges[i-1], edges[i]); n_fast counts the
+    timed[] durations below fast_below, and first_fast holds the indices of
+    the first n_show of them.
+    """
+    buckets = np.zeros(edges.shape[0] + 1, np.int64)
+    first_fast = np.empty(n_show, np.int64)
+    n_fast = 0
+    for i in range(durs.shape[0]):
+        d = durs[i]
+        b = 0
+        while b < edges.shape[0] and d >= edges[b]:
+            b += 1
+        buckets[b] += 1
+        if timed[i] and d < fast_below:
+            if n_fast < n_show:
+                first_fast[n_fast] = i
+            n_fast += 1
+    return buckets, n_fast, first_fast[:min(n_fast, n_show)]
+
+
+@njit(cache=True)
+def scaling_metrics(sf_2x, sf_2x_heft):
+    """
+    Per-platform (heft_improvement, efficiency_2x, efficiency_2x_heft) arrays
+    from the 2x and 2x HEFT scaling factors. Improvement is the % drop in
+    scaling factor with HEFT (0 without a baseline); efficiency is 100 at a
+    factor of 2.0, minus 50 per unit of deviation, floored at 0 (0 if no data).
+    """
+    n = sf_2x.shape[0]
+    improvement = np.zeros(n)
+    eff_2x = np.zeros(n)
+    eff_2x_heft = np.zeros(n)
+    for i in range(n):
+        sf = sf_2x[i]
+        sf_heft = sf_2x_heft[i]
+        if sf > 0:
+            improvement[i] = (sf - sf_heft) / sf * 100.0
+        if sf != 0:
+            eff_2x[i] = max(0.0, 100.0 - abs(sf - 2.0) * 50.0)
+        if sf_heft != 0:
+            eff_2x_heft[i] = max(0.0, 100.0 - abs(sf_heft - 2.0) * 50.0)
+    return improvement, eff_2x, eff_2x_heft
@@ -4,14 +4,31 @@ Scaled (2x) Benchmark Results Aggregator
 Aggregates results from scaled workflow runs across all platforms.
 """
 
+import array
 import os
 import sys
 import json
 import csv
-import glob
 from datetime import datetime
-from statistics import mean, median, stdev
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# mypyc-compiled when built (see benchmark_core.py); else the source module
+from benchmark_core import parse_metrics, read_bytes
+
+# Prebuilt by build_stats_ext.py when available; else the (JIT) source version
+try:
+    from _stats_ext import stats_and_iqr
+except ImportError:
+    from _jit import stats_and_iqr
 
 # Directories for scaled results
 SCALED_DIRS = {
@@ -23,46 +40,61 @@ SCALED_DIRS = {
     'GitHubActions_Scaled_HEFT': '/home/snu/kubernetes/comparison-logs/github-actions-scaled-heft',
 }
 
+# Run statuses counted as successful
+SUCCESS_STATUSES = ('SUCCESS', 'SUCCEEDED')
 
-def percentile(data, p):
-    if not data:
-        return 0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * (p / 100)
-    f = int(k)
-    c = f + 1 if f + 1 < len(sorted_data) else f
-    return sorted_data[f] + (sorted_data[c] - sorted_data[f]) * (k - f)
-
-
-def parse_metrics_file(filepath):
-    metrics = {}
+def parse_timing_csv(filepath):
+    # Plain comma split: the file is two simple columns, so DictReader's
+    # per-row dict is not needed
+    timings = {}
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    metrics[key.strip()] = value.strip()
-    except Exception as e:
-        pass
-    return metrics
+        lines = read_bytes(filepath).decode('utf-8', 'replace').splitlines()
+    except OSError:
+        return timings
+    if not lines:
+        return timings
+    
+    header = lines[0].split(',')
+    i_step = header.index('step') if 'step' in header else None
+    i_dur = header.index('duration_seconds') if 'duration_seconds' in header else None
+    for line in lines[1:]:
+        if not line:
+            continue
+        parts = line.split(',')
+        step = parts[i_step] if i_step is not None and i_step < len(parts) else ''
+        try:
+            timings[step] = int(parts[i_dur]) if i_dur is not None and i_dur < len(parts) else 0
+        except ValueError:
+            timings[step] = 0
+    return timings
 
 
-def parse_timing_csv(filepath):
-    timings = {}
+def _process_run_dir(run_dir):
+    """
+    Parse one run directory: (run_data, step durations). timing.csv is only
+    read for successful runs, and only its positive durations are kept.
+    """
+    metrics_file = os.path.join(run_dir, 'metrics.txt')
+    timing_file = os.path.join(run_dir, 'timing.csv')
+    
+    run_data = {
+        'run_id': os.path.basename(run_dir),
+        'status': 'UNKNOWN',
+        'duration': 0,
+    }
+    
+    # Both parsers return {} for a missing file, so no exists() probes
+    metrics = parse_metrics(metrics_file)
+    run_data['status'] = metrics.get('STATUS', 'UNKNOWN')
     try:
-        with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                step = row.get('step', '')
-                duration = row.get('duration_seconds', '0')
-                try:
-                    timings[step] = int(duration)
-                except:
-                    timings[step] = 0
+        run_data['duration'] = int(metrics.get('DURATION_SECONDS', 0))
     except:
-        pass
-    return timings
+        run_data['duration'] = 0
+    
+    if run_data['status'].upper() not in SUCCESS_STATUSES:
+        return run_data, []
+    steps = [(step, d) for step, d in parse_timing_csv(timing_file).items() if d > 0]
+    return run_data, steps
 
 
 def collect_platform_results(platform_name, base_dir):
@@ -71,55 +103,44 @@ def collect_platform_results(platform_name, base_dir):
         'runs': [],
         'successful_runs': 0,
         'failed_runs': 0,
-        'durations': [],
-        'step_durations': defaultdict(list),
+        # Packed int64 buffers; the stats read them without conversion
+        'durations': array.array('q'),
+        'step_durations': defaultdict(lambda: array.array('q')),
+        'overall_statistics': calculate_statistics(()),
     }
     
-    if not os.path.exists(base_dir):
+    # DirEntry caches the type from the directory listing: no stat per entry
+    try:
+        with os.scandir(base_dir) as it:
+            run_dirs = [e.path for e in it if e.name.startswith('scaled-') and e.is_dir()]
+    except FileNotFoundError:
         print(f"  Directory not found: {base_dir}")
         return results
     
-    run_dirs = glob.glob(os.path.join(base_dir, 'scaled-*'))
+    # Per-run parsing is small-file I/O; overlap it across threads
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        run_data_list = list(ex.map(_process_run_dir, run_dirs))
     
-    for run_dir in run_dirs:
-        if not os.path.isdir(run_dir):
-            continue
-        
-        run_id = os.path.basename(run_dir)
-        metrics_file = os.path.join(run_dir, 'metrics.txt')
-        timing_file = os.path.join(run_dir, 'timing.csv')
-        
-        run_data = {
-            'run_id': run_id,
-            'status': 'UNKNOWN',
-            'duration': 0,
-            'step_timings': {},
-        }
-        
-        if os.path.exists(metrics_file):
-            metrics = parse_metrics_file(metrics_file)
-            run_data['status'] = metrics.get('STATUS', 'UNKNOWN')
-            try:
-                run_data['duration'] = int(metrics.get('DURATION_SECONDS', 0))
-            except:
-                run_data['duration'] = 0
-        
-        if os.path.exists(timing_file):
-            run_data['step_timings'] = parse_timing_csv(timing_file)
-        
-        if run_data['status'].upper() in ['SUCCESS', 'SUCCEEDED']:
+    step_durations = results['step_durations']
+    for run_data, steps in run_data_list:
+        if run_data['status'].upper() in SUCCESS_STATUSES:
             results['successful_runs'] += 1
             if run_data['duration'] > 0:
                 results['durations'].append(run_data['duration'])
             
-            for step, duration in run_data['step_timings'].items():
-                if duration > 0:
-                    results['step_durations'][step].append(duration)
+            for step, duration in steps:
+                step_durations[step].append(duration)
         else:
             results['failed_runs'] += 1
         
         results['runs'].append(run_data)
     
+    # Computed once here; the CSV, JSON and console summary all reuse them
+    results['overall_statistics'] = calculate_statistics(results['durations'])
+    results['step_statistics'] = {
+        step: calculate_statistics(durations)
+        for step, durations in results['step_durations'].items()
+    }
     return results
 
 
@@ -127,38 +148,50 @@ def calculate_statistics(durations):
     if not durations:
         return {'count': 0, 'min': 0, 'max': 0, 'mean': 0, 'median': 0, 'stdev': 0, 'p95': 0, 'p99': 0}
     
+    # One sort, then a single Welford pass for mean/std plus the percentiles
+    arr = np.sort(np.frombuffer(durations, dtype=np.int64))
+    n = len(arr)
+    lo, hi, _, std_d, _, _, p50, _, p95, p99, _, _ = stats_and_iqr(arr)
+    # Exact integer sum: whole means stay ints, as statistics.mean returned them
+    total = int(arr.sum())
+    q, r = divmod(total, n)
+    mean_d = q if not r else total / n
+    # Odd counts keep the integer middle value, as statistics.median did
+    median = arr[n // 2].item() if n % 2 else float(p50)
+    
     return {
-        'count': len(durations),
-        'min': min(durations),
-        'max': max(durations),
-        'mean': round(mean(durations), 2),
-        'median': round(median(durations), 2),
-        'stdev': round(stdev(durations), 2) if len(durations) > 1 else 0,
-        'p95': round(percentile(durations, 95), 2),
-        'p99': round(percentile(durations, 99), 2),
+        'count': n,
+        'min': int(lo),
+        'max': int(hi),
+        'mean': round(mean_d, 2),
+        'median': round(median, 2),
+        'stdev': round(float(std_d), 2) if n > 1 else 0,
+        'p95': round(float(p95), 2),
+        'p99': round(float(p99), 2),
     }
 
 
 def generate_report(all_results, output_dir):
     # Summary CSV
     summary_file = os.path.join(output_dir, 'scaled_aggregate_report.csv')
-    with open(summary_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            'Platform', 'Total_Runs', 'Successful', 'Failed', 'Success_Rate_%',
-            'Min_s', 'Max_s', 'Mean_s', 'Median_s', 'StdDev_s', 'P95_s', 'P99_s'
-        ])
+    rows = [[
+        'Platform', 'Total_Runs', 'Successful', 'Failed', 'Success_Rate_%',
+        'Min_s', 'Max_s', 'Mean_s', 'Median_s', 'StdDev_s', 'P95_s', 'P99_s'
+    ]]
+    
+    for platform, results in all_results.items():
+        stats = results['overall_statistics']
+        total = results['successful_runs'] + results['failed_runs']
+        success_rate = (results['successful_runs'] / total * 100) if total > 0 else 0
         
-        for platform, results in all_results.items():
-            stats = calculate_statistics(results['durations'])
-            total = results['successful_runs'] + results['failed_runs']
-            success_rate = (results['successful_runs'] / total * 100) if total > 0 else 0
-            
-            writer.writerow([
-                platform, total, results['successful_runs'], results['failed_runs'],
-                round(success_rate, 2), stats['min'], stats['max'], stats['mean'],
-                stats['median'], stats['stdev'], stats['p95'], stats['p99']
-            ])
+        rows.append([
+            platform, total, results['successful_runs'], results['failed_runs'],
+            round(success_rate, 2), stats['min'], stats['max'], stats['mean'],
+            stats['median'], stats['stdev'], stats['p95'], stats['p99']
+        ])
+    
+    with open(summary_file, 'w', newline='', buffering=1 << 20) as f:
+        csv.writer(f).writerows(rows)
     
     print(f"Summary saved: {summary_file}")
     
@@ -171,40 +204,46 @@ def generate_report(all_results, output_dir):
     }
     
     for platform, results in all_results.items():
+        total = results['successful_runs'] + results['failed_runs']
         json_data['platforms'][platform] = {
-            'total_runs': len(results['runs']),
+            'total_runs': total,
             'successful_runs': results['successful_runs'],
             'failed_runs': results['failed_runs'],
-            'success_rate': (results['successful_runs'] / len(results['runs']) * 100) if results['runs'] else 0,
-            'overall_statistics': calculate_statistics(results['durations']),
-            'step_statistics': {
-                step: calculate_statistics(durations)
-                for step, durations in results['step_durations'].items()
-            }
+            'success_rate': (results['successful_runs'] / total * 100) if total else 0,
+            'overall_statistics': results['overall_statistics'],
+            'step_statistics': results['step_statistics'],
         }
     
-    with open(json_file, 'w') as f:
-        json.dump(json_data, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump(json_data, f, indent=2)
     
     print(f"Detailed JSON saved: {json_file}")
     return json_data
 
 
 def print_summary(all_results):
-    print("\n" + "=" * 90)
-    print("SCALED (2x) BENCHMARK AGGREGATION SUMMARY")
-    print("=" * 90)
-    print(f"{'Platform':<30} {'Runs':<8} {'Success%':<10} {'Mean(s)':<12} {'Median(s)':<12} {'P95(s)':<10}")
-    print("-" * 90)
+    # Built as one string and written once rather than a print() per row
+    lines = [
+        "\n" + "=" * 90,
+        "SCALED (2x) BENCHMARK AGGREGATION SUMMARY",
+        "=" * 90,
+        f"{'Platform':<30} {'Runs':<8} {'Success%':<10} {'Mean(s)':<12} {'Median(s)':<12} {'P95(s)':<10}",
+        "-" * 90,
+    ]
     
     for platform, results in all_results.items():
-        stats = calculate_statistics(results['durations'])
+        stats = results['overall_statistics']
         total = results['successful_runs'] + results['failed_runs']
         success_rate = (results['successful_runs'] / total * 100) if total > 0 else 0
         
-        print(f"{platform:<30} {total:<8} {success_rate:<10.1f} {stats['mean']:<12.1f} {stats['median']:<12.1f} {stats['p95']:<10.1f}")
+        lines.append(f"{platform:<30} {total:<8} {success_rate:<10.1f} {stats['mean']:<12.1f} {stats['median']:<12.1f} {stats['p95']:<10.1f}")
     
-    print("=" * 90)
+    lines.append("=" * 90)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
@@ -0,0 +1,42 @@
+"""
+Parsing helpers shared by the benchmark analysis scripts.
+Fully type-annotated so it can be compiled with mypyc:
+
+    mypyc benchmark_core.py
+
+The compiled extension is picked up ahead of this file by a plain
+`import benchmark_core`; without it this source runs as-is.
+"""
+
+import os
+import re
+from typing import Dict
+
+# KEY=VALUE lines of metrics.txt; lines starting with # are comments. The
+# surrounding whitespace is matched outside the groups, so no strip() needed
+_METRIC_LINE = re.compile(rb'^(?![ \t]*#)[ \t\r\f\v]*([^=\n]*?)[ \t\r\f\v]*=[ \t\r\f\v]*([^\n]*?)[ \t\r\f\v]*$',
+                          re.M)
+
+
+def read_bytes(path: str) -> bytes:
+    """Whole file via raw os.open/os.read: no buffered file object, fstat or isatty probe."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def parse_metrics(filepath: str) -> Dict[str, str]:
+    """KEY=VALUE pairs of a metrics.txt file ({} if it cannot be read)."""
+    try:
+        data = read_bytes(filepath)
+    except OSError:
+        return {}
+    return {key.decode('utf-8', 'replace'): value.decode('utf-8', 'replace')
+            for key, value in _METRIC_LINE.findall(data)}
@@ -8,8 +8,14 @@ import os
 import sys
 import json
 import csv
+import functools
 from datetime import datetime
-from statistics import mean, median, stdev
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Baseline (1x) JSON file
 BASELINE_1X_FILE = '/home/snu/kubernetes/comparison-logs/detailed_comparison.json'
@@ -40,10 +46,20 @@ PLATFORM_MAPPINGS = [
 ]
 
 
+@functools.lru_cache(maxsize=32)
+def _load_cached(filepath, mtime):
+    """Parsed JSON, cached per (path, mtime) so an unchanged file is read once."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
 def load_json_safe(filepath):
+    """Load a results JSON (shared cached object: do not mutate)."""
     if os.path.exists(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return _load_cached(filepath, os.path.getmtime(filepath))
     return {'platforms': {}}
 
 
@@ -76,8 +92,9 @@ def main():
         'comparisons': []
     }
     
-    print(f"\n{'Platform':<22} {'Scale':<8} {'Runs':<8} {'Mean(s)':<12} {'Median(s)':<12} {'Scaling':<10}")
-    print("-" * 80)
+    # Table rows are collected and written once after the loop
+    lines = [f"\n{'Platform':<22} {'Scale':<8} {'Runs':<8} {'Mean(s)':<12} {'Median(s)':<12} {'Scaling':<10}",
+             "-" * 80]
     
     for mapping in PLATFORM_MAPPINGS:
         platform_name = mapping['name']
@@ -107,10 +124,10 @@ def main():
         runs_2x_b = data_2x_baseline.get('total_runs', 0)
         runs_2x_h = data_2x_heft.get('total_runs', 0)
         
-        print(f"{platform_name:<22} {'1x':<8} {runs_1x:<8} {mean_1x:<12.1f} {stats_1x.get('median', 0):<12.1f} {'-':<10}")
-        print(f"{'':<22} {'2x':<8} {runs_2x_b:<8} {mean_2x_baseline:<12.1f} {stats_2x_baseline.get('median', 0):<12.1f} {scaling_baseline:<10.2f}x")
-        print(f"{'':<22} {'2x HEFT':<8} {runs_2x_h:<8} {mean_2x_heft:<12.1f} {stats_2x_heft.get('median', 0):<12.1f} {scaling_heft:<10.2f}x")
-        print("-" * 80)
+        lines.append(f"{platform_name:<22} {'1x':<8} {runs_1x:<8} {mean_1x:<12.1f} {stats_1x.get('median', 0):<12.1f} {'-':<10}")
+        lines.append(f"{'':<22} {'2x':<8} {runs_2x_b:<8} {mean_2x_baseline:<12.1f} {stats_2x_baseline.get('median', 0):<12.1f} {scaling_baseline:<10.2f}x")
+        lines.append(f"{'':<22} {'2x HEFT':<8} {runs_2x_h:<8} {mean_2x_heft:<12.1f} {stats_2x_heft.get('median', 0):<12.1f} {scaling_heft:<10.2f}x")
+        lines.append("-" * 80)
         
         comparison_results['comparisons'].append({
             'platform': platform_name,
@@ -136,33 +153,34 @@ def main():
             }
         })
     
+    sys.stdout.write('\n'.join(lines) + '\n')
+    
     # Save JSON
     json_file = os.path.join(output_dir, '1x_vs_2x_scale_comparison.json')
-    with open(json_file, 'w') as f:
-        json.dump(comparison_results, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(comparison_results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump(comparison_results, f, indent=2)
     print(f"\nJSON saved: {json_file}")
     
     # Save CSV
     csv_file = os.path.join(output_dir, '1x_vs_2x_scale_comparison.csv')
-    with open(csv_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Platform', 'Scale', 'Runs', 'Mean_s', 'Median_s', 'StdDev_s', 'Scaling_Factor'])
-        
-        for comp in comparison_results['comparisons']:
-            writer.writerow([comp['platform'], '1x', comp['1x']['runs'], 
-                           comp['1x']['mean'], comp['1x']['median'], comp['1x']['stdev'], '-'])
-            writer.writerow([comp['platform'], '2x', comp['2x_baseline']['runs'],
-                           comp['2x_baseline']['mean'], comp['2x_baseline']['median'], 
-                           comp['2x_baseline']['stdev'], comp['2x_baseline']['scaling_factor']])
-            writer.writerow([comp['platform'], '2x_HEFT', comp['2x_heft']['runs'],
-                           comp['2x_heft']['mean'], comp['2x_heft']['median'],
-                           comp['2x_heft']['stdev'], comp['2x_heft']['scaling_factor']])
+    rows = [['Platform', 'Scale', 'Runs', 'Mean_s', 'Median_s', 'StdDev_s', 'Scaling_Factor']]
+    for comp in comparison_results['comparisons']:
+        rows.append([comp['platform'], '1x', comp['1x']['runs'],
+                     comp['1x']['mean'], comp['1x']['median'], comp['1x']['stdev'], '-'])
+        for scale, key in (('2x', '2x_baseline'), ('2x_HEFT', '2x_heft')):
+            entry = comp[key]
+            rows.append([comp['platform'], scale, entry['runs'], entry['mean'], entry['median'],
+                         entry['stdev'], entry['scaling_factor']])
+    with open(csv_file, 'w', newline='', buffering=1 << 20) as f:
+        csv.writer(f).writerows(rows)
     print(f"CSV saved: {csv_file}")
     
     # Summary
-    print("\n" + "=" * 80)
-    print("SCALING ANALYSIS SUMMARY")
-    print("=" * 80)
+    lines = ["\n" + "=" * 80, "SCALING ANALYSIS SUMMARY", "=" * 80]
     
     for comp in comparison_results['comparisons']:
         platform = comp['platform']
@@ -176,13 +194,14 @@ def main():
         else:
             status = "❌ High overhead"
         
-        print(f"\n{platform}:")
-        print(f"  2x Baseline: {sf_baseline:.2f}x ({status})")
-        print(f"  2x HEFT: {sf_heft:.2f}x")
+        lines.append(f"\n{platform}:")
+        lines.append(f"  2x Baseline: {sf_baseline:.2f}x ({status})")
+        lines.append(f"  2x HEFT: {sf_heft:.2f}x")
         if sf_heft < sf_baseline:
-            print(f"  → HEFT improved scaling by {((sf_baseline - sf_heft) / sf_baseline * 100):.1f}%")
+            lines.append(f"  → HEFT improved scaling by {((sf_baseline - sf_heft) / sf_baseline * 100):.1f}%")
     
-    print("\n" + "=" * 80)
+    lines.append("\n" + "=" * 80)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 if __name__ == '__main__':
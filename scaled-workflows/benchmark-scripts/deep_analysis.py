@@ -9,13 +9,27 @@ import os
 import sys
 import json
 import csv
-import glob
 from datetime import datetime
-from statistics import mean, median, stdev, mode
+from statistics import fmean, median
 from collections import defaultdict, Counter
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# mypyc-compiled when built (see benchmark_core.py); else the source module
+from benchmark_core import parse_metrics
+
+# Prebuilt by build_stats_ext.py when available; else the (JIT) source version
+try:
+    from _stats_ext import stats_and_iqr
+except ImportError:
+    from _jit import stats_and_iqr
+
 # All data directories
 ALL_DIRS = {
     # 1x Baseline
@@ -39,97 +53,84 @@ ALL_DIRS = {
     'GitHubActions_2x_HEFT': '/home/snu/kubernetes/comparison-logs/github-actions-scaled-heft',
 }
 
-
-def percentile(data, p):
-    if not data:
-        return 0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * (p / 100)
-    f = int(k)
-    c = f + 1 if f + 1 < len(sorted_data) else f
-    return sorted_data[f] + (sorted_data[c] - sorted_data[f]) * (k - f)
-
-
-def iqr_outliers(data):
-    """Detect outliers using IQR method."""
+def iqr_outliers(data, lower, upper):
+    """Detect outliers using IQR method (data: sorted NumPy array, fences from stats_and_iqr)."""
     if len(data) < 4:
-        return [], data
-    
-    q1 = percentile(data, 25)
-    q3 = percentile(data, 75)
-    iqr = q3 - q1
-    
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
+        return [], data.tolist()
     
-    outliers = [x for x in data if x < lower or x > upper]
-    clean = [x for x in data if lower <= x <= upper]
+    # Single pass: one mask splits outliers from clean values
+    mask = (data >= lower) & (data <= upper)
     
-    return outliers, clean
+    return data[~mask].tolist(), data[mask].tolist()
 
 
-def parse_metrics(filepath):
-    metrics = {}
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    metrics[key.strip()] = value.strip()
-    except:
-        pass
-    return metrics
+def _read_run_metrics(run_dir):
+    """Metrics of one run directory, or None if it has no metrics.txt."""
+    metrics_file = os.path.join(run_dir, 'metrics.txt')
+    if not os.path.exists(metrics_file):
+        return None
+    return parse_metrics(metrics_file)
 
 
 def collect_data(name, dir_path):
     """Collect all data from a directory."""
-    if not os.path.exists(dir_path):
+    # DirEntry caches the type from the directory listing: no stat per entry
+    try:
+        with os.scandir(dir_path) as it:
+            run_dirs = [e.path for e in it if not e.name.startswith('.') and e.is_dir()]
+    except FileNotFoundError:
         return None
     
-    run_dirs = glob.glob(os.path.join(dir_path, '*'))
-    run_dirs = [d for d in run_dirs if os.path.isdir(d)]
-    
     durations = []
     statuses = []
     
-    for run_dir in run_dirs:
-        metrics_file = os.path.join(run_dir, 'metrics.txt')
-        if os.path.exists(metrics_file):
-            metrics = parse_metrics(metrics_file)
-            status = metrics.get('STATUS', 'UNKNOWN')
-            statuses.append(status)
-            
-            if status.upper() in ['SUCCESS', 'SUCCEEDED']:
-                try:
-                    duration = int(metrics.get('DURATION_SECONDS', 0))
-                    if duration > 0:
-                        durations.append(duration)
-                except:
-                    pass
+    # Per-run parsing is small-file I/O; overlap it across threads
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        run_metrics = list(ex.map(_read_run_metrics, run_dirs))
+    
+    for metrics in run_metrics:
+        if metrics is None:
+            continue
+        status = metrics.get('STATUS', 'UNKNOWN')
+        statuses.append(status)
+        
+        if status.upper() in ['SUCCESS', 'SUCCEEDED']:
+            try:
+                duration = int(metrics.get('DURATION_SECONDS', 0))
+                if duration > 0:
+                    durations.append(duration)
+            except:
+                pass
     
     if not durations:
         return None
     
-    outliers, clean = iqr_outliers(durations)
+    # One sort serves every statistic and the IQR split
+    arr = np.sort(np.asarray(durations, dtype=np.int64))
+    n = len(arr)
+    lo, hi, _, std_d, p5, p25, p50, p75, p95, _, lower, upper = stats_and_iqr(arr)
+    outliers, clean = iqr_outliers(arr, lower, upper)
+    # Exact integer sum: whole means stay ints, as statistics.mean returned them
+    total = sum(durations)
+    q, r = divmod(total, n)
     
     return {
         'name': name,
         'total_runs': len(run_dirs),
-        'successful': len(durations),
+        'successful': n,
         'durations': durations,
         'clean_durations': clean,
         'outliers': outliers,
-        'mean': mean(durations),
-        'median': median(durations),
-        'stdev': stdev(durations) if len(durations) > 1 else 0,
-        'min': min(durations),
-        'max': max(durations),
-        'p5': percentile(durations, 5),
-        'p25': percentile(durations, 25),
-        'p75': percentile(durations, 75),
-        'p95': percentile(durations, 95),
-        'clean_mean': mean(clean) if clean else 0,
+        'mean': q if not r else total / n,
+        'median': arr[n // 2].item() if n % 2 else float(p50),
+        'stdev': float(std_d) if n > 1 else 0,
+        'min': int(lo),
+        'max': int(hi),
+        'p5': float(p5),
+        'p25': float(p25),
+        'p75': float(p75),
+        'p95': float(p95),
+        'clean_mean': fmean(clean) if clean else 0,
         'clean_median': median(clean) if clean else 0,
     }
 
@@ -260,6 +261,12 @@ def generate_deep_analysis_report(all_data, output_dir):
 
 def create_box_plot(all_data, output_dir):
     """Create box plot comparison."""
+    # Imported here so the text report does not pay for matplotlib startup;
+    # Agg first skips interactive backend discovery
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
     fig, axes = plt.subplots(1, 3, figsize=(18, 8))
     fig.suptitle('Duration Distribution by Platform and Scale', fontsize=16, fontweight='bold')
     
@@ -267,19 +274,29 @@ def create_box_plot(all_data, output_dir):
     titles = ['Argo Workflows', 'Native Kubernetes', 'GitHub Actions']
     
     for ax, platform, title in zip(axes, platforms, titles):
-        data_to_plot = []
-        labels = []
+        # Box stats from collect_data (quartiles, IQR split) so matplotlib
+        # does not re-sort every series
+        bxpstats = []
         
         for variant in ['1x', '1x_HEFT', '2x', '2x_HEFT']:
             key = f"{platform}_{variant}"
             if key in all_data and all_data[key]:
-                data_to_plot.append(all_data[key]['durations'])
-                labels.append(variant)
+                data = all_data[key]
+                bxpstats.append({
+                    'label': variant,
+                    'med': data['median'],
+                    'q1': data['p25'],
+                    'q3': data['p75'],
+                    # Whiskers never end inside the box (matplotlib's rule)
+                    'whislo': min(data['clean_durations'][0], data['p25']),
+                    'whishi': max(data['clean_durations'][-1], data['p75']),
+                    'fliers': data['outliers'],
+                })
         
-        if data_to_plot:
-            bp = ax.boxplot(data_to_plot, labels=labels, patch_artist=True)
+        if bxpstats:
+            bp = ax.bxp(bxpstats, patch_artist=True)
             colors = ['#3498DB', '#2980B9', '#E74C3C', '#C0392B']
-            for patch, color in zip(bp['boxes'], colors[:len(data_to_plot)]):
+            for patch, color in zip(bp['boxes'], colors[:len(bxpstats)]):
                 patch.set_facecolor(color)
                 patch.set_alpha(0.7)
         
@@ -336,8 +353,12 @@ def main():
                 'outlier_count': len(data['outliers']),
             }
     
-    with open(json_file, 'w') as f:
-        json.dump(json_data, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump(json_data, f, indent=2)
     print(f"📄 JSON data saved: {json_file}")
 
 
@@ -4,13 +4,27 @@ GitHub Actions Anomaly Investigation Script
 Analyzes why GitHub Actions scaled workflows show faster times than baseline.
 """
 
+import io
 import os
 import sys
 import json
-import glob
+import math
+import mmap
+from contextlib import redirect_stdout
 from datetime import datetime
-from statistics import mean, median, stdev
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba-compiled when numba is installed
+from _jit import classify_durations
 
 # Directories to investigate
 GITHUB_DIRS = {
@@ -19,24 +33,201 @@ GITHUB_DIRS = {
     '2x_Scaled_HEFT': '/home/snu/kubernetes/comparison-logs/github-actions-scaled-heft',
 }
 
+# Parsed runs from the last investigation, keyed by run directory:
+# [metrics.txt mtime_ns, run_id, status, duration, start, end]
+RUN_CACHE_FILE = os.path.expanduser('~/.cache/gha_investigation.json')
+
+# The only metrics.txt keys this script reads (bytes: the file is parsed undecoded)
+METRIC_KEYS = (b'STATUS', b'DURATION_SECONDS', b'START_EPOCH', b'END_EPOCH')
+
+# Duration buckets: bucket i of classify_durations() is BUCKET_LABELS[i]
+BUCKET_EDGES = np.array([30, 120, 300, 600, 900], dtype=np.int64)
+BUCKET_LABELS = (
+    '< 30s (Likely Failed/Incomplete)',
+    '30s - 120s (Very Fast)',
+    '120s - 300s (Fast)',
+    '300s - 600s (Normal)',
+    '600s - 900s (Slow)',
+    '> 900s (Very Slow)',
+)
+
+# Histogram bars, one block per 5%: BARS[count * 20 // total]
+BARS = tuple('█' * i for i in range(21))
+
+
+def _build_metrics_parser(keys):
+    """
+    Generate a line parser specialized to keys: one unrolled if/elif branch
+    per key and local variables instead of a dict. It takes a readline
+    callable, stops once every key is seen and returns the stripped bytes
+    values in keys order (None for keys not found).
+    """
+    names = [f'v{i}' for i in range(len(keys))]
+    src = [
+        "def parse(readline):",
+        f"    {' = '.join(names)} = None",
+        "    for line in iter(readline, b''):",
+        "        key, sep, value = line.partition(b'=')",
+        "        if not sep:",
+        "            continue",
+        "        key = key.strip()",
+    ]
+    for i, key in enumerate(keys):
+        src.append(f"        {'elif' if i else 'if'} key == {key!r}:")
+        src.append(f"            v{i} = value.strip()")
+    src += [
+        "        else:",
+        "            continue",
+        f"        if {' and '.join(f'{v} is not None' for v in names)}:",
+        "            break",
+        f"    return {', '.join(names)}",
+    ]
+    namespace = {}
+    exec('\n'.join(src), namespace)
+    return namespace['parse']
+
+
+_parse_metric_lines = _build_metrics_parser(METRIC_KEYS)
+
 
 def parse_metrics_file(filepath):
-    """Parse a metrics.txt file."""
-    metrics = {}
+    """Raw values of METRIC_KEYS in a metrics.txt file, as stripped bytes (None if absent)."""
+    missing = (None,) * len(METRIC_KEYS)
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return missing
+    try:
+        size = os.fstat(fd).st_size
+        if not size:
+            return missing
+        # Memory-mapped and read as bytes: no text-mode decoding or newline
+        # translation
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            return _parse_metric_lines(mm.readline)
+    except OSError:
+        return missing
+    finally:
+        os.close(fd)
+
+
+class RunningStats:
+    """
+    Count, exact sum, min/max and Welford M2 of a stream of durations.
+    Partial stats from parallel workers are combined with merge().
+    """
+    __slots__ = ('n', 'total', 'mean', 'm2', 'min', 'max')
+    
+    def __init__(self):
+        self.n = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+    
+    def push(self, x):
+        self.n += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+    
+    def merge(self, other):
+        """Fold other into self (Chan et al. parallel variance update)."""
+        if not other.n:
+            return self
+        if not self.n:
+            for slot in self.__slots__:
+                setattr(self, slot, getattr(other, slot))
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    def stdev(self):
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+def load_run_cache():
+    """Run cache from the last investigation ({} if missing or unreadable)."""
+    try:
+        with open(RUN_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_run_cache(cache):
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    metrics[key.strip()] = value.strip()
-    except:
-        pass
-    return metrics
-
-
-def analyze_directory(name, dir_path):
-    """Analyze all runs in a directory."""
+        os.makedirs(os.path.dirname(RUN_CACHE_FILE), exist_ok=True)
+        with open(RUN_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"  ⚠️  Could not save run cache: {e}")
+
+
+def _parse_one_run(run_dir, old_cache, new_cache):
+    """
+    (run_id, status, duration, start, end) for one run directory, or None if
+    it has no metrics.txt. duration is None if unparseable; start and end are
+    None if either epoch is. Taken from old_cache when metrics.txt's mtime is
+    unchanged; either way the entry is recorded in new_cache.
+    """
+    metrics_file = os.path.join(run_dir, 'metrics.txt')
+    try:
+        mtime = os.stat(metrics_file).st_mtime_ns
+    except OSError:
+        return None
+    cached = old_cache.get(run_dir)
+    if cached and cached[0] == mtime:
+        run = tuple(cached[1:])
+    else:
+        run = _read_run(run_dir, metrics_file)
+    new_cache[run_dir] = [mtime, *run]
+    return run
+
+
+def _read_run(run_dir, metrics_file):
+    status, duration, start, end = parse_metrics_file(metrics_file)
+    
+    # int() parses the raw bytes directly; absent keys default as before
+    run_id = os.path.basename(run_dir)
+    status = status.decode('utf-8', 'replace') if status is not None else 'UNKNOWN'
+    try:
+        duration = int(duration) if duration is not None else 0
+    except ValueError:
+        return run_id, status, None, None, None
+    try:
+        start = int(start) if start is not None else 0
+        end = int(end) if end is not None else 0
+    except ValueError:
+        return run_id, status, duration, None, None
+    return run_id, status, duration, start, end
+
+
+def _scan_runs(run_dirs, old_cache, new_cache):
+    """Parse a chunk of run directories: (runs, RunningStats of their valid durations)."""
+    runs = []
+    stats = RunningStats()
+    for run_dir in run_dirs:
+        run = _parse_one_run(run_dir, old_cache, new_cache)
+        runs.append(run)
+        if run is not None and run[2] is not None:
+            stats.push(run[2])
+    return runs, stats
+
+
+def analyze_directory(name, dir_path, old_cache=None, new_cache=None):
+    """Analyze all runs in a directory (runs unchanged since old_cache are not re-read)."""
     print(f"\n{'='*70}")
     print(f"ANALYZING: {name}")
     print(f"Directory: {dir_path}")
@@ -46,165 +237,172 @@ def analyze_directory(name, dir_path):
         print(f"  ⚠️  Directory not found!")
         return None
     
-    # Find all run directories
-    run_dirs = glob.glob(os.path.join(dir_path, '*-gha-*'))
-    if not run_dirs:
-        run_dirs = glob.glob(os.path.join(dir_path, 'scaled-*'))
-    if not run_dirs:
-        run_dirs = [d for d in glob.glob(os.path.join(dir_path, '*')) if os.path.isdir(d)]
+    # Find all run directories: one scandir pass (DirEntry caches the type),
+    # then *-gha-* dirs, else scaled-* dirs, else every subdirectory
+    with os.scandir(dir_path) as it:
+        entries = [e for e in it if not e.name.startswith('.') and e.is_dir()]
+    run_dirs = ([e.path for e in entries if '-gha-' in e.name]
+                or [e.path for e in entries if e.name.startswith('scaled-')]
+                or [e.path for e in entries])
     
     print(f"\nFound {len(run_dirs)} run directories")
     
-    durations = []
-    statuses = []
-    start_epochs = []
-    end_epochs = []
-    run_details = []
+    status_counts = Counter()
     
-    for run_dir in sorted(run_dirs):
-        if not os.path.isdir(run_dir):
+    # Reading metrics.txt is I/O-bound, so contiguous chunks of the sorted
+    # runs are parsed on a thread pool. Each worker accumulates its own
+    # RunningStats while scanning; map() keeps the chunks in order
+    run_dirs = sorted(run_dirs)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    size = max(1, -(-len(run_dirs) // workers))
+    chunks = [run_dirs[i:i + size] for i in range(0, len(run_dirs), size)]
+    scan = partial(_scan_runs,
+                   old_cache=old_cache if old_cache is not None else {},
+                   new_cache=new_cache if new_cache is not None else {})
+    parsed = []
+    stats = RunningStats()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for runs, chunk_stats in ex.map(scan, chunks):
+            parsed.extend(runs)
+            stats.merge(chunk_stats)
+    
+    # Runs with a valid duration go into parallel columns, one slot each
+    # (durations only for the median; the other statistics come from stats)
+    n_max = len(parsed)
+    run_ids = [None] * n_max
+    statuses = np.empty(n_max, object)
+    durs = np.empty(n_max, np.int64)
+    starts = np.zeros(n_max, np.int64)
+    ends = np.zeros(n_max, np.int64)
+    timed = np.zeros(n_max, bool)  # both epochs parseable
+    n = 0
+    for run in parsed:
+        if run is None:
+            continue
+        run_id, status, duration, start, end = run
+        status_counts[status] += 1
+        if duration is None:
             continue
-            
-        run_id = os.path.basename(run_dir)
-        metrics_file = os.path.join(run_dir, 'metrics.txt')
-        
-        if os.path.exists(metrics_file):
-            metrics = parse_metrics_file(metrics_file)
-            
-            status = metrics.get('STATUS', 'UNKNOWN')
-            statuses.append(status)
-            
-            try:
-                duration = int(metrics.get('DURATION_SECONDS', 0))
-                durations.append(duration)
-                
-                start = int(metrics.get('START_EPOCH', 0))
-                end = int(metrics.get('END_EPOCH', 0))
-                start_epochs.append(start)
-                end_epochs.append(end)
-                
-                run_details.append({
-                    'run_id': run_id,
-                    'duration': duration,
-                    'status': status,
-                    'start': start,
-                    'end': end,
-                })
-            except:
-                pass
-    
-    if not durations:
+        run_ids[n] = run_id
+        statuses[n] = status
+        durs[n] = duration
+        if start is not None:
+            starts[n] = start
+            ends[n] = end
+            timed[n] = True
+        n += 1
+    
+    if not n:
         print("  ⚠️  No valid duration data found!")
         return None
     
+    durs, statuses, starts, ends, timed = durs[:n], statuses[:n], starts[:n], ends[:n], timed[:n]
+    # Exact integer sum: whole means stay ints, as statistics.mean returned them
+    q, r = divmod(stats.total, n)
+    mean_duration = q if not r else stats.total / n
+    # Odd counts keep the integer middle value, as statistics.median did
+    median_duration = np.partition(durs, n // 2)[n // 2].item() if n % 2 else float(np.median(durs))
+    n_statuses = sum(status_counts.values())
+    
     # Basic statistics
     print(f"\n📊 Duration Statistics:")
-    print(f"  Count: {len(durations)}")
-    print(f"  Min: {min(durations)}s")
-    print(f"  Max: {max(durations)}s")
-    print(f"  Mean: {mean(durations):.1f}s")
-    print(f"  Median: {median(durations):.1f}s")
-    if len(durations) > 1:
-        print(f"  StdDev: {stdev(durations):.1f}s")
+    print(f"  Count: {n}")
+    print(f"  Min: {stats.min}s")
+    print(f"  Max: {stats.max}s")
+    print(f"  Mean: {mean_duration:.1f}s")
+    print(f"  Median: {median_duration:.1f}s")
+    if n > 1:
+        print(f"  StdDev: {stats.stdev():.1f}s")
     
     # Status distribution
-    status_counts = Counter(statuses)
     print(f"\n📋 Status Distribution:")
     for status, count in status_counts.most_common():
-        pct = count / len(statuses) * 100
+        pct = count / n_statuses * 100
         print(f"  {status}: {count} ({pct:.1f}%)")
     
+    # Bucket counts and the <60s anomalies in one compiled pass
+    bucket_counts, n_fast, fast = classify_durations(durs, timed, BUCKET_EDGES, 60, 5)
+    
     # Duration distribution
     print(f"\n📈 Duration Distribution:")
     
-    buckets = {
-        '< 30s (Likely Failed/Incomplete)': 0,
-        '30s - 120s (Very Fast)': 0,
-        '120s - 300s (Fast)': 0,
-        '300s - 600s (Normal)': 0,
-        '600s - 900s (Slow)': 0,
-        '> 900s (Very Slow)': 0,
-    }
-    
-    for d in durations:
-        if d < 30:
-            buckets['< 30s (Likely Failed/Incomplete)'] += 1
-        elif d < 120:
-            buckets['30s - 120s (Very Fast)'] += 1
-        elif d < 300:
-            buckets['120s - 300s (Fast)'] += 1
-        elif d < 600:
-            buckets['300s - 600s (Normal)'] += 1
-        elif d < 900:
-            buckets['600s - 900s (Slow)'] += 1
-        else:
-            buckets['> 900s (Very Slow)'] += 1
-    
-    for bucket, count in buckets.items():
-        if count > 0:
-            pct = count / len(durations) * 100
-            bar = '█' * int(pct / 5)
-            print(f"  {bucket}: {count} ({pct:.1f}%) {bar}")
+    for bucket, count in zip(BUCKET_LABELS, bucket_counts):
+        if count:
+            print(f"  {bucket}: {count} ({count / n * 100:.1f}%) {BARS[count * 20 // n]}")
     
     # Identify anomalies
     print(f"\n🔍 Anomaly Detection:")
     
-    very_fast = [r for r in run_details if r['duration'] < 60]
-    if very_fast:
-        print(f"  ⚠️  {len(very_fast)} runs completed in < 60s (suspicious!):")
-        for r in very_fast[:5]:  # Show first 5
-            print(f"      - {r['run_id']}: {r['duration']}s ({r['status']})")
-        if len(very_fast) > 5:
-            print(f"      ... and {len(very_fast) - 5} more")
+    if n_fast:
+        print(f"  ⚠️  {n_fast} runs completed in < 60s (suspicious!):")
+        for i in fast:  # Show first 5
+            print(f"      - {run_ids[i]}: {durs[i]}s ({statuses[i]})")
+        if n_fast > 5:
+            print(f"      ... and {n_fast - 5} more")
     else:
         print(f"  ✅ No suspiciously fast runs")
     
     # Calculate actual workflow time vs recorded time
-    if start_epochs and end_epochs:
-        actual_durations = [e - s for s, e in zip(start_epochs, end_epochs) if s > 0 and e > 0]
-        if actual_durations:
-            print(f"\n⏱️  Time Analysis:")
-            print(f"  Recorded Mean: {mean(durations):.1f}s")
-            print(f"  Calculated Mean (end-start): {mean(actual_durations):.1f}s")
-            if abs(mean(durations) - mean(actual_durations)) > 60:
-                print(f"  ⚠️  Significant discrepancy detected!")
+    actual = (ends - starts)[(starts > 0) & (ends > 0)]
+    if actual.size:
+        mean_actual = actual.mean()
+        print(f"\n⏱️  Time Analysis:")
+        print(f"  Recorded Mean: {mean_duration:.1f}s")
+        print(f"  Calculated Mean (end-start): {mean_actual:.1f}s")
+        if abs(mean_duration - mean_actual) > 60:
+            print(f"  ⚠️  Significant discrepancy detected!")
     
     return {
         'name': name,
-        'count': len(durations),
-        'durations': durations,
-        'mean': mean(durations),
-        'median': median(durations),
+        'count': n,
+        'durations': durs.tolist(),
+        'mean': mean_duration,
+        'median': median_duration,
         'status_counts': dict(status_counts),
-        'anomalies': len(very_fast),
+        'anomalies': n_fast,
     }
 
 
+def _analyze_in_worker(name, dir_path, old_cache):
+    """
+    analyze_directory() for a worker process: returns (printed report,
+    result, cache entries) so the parent can print reports in order and
+    merge the run caches.
+    """
+    new_cache = {}
+    out = io.StringIO()
+    with redirect_stdout(out):
+        data = analyze_directory(name, dir_path, old_cache, new_cache)
+    return out.getvalue(), data, new_cache
+
+
 def compare_results(results):
     """Compare results across all directories."""
-    print(f"\n{'='*70}")
-    print("COMPARISON SUMMARY")
-    print(f"{'='*70}")
+    # Collected and written once at the end instead of a print() per line
+    out = []
+    out.append(f"\n{'='*70}")
+    out.append("COMPARISON SUMMARY")
+    out.append(f"{'='*70}")
     
     for name, data in results.items():
         if data:
             anomaly_pct = data['anomalies'] / data['count'] * 100 if data['count'] > 0 else 0
-            print(f"\n{name}:")
-            print(f"  Runs: {data['count']}")
-            print(f"  Mean: {data['mean']:.1f}s")
-            print(f"  Median: {data['median']:.1f}s")
-            print(f"  Anomalies (<60s): {data['anomalies']} ({anomaly_pct:.1f}%)")
+            out.append(f"\n{name}:")
+            out.append(f"  Runs: {data['count']}")
+            out.append(f"  Mean: {data['mean']:.1f}s")
+            out.append(f"  Median: {data['median']:.1f}s")
+            out.append(f"  Anomalies (<60s): {data['anomalies']} ({anomaly_pct:.1f}%)")
     
     # Diagnosis
-    print(f"\n{'='*70}")
-    print("DIAGNOSIS")
-    print(f"{'='*70}")
+    out.append(f"\n{'='*70}")
+    out.append("DIAGNOSIS")
+    out.append(f"{'='*70}")
     
     heft_data = results.get('2x_Scaled_HEFT')
     if heft_data and heft_data['anomalies'] > 0:
         anomaly_pct = heft_data['anomalies'] / heft_data['count'] * 100
         if anomaly_pct > 30:
-            print(f"""
+            out.append(f"""
 🔴 HIGH ANOMALY RATE DETECTED in 2x Scaled HEFT ({anomaly_pct:.1f}%)
 
 Possible Causes:
@@ -220,7 +418,7 @@ Recommendations:
 4. Check if timing.csv is being populated correctly
 """)
         elif anomaly_pct > 10:
-            print(f"""
+            out.append(f"""
 🟡 MODERATE ANOMALY RATE in 2x Scaled HEFT ({anomaly_pct:.1f}%)
 
 Some runs are completing faster than expected. This could be due to:
@@ -229,7 +427,7 @@ Some runs are completing faster than expected. This could be due to:
 3. Network/cluster performance variations
 """)
         else:
-            print(f"""
+            out.append(f"""
 🟢 LOW ANOMALY RATE - Results appear valid
 
 The GitHub Actions workflows are executing as expected.
@@ -240,7 +438,7 @@ The GitHub Actions workflows are executing as expected.
     
     if baseline_data and scaled_data:
         if scaled_data['mean'] < baseline_data['mean']:
-            print(f"""
+            out.append(f"""
 🔴 SCALING ANOMALY DETECTED
 
 2x Scaled ({scaled_data['mean']:.1f}s) is FASTER than 1x Baseline ({baseline_data['mean']:.1f}s)!
@@ -254,6 +452,8 @@ Likely Explanations:
 3. 1x Baseline includes additional overhead not in 2x Scaled
 4. Data collection timing differs between the two
 """)
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
@@ -263,10 +463,27 @@ def main():
     print(f"Investigation Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     results = {}
+    old_cache = load_run_cache()
+    new_cache = {}  # only runs seen this time, so deleted runs drop out
+    
+    # The directories are independent, so each is analyzed in its own
+    # process (with only its slice of the run cache); reports are printed
+    # in GITHUB_DIRS order once all are done
+    with ProcessPoolExecutor(max_workers=len(GITHUB_DIRS)) as ex:
+        futures = {
+            name: ex.submit(_analyze_in_worker, name, dir_path,
+                            {k: v for k, v in old_cache.items() if k.startswith(dir_path + os.sep)})
+            for name, dir_path in GITHUB_DIRS.items()
+        }
+        reports = []
+        for name, future in futures.items():
+            report_text, data, cache_entries = future.result()
+            reports.append(report_text)
+            results[name] = data
+            new_cache.update(cache_entries)
+    sys.stdout.write(''.join(reports))
     
-    for name, dir_path in GITHUB_DIRS.items():
-        data = analyze_directory(name, dir_path)
-        results[name] = data
+    save_run_cache(new_cache)
     
     compare_results(results)
     
@@ -287,8 +504,12 @@ def main():
                 'status_counts': data['status_counts'],
             }
     
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
     
     print(f"\n📄 Investigation report saved: {report_file}")
 
@@ -4,35 +4,27 @@
 Compares all 4 platforms at 4x scale with Pegasus data.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Benchmark Data (update with actual results after running)
-BENCHMARK_DATA = {
-    # Existing data (1x, 2x)
-    'Argo Workflows': {
-        '1x': {'mean': 142.95, 'std': 10.19, 'jobs': 8},
-        '2x': {'mean': 168.85, 'std': 21.00, 'jobs': 14},
-        '4x': {'mean': None, 'std': None, 'jobs': 28},  # To be filled
-    },
-    'Native K8s': {
-        '1x': {'mean': 142.60, 'std': 25.34, 'jobs': 8},
-        '2x': {'mean': 170.05, 'std': 23.61, 'jobs': 14},
-        '4x': {'mean': None, 'std': None, 'jobs': 28},  # To be filled
-    },
-    'GitHub Actions': {
-        '1x': {'mean': 219.10, 'std': 54.33, 'jobs': 8},
-        '2x': {'mean': 261.10, 'std': 74.91, 'jobs': 14},
-        '4x': {'mean': None, 'std': None, 'jobs': 28},  # To be filled
-    },
-    'Pegasus WMS': {
-        '1x': {'mean': 143.45, 'std': 16.68, 'jobs': 7},
-        '2x': {'mean': 165.95, 'std': 13.68, 'jobs': 14},
-        '4x': {'mean': 174.30, 'std': 15.95, 'jobs': 28},  # Already have this!
-    },
-}
+PLATFORMS = ('Argo Workflows', 'Native K8s', 'GitHub Actions', 'Pegasus WMS')
+SCALES = ('1x', '2x', '4x')
+PLATFORM_IDX = {p: i for i, p in enumerate(PLATFORMS)}
+SCALE_IDX = {s: i for i, s in enumerate(SCALES)}
+
+# Benchmark Data (update with actual results after running): one
+# (mean, std, jobs) record per [platform, scale]; NaN mean = no data yet
+BENCHMARK_DTYPE = np.dtype([('mean', 'f8'), ('std', 'f8'), ('jobs', 'i4')])
+BENCHMARK_DATA = np.array([
+    #  1x                    2x                     4x
+    [(142.95, 10.19, 8), (168.85, 21.00, 14), (np.nan, np.nan, 28)],  # Argo Workflows (4x to be filled)
+    [(142.60, 25.34, 8), (170.05, 23.61, 14), (np.nan, np.nan, 28)],  # Native K8s (4x to be filled)
+    [(219.10, 54.33, 8), (261.10, 74.91, 14), (np.nan, np.nan, 28)],  # GitHub Actions (4x to be filled)
+    [(143.45, 16.68, 7), (165.95, 13.68, 14), (174.30, 15.95, 28)],   # Pegasus WMS
+], dtype=BENCHMARK_DTYPE)
 
 COLORS = {
     'Argo Workflows': '#FF6B6B',
@@ -41,6 +33,12 @@ COLORS = {
     'Pegasus WMS': '#96CEB4',
 }
 
+# COLORS as RGBA float tuples (what matplotlib's to_rgba gives for '#RRGGBB'),
+# converted once here so the bar calls skip hex parsing; done by hand to keep
+# matplotlib out of module import
+COLORS_RGBA = {p: tuple(int(c[i:i + 2], 16) / 255 for i in (1, 3, 5)) + (1.0,)
+               for p, c in COLORS.items()}
+
 OUTPUT_DIR = '/home/snu/kubernetes/comparison-logs/4x-comparison'
 
 
@@ -49,23 +47,29 @@ def load_benchmark_results(csv_path, platform_key):
     if not os.path.exists(csv_path):
         return None
     
-    import csv
-    durations = []
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get('status', '').lower() in ['succeeded', 'success']:
-                try:
-                    durations.append(float(row['duration_seconds']))
-                except:
-                    pass
-    
-    if durations:
+    # Both columns parsed by NumPy in one call; unparseable durations come
+    # back as NaN and short rows are dropped (invalid_raise=False)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            data = np.genfromtxt(csv_path, delimiter=',', names=True, encoding='utf-8',
+                                 usecols=('status', 'duration_seconds'),
+                                 dtype=[('status', 'U32'), ('duration_seconds', 'f8')],
+                                 invalid_raise=False)
+    except (ValueError, IndexError):  # missing columns / empty file
+        return None
+    data = np.atleast_1d(data)
+    
+    durations = data['duration_seconds']
+    mask = np.isin(np.char.lower(data['status']), ('succeeded', 'success')) & ~np.isnan(durations)
+    durations = durations[mask]
+    
+    if durations.size:
         return {
-            'mean': np.mean(durations),
-            'std': np.std(durations),
+            'mean': durations.mean(),
+            'std': durations.std(),
             'jobs': 28,
-            'runs': len(durations)
+            'runs': int(durations.size)
         }
     return None
 
@@ -78,35 +82,36 @@ def update_data_from_files():
         'GitHub Actions': '/home/snu/kubernetes/comparison-logs/github-actions-4x/benchmark_summary.csv',
     }
     
-    for platform, path in paths.items():
-        result = load_benchmark_results(path, platform)
+    # The CSVs live in separate directories (possibly on network storage),
+    # so they are read concurrently; results are applied in platform order
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        futures = {platform: ex.submit(load_benchmark_results, path, platform)
+                   for platform, path in paths.items()}
+    
+    for platform, future in futures.items():
+        result = future.result()
         if result:
-            BENCHMARK_DATA[platform]['4x'] = result
+            BENCHMARK_DATA[PLATFORM_IDX[platform], SCALE_IDX['4x']] = (
+                result['mean'], result['std'], result['jobs'])
             print(f"Loaded {platform} 4x: mean={result['mean']:.1f}s, std={result['std']:.1f}s")
 
 
-def create_4x_comparison_chart():
+def create_4x_comparison_chart(fig):
     """Create bar chart comparing all platforms at 4x scale."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig.clf()
+    fig.set_size_inches(12, 7)
+    ax = fig.subplots()
     
-    platforms = list(BENCHMARK_DATA.keys())
+    platforms = list(PLATFORMS)
     x = np.arange(len(platforms))
     
-    means = []
-    stds = []
-    colors = []
-    
-    for p in platforms:
-        data = BENCHMARK_DATA[p]['4x']
-        if data and data['mean']:
-            means.append(data['mean'])
-            stds.append(data['std'] or 0)
-        else:
-            means.append(0)
-            stds.append(0)
-        colors.append(COLORS[p])
+    data = BENCHMARK_DATA[:, SCALE_IDX['4x']]
+    present = np.isfinite(data['mean'])
+    means = np.where(present, data['mean'], 0)
+    stds = np.where(present, np.nan_to_num(data['std']), 0)
+    colors = [COLORS_RGBA[p] for p in platforms]
     
     bars = ax.bar(x, means, yerr=stds, color=colors, capsize=5, alpha=0.8)
     
@@ -126,30 +131,24 @@ def create_4x_comparison_chart():
             ax.text(bar.get_x() + bar.get_width()/2, 10,
                     'N/A', ha='center', va='bottom', fontsize=10, color='gray')
     
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}/4x_platform_comparison.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{OUTPUT_DIR}/4x_platform_comparison.png', dpi=150)
     print(f"Created: {OUTPUT_DIR}/4x_platform_comparison.png")
 
 
-def create_scaling_comparison():
+def create_scaling_comparison(fig):
     """Create chart showing scaling from 1x to 4x."""
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig.clf()
+    fig.set_size_inches(14, 8)
+    ax = fig.subplots()
     
-    scales = ['1x', '2x', '4x']
-    x = np.arange(len(scales))
+    x = np.arange(len(SCALES))
     width = 0.2
     
-    for i, (platform, data) in enumerate(BENCHMARK_DATA.items()):
-        means = []
-        for scale in scales:
-            if data[scale] and data[scale]['mean']:
-                means.append(data[scale]['mean'])
-            else:
-                means.append(0)
-        
+    all_means = np.nan_to_num(BENCHMARK_DATA['mean'])  # missing -> 0-height bar
+    for i, (platform, means) in enumerate(zip(PLATFORMS, all_means)):
         offset = (i - 1.5) * width
-        bars = ax.bar(x + offset, means, width, label=platform, color=COLORS[platform], alpha=0.8)
+        bars = ax.bar(x + offset, means, width, label=platform, color=COLORS_RGBA[platform], alpha=0.8)
     
     ax.set_xlabel('Scale', fontsize=12, fontweight='bold')
     ax.set_ylabel('Duration (seconds)', fontsize=12, fontweight='bold')
@@ -159,29 +158,25 @@ def create_scaling_comparison():
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{OUTPUT_DIR}/scaling_comparison_all.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{OUTPUT_DIR}/scaling_comparison_all.png', dpi=150)
     print(f"Created: {OUTPUT_DIR}/scaling_comparison_all.png")
 
 
-def create_efficiency_analysis():
+def create_efficiency_analysis(fig):
     """Analyze scaling efficiency across platforms."""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    platforms = []
-    efficiency_1x_4x = []
-    colors = []
-    
-    for platform, data in BENCHMARK_DATA.items():
-        if data['1x']['mean'] and data['4x'] and data['4x']['mean']:
-            platforms.append(platform)
-            # Efficiency: (4x jobs / 1x jobs) / (4x time / 1x time) * 100
-            job_ratio = 28 / data['1x']['jobs']
-            time_ratio = data['4x']['mean'] / data['1x']['mean']
-            efficiency = (job_ratio / time_ratio) * 100
-            efficiency_1x_4x.append(efficiency)
-            colors.append(COLORS[platform])
+    fig.clf()
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+    
+    d1 = BENCHMARK_DATA[:, SCALE_IDX['1x']]
+    d4 = BENCHMARK_DATA[:, SCALE_IDX['4x']]
+    present = np.isfinite(d1['mean']) & np.isfinite(d4['mean'])
+    
+    # Efficiency: (4x jobs / 1x jobs) / (4x time / 1x time) * 100
+    efficiency_1x_4x = ((28 / d1['jobs']) / (d4['mean'] / d1['mean']) * 100)[present]
+    platforms = [p for p, ok in zip(PLATFORMS, present) if ok]
+    colors = [COLORS_RGBA[p] for p in platforms]
     
     if platforms:
         bars = ax.bar(platforms, efficiency_1x_4x, color=colors, alpha=0.8)
@@ -199,9 +194,8 @@ def create_efficiency_analysis():
             ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 5,
                     f'{eff:.0f}%', ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(f'{OUTPUT_DIR}/efficiency_analysis_4x.png', dpi=150)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{OUTPUT_DIR}/efficiency_analysis_4x.png', dpi=150)
         print(f"Created: {OUTPUT_DIR}/efficiency_analysis_4x.png")
 
 
@@ -213,14 +207,12 @@ def print_summary():
     print(f"\n{'Platform':<20} {'1x Mean':<12} {'2x Mean':<12} {'4x Mean':<12} {'Scaling':<10}")
     print("-"*80)
     
-    for platform, data in BENCHMARK_DATA.items():
-        m1 = f"{data['1x']['mean']:.1f}s" if data['1x']['mean'] else "N/A"
-        m2 = f"{data['2x']['mean']:.1f}s" if data['2x']['mean'] else "N/A"
-        m4 = f"{data['4x']['mean']:.1f}s" if data['4x'] and data['4x']['mean'] else "N/A"
+    for platform, row in zip(PLATFORMS, BENCHMARK_DATA['mean']):
+        mean_1x, mean_4x = row[SCALE_IDX['1x']], row[SCALE_IDX['4x']]
+        m1, m2, m4 = (f"{m:.1f}s" if np.isfinite(m) else "N/A" for m in row)
         
-        if data['1x']['mean'] and data['4x'] and data['4x']['mean']:
-            scaling = data['4x']['mean'] / data['1x']['mean']
-            scaling_str = f"{scaling:.2f}x"
+        if np.isfinite(mean_1x) and np.isfinite(mean_4x):
+            scaling_str = f"{mean_4x / mean_1x:.2f}x"
         else:
             scaling_str = "N/A"
         
@@ -236,9 +228,16 @@ def main():
     update_data_from_files()
     
     print("\nGenerating visualizations...")
-    create_4x_comparison_chart()
-    create_scaling_comparison()
-    create_efficiency_analysis()
+    # matplotlib is imported only here, so importing this module (e.g. for
+    # BENCHMARK_DATA) does not pay for it. One Agg figure is cleared and
+    # reused by every chart instead of a pyplot figure per chart
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    create_4x_comparison_chart(fig)
+    create_scaling_comparison(fig)
+    create_efficiency_analysis(fig)
     
     print_summary()
     
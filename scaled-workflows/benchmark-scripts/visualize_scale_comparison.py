@@ -4,16 +4,65 @@
 Creates charts comparing baseline (1x) vs scaled (2x) workflow performance.
 """
 
+import io
 import os
 import sys
 import json
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # PNG output only: skip GUI backend probing
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
 
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['figure.figsize'] = (14, 10)
-plt.rcParams['font.size'] = 12
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from _jit import scaling_metrics
+
+# The seaborn-v0_8-whitegrid style inlined, plus this script's own settings,
+# so start-up does not read and parse a style file
+plt.rcParams.update({
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 1.0,
+    'figure.facecolor': 'white',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'image.cmap': 'Greys',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0,
+    'figure.figsize': (14, 10),
+    'font.size': 12,
+})
+
+# Resolution of the per-topic charts (the summary dashboard stays at 150 dpi)
+DPI = int(os.environ.get('CHART_DPI', '100'))
+# zlib level for the PNG writer (Pillow defaults to 6): these are developer
+# charts, so trade a slightly larger file for much faster encoding
+PNG_PIL_KWARGS = {'compress_level': 1}
+# Each chart sets fixed subplot margins (calibrated once against tight_layout)
+# and saves the whole figure, so no layout pass runs per chart
 
 COLORS_1X = '#3498DB'  # Blue for 1x
 COLORS_2X = '#E74C3C'  # Red for 2x baseline
@@ -21,13 +70,62 @@ COLORS_2X_HEFT = '#2ECC71'  # Green for 2x HEFT
 
 
 def load_data(base_dir):
+    """Load the comparison report, keeping only the columns the charts read (see _extract_soa)."""
     json_file = os.path.join(base_dir, '1x_vs_2x_scale_comparison.json')
     if not os.path.exists(json_file):
         print(f"Error: {json_file} not found. Run compare_1x_vs_2x_scale.py first.")
         sys.exit(1)
     
-    with open(json_file, 'r') as f:
-        return json.load(f)
+    if ORJSON_AVAILABLE:
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+    return _extract_soa(data['comparisons'])
+
+
+def _extract_soa(comparisons):
+    """
+    One pass over data['comparisons'] into parallel columns shared by every
+    plot: platform names plus NumPy arrays of the 1x / 2x / 2x HEFT means and
+    medians, the two scaling factors, and the HEFT improvement and scaling
+    efficiencies derived from them (_jit.scaling_metrics).
+    """
+    cols = {key: [] for key in ('platform', 'mean_1x', 'median_1x', 'mean_2x', 'median_2x',
+                                'mean_2x_heft', 'median_2x_heft', 'sf_2x', 'sf_2x_heft')}
+    for c in comparisons:
+        c1, c2, ch = c['1x'], c['2x_baseline'], c['2x_heft']
+        cols['platform'].append(c['platform'])
+        cols['mean_1x'].append(c1['mean'])
+        cols['median_1x'].append(c1['median'])
+        cols['mean_2x'].append(c2['mean'])
+        cols['median_2x'].append(c2['median'])
+        cols['mean_2x_heft'].append(ch['mean'])
+        cols['median_2x_heft'].append(ch['median'])
+        cols['sf_2x'].append(c2['scaling_factor'])
+        cols['sf_2x_heft'].append(ch['scaling_factor'])
+    soa = {key: vals if key == 'platform' else np.array(vals, dtype=float)
+           for key, vals in cols.items()}
+    soa['heft_improvement'], soa['eff_2x'], soa['eff_2x_heft'] = scaling_metrics(soa['sf_2x'], soa['sf_2x_heft'])
+    return soa
+
+
+_FIG = None
+
+
+def _init_worker():
+    """Pool initializer: one figure per worker process, reused for each chart it renders."""
+    global _FIG
+    _FIG = plt.figure()
+
+
+def _render_in_worker(plot, soa, output_dir):
+    """Run one plot_* function in a pool worker and return what it printed."""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        plot(_FIG, soa, output_dir)
+    return out.getvalue()
 
 
 def create_output_dir(base_dir):
@@ -36,56 +134,82 @@ def create_output_dir(base_dir):
     return output_dir
 
 
-def plot_mean_comparison(data, output_dir):
-    """Create grouped bar chart comparing mean durations."""
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    platforms = [c['platform'] for c in data['comparisons']]
-    means_1x = [c['1x']['mean'] for c in data['comparisons']]
-    means_2x = [c['2x_baseline']['mean'] for c in data['comparisons']]
-    means_2x_heft = [c['2x_heft']['mean'] for c in data['comparisons']]
-    
-    x = np.arange(len(platforms))
+_SUBPLOT_PARAMS = ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+
+
+def _reset_figure(fig, width, height):
+    """
+    Blank the shared figure for the next chart. clear() keeps the subplot
+    params the previous chart set, so put back the rc defaults.
+    """
+    fig.clear()
+    fig.set_size_inches(width, height)
+    fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}'] for k in _SUBPLOT_PARAMS})
+
+
+def _draw_mean_bars(ax, soa, *, compact=False):
+    """
+    Grouped 1x / 2x / 2x HEFT mean-duration bars, shared by the standalone
+    chart and the dashboard panel. compact=True is the dashboard variant:
+    short legend labels, opaque bars and no value labels. Returns the group
+    positions for the caller's ticks.
+    """
+    x = np.arange(len(soa['platform']))
     width = 0.25
+    labels = ('1x', '2x', '2x HEFT') if compact else ('1x Baseline', '2x Scaled', '2x HEFT')
+    for offset, heights, label, color in zip((-width, 0.0, width),
+                                             (soa['mean_1x'], soa['mean_2x'], soa['mean_2x_heft']),
+                                             labels, (COLORS_1X, COLORS_2X, COLORS_2X_HEFT)):
+        bars = ax.bar(x + offset, heights, width, label=label, color=color, alpha=None if compact else 0.85)
+        if not compact:
+            # Value labels (none on empty bars)
+            ax.bar_label(bars, labels=[f'{h:.0f}s' if h > 0 else '' for h in heights],
+                         padding=3, fontsize=9, fontweight='bold')
+    return x
+
+
+def _draw_scaling_bars(ax, soa, height, *, compact=False):
+    """
+    Paired horizontal 2x / 2x HEFT scaling-factor bars, shared by the
+    standalone chart and the dashboard panel (compact=True: opaque bars).
+    Returns the group positions for the caller's ticks.
+    """
+    y = np.arange(len(soa['platform']))
+    alpha = None if compact else 0.85
+    ax.barh(y - height/2, soa['sf_2x'], height, label='2x Baseline', color=COLORS_2X, alpha=alpha)
+    ax.barh(y + height/2, soa['sf_2x_heft'], height, label='2x HEFT', color=COLORS_2X_HEFT, alpha=alpha)
+    return y
+
+
+def plot_mean_comparison(fig, soa, output_dir):
+    """Create grouped bar chart comparing mean durations."""
+    _reset_figure(fig, 12, 7)
+    ax = fig.subplots()
     
-    bars1 = ax.bar(x - width, means_1x, width, label='1x Baseline', color=COLORS_1X, alpha=0.85)
-    bars2 = ax.bar(x, means_2x, width, label='2x Scaled', color=COLORS_2X, alpha=0.85)
-    bars3 = ax.bar(x + width, means_2x_heft, width, label='2x HEFT', color=COLORS_2X_HEFT, alpha=0.85)
+    x = _draw_mean_bars(ax, soa)
     
     ax.set_ylabel('Mean Duration (seconds)', fontsize=12)
     ax.set_title('1x vs 2x Scale: Mean Execution Time Comparison', fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels(platforms, fontsize=11)
+    ax.set_xticklabels(soa['platform'], fontsize=11)
     ax.legend(fontsize=11)
     ax.yaxis.grid(True, linestyle='--', alpha=0.7)
     
-    # Add value labels
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2, height + 10, 
-                       f'{height:.0f}s', ha='center', fontsize=9, fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '01_scale_mean_comparison.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.94, bottom=0.06)
+    fig.savefig(os.path.join(output_dir, '01_scale_mean_comparison.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 01_scale_mean_comparison.png")
 
 
-def plot_scaling_factor(data, output_dir):
+def plot_scaling_factor(fig, soa, output_dir):
     """Create horizontal bar chart showing scaling factors."""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    _reset_figure(fig, 12, 6)
+    ax = fig.subplots()
     
-    platforms = [c['platform'] for c in data['comparisons']]
-    scaling_2x = [c['2x_baseline']['scaling_factor'] for c in data['comparisons']]
-    scaling_2x_heft = [c['2x_heft']['scaling_factor'] for c in data['comparisons']]
+    platforms = soa['platform']
+    scaling_2x, scaling_2x_heft = soa['sf_2x'], soa['sf_2x_heft']
     
-    y = np.arange(len(platforms))
     height = 0.35
-    
-    bars1 = ax.barh(y - height/2, scaling_2x, height, label='2x Baseline', color=COLORS_2X, alpha=0.85)
-    bars2 = ax.barh(y + height/2, scaling_2x_heft, height, label='2x HEFT', color=COLORS_2X_HEFT, alpha=0.85)
+    y = _draw_scaling_bars(ax, soa, height)
     
     # Add ideal line at 2.0
     ax.axvline(x=2.0, color='black', linestyle='--', linewidth=2, label='Ideal (2.0x)')
@@ -99,28 +223,27 @@ def plot_scaling_factor(data, output_dir):
     ax.xaxis.grid(True, linestyle='--', alpha=0.7)
     
     # Add value labels
+    _text = ax.text
     for i, (s1, s2) in enumerate(zip(scaling_2x, scaling_2x_heft)):
-        ax.text(s1 + 0.1, i - height/2, f'{s1:.2f}x', va='center', fontsize=10, fontweight='bold')
-        ax.text(s2 + 0.1, i + height/2, f'{s2:.2f}x', va='center', fontsize=10, fontweight='bold')
+        _text(s1 + 0.1, i - height/2, f'{s1:.2f}x', va='center', fontsize=10, fontweight='bold')
+        _text(s2 + 0.1, i + height/2, f'{s2:.2f}x', va='center', fontsize=10, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '02_scaling_factor_analysis.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.16, right=0.97, top=0.93, bottom=0.11)
+    fig.savefig(os.path.join(output_dir, '02_scaling_factor_analysis.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 02_scaling_factor_analysis.png")
 
 
-def plot_per_platform_comparison(data, output_dir):
+def plot_per_platform_comparison(fig, soa, output_dir):
     """Create individual comparison for each platform."""
-    fig, axes = plt.subplots(1, 3, figsize=(16, 6))
+    _reset_figure(fig, 16, 6)
+    axes = fig.subplots(1, 3)
     fig.suptitle('Platform-by-Platform Scale Comparison', fontsize=16, fontweight='bold')
     
-    for ax, comp in zip(axes, data['comparisons']):
-        platform = comp['platform']
-        
+    for i, (ax, platform) in enumerate(zip(axes, soa['platform'])):
         categories = ['Mean', 'Median', 'P95*']
-        vals_1x = [comp['1x']['mean'], comp['1x']['median'], comp['1x']['mean'] * 1.2]  # Approximate P95
-        vals_2x = [comp['2x_baseline']['mean'], comp['2x_baseline']['median'], comp['2x_baseline']['mean'] * 1.2]
-        vals_2x_heft = [comp['2x_heft']['mean'], comp['2x_heft']['median'], comp['2x_heft']['mean'] * 1.2]
+        vals_1x = [soa['mean_1x'][i], soa['median_1x'][i], soa['mean_1x'][i] * 1.2]  # Approximate P95
+        vals_2x = [soa['mean_2x'][i], soa['median_2x'][i], soa['mean_2x'][i] * 1.2]
+        vals_2x_heft = [soa['mean_2x_heft'][i], soa['median_2x_heft'][i], soa['mean_2x_heft'][i] * 1.2]
         
         x = np.arange(len(categories))
         width = 0.25
@@ -135,36 +258,28 @@ def plot_per_platform_comparison(data, output_dir):
         ax.set_xticklabels(categories)
         ax.legend(fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '03_per_platform_comparison.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.86, bottom=0.07, wspace=0.21)
+    fig.savefig(os.path.join(output_dir, '03_per_platform_comparison.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 03_per_platform_comparison.png")
 
 
-def plot_efficiency_radar(data, output_dir):
+def plot_efficiency_radar(fig, soa, output_dir):
     """Create radar chart showing scaling efficiency."""
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
-    
-    platforms = [c['platform'] for c in data['comparisons']]
+    _reset_figure(fig, 10, 10)
+    ax = fig.subplots(subplot_kw=dict(polar=True))
     
-    # Calculate efficiency (closer to 2.0 is better, normalized 0-100)
-    def efficiency(scaling_factor):
-        if scaling_factor == 0:
-            return 0
-        # Efficiency = 100% when scaling_factor = 2.0, decreases as it increases
-        # 100 - (deviation from 2.0 * 25)
-        return max(0, 100 - abs(scaling_factor - 2.0) * 50)
+    platforms = soa['platform']
     
-    efficiency_2x = [efficiency(c['2x_baseline']['scaling_factor']) for c in data['comparisons']]
-    efficiency_2x_heft = [efficiency(c['2x_heft']['scaling_factor']) for c in data['comparisons']]
+    # Efficiency: 100% at a scaling factor of exactly 2.0 (see _jit.scaling_metrics)
+    efficiency_2x, efficiency_2x_heft = soa['eff_2x'], soa['eff_2x_heft']
     
     # Number of platforms
     N = len(platforms)
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]  # Complete the circle
+    angles = np.linspace(0.0, 2.0 * np.pi, N, endpoint=False)
+    angles = np.concatenate([angles, angles[:1]])  # Complete the circle
     
-    efficiency_2x += efficiency_2x[:1]
-    efficiency_2x_heft += efficiency_2x_heft[:1]
+    efficiency_2x = np.concatenate([efficiency_2x, efficiency_2x[:1]])
+    efficiency_2x_heft = np.concatenate([efficiency_2x_heft, efficiency_2x_heft[:1]])
     
     ax.plot(angles, efficiency_2x, 'o-', linewidth=2, label='2x Baseline', color=COLORS_2X)
     ax.fill(angles, efficiency_2x, alpha=0.25, color=COLORS_2X)
@@ -178,29 +293,20 @@ def plot_efficiency_radar(data, output_dir):
     ax.set_title('Scaling Efficiency (100% = Perfect Linear Scaling)', fontsize=14, fontweight='bold', pad=20)
     ax.legend(loc='lower right', fontsize=10)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '04_scaling_efficiency_radar.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.02, right=0.91, top=0.93, bottom=0.02)
+    fig.savefig(os.path.join(output_dir, '04_scaling_efficiency_radar.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 04_scaling_efficiency_radar.png")
 
 
-def plot_summary_dashboard(data, output_dir):
+def plot_summary_dashboard(fig, soa, output_dir):
     """Create comprehensive summary dashboard."""
-    fig = plt.figure(figsize=(18, 12))
+    _reset_figure(fig, 18, 12)
     fig.suptitle('1x vs 2x Scale Comparison Dashboard', fontsize=18, fontweight='bold', y=0.98)
     
     # Mean comparison subplot
     ax1 = fig.add_subplot(2, 2, 1)
-    platforms = [c['platform'][:12] for c in data['comparisons']]
-    means_1x = [c['1x']['mean'] for c in data['comparisons']]
-    means_2x = [c['2x_baseline']['mean'] for c in data['comparisons']]
-    means_2x_heft = [c['2x_heft']['mean'] for c in data['comparisons']]
-    
-    x = np.arange(len(platforms))
-    width = 0.25
-    ax1.bar(x - width, means_1x, width, label='1x', color=COLORS_1X)
-    ax1.bar(x, means_2x, width, label='2x', color=COLORS_2X)
-    ax1.bar(x + width, means_2x_heft, width, label='2x HEFT', color=COLORS_2X_HEFT)
+    platforms = [p[:12] for p in soa['platform']]
+    x = _draw_mean_bars(ax1, soa, compact=True)
     ax1.set_ylabel('Mean Duration (s)')
     ax1.set_xticks(x)
     ax1.set_xticklabels(platforms, rotation=15)
@@ -209,12 +315,7 @@ def plot_summary_dashboard(data, output_dir):
     
     # Scaling factor subplot
     ax2 = fig.add_subplot(2, 2, 2)
-    scaling_2x = [c['2x_baseline']['scaling_factor'] for c in data['comparisons']]
-    scaling_2x_heft = [c['2x_heft']['scaling_factor'] for c in data['comparisons']]
-    
-    y = np.arange(len(platforms))
-    ax2.barh(y - 0.2, scaling_2x, 0.4, label='2x Baseline', color=COLORS_2X)
-    ax2.barh(y + 0.2, scaling_2x_heft, 0.4, label='2x HEFT', color=COLORS_2X_HEFT)
+    y = _draw_scaling_bars(ax2, soa, 0.4, compact=True)
     ax2.axvline(x=2.0, color='black', linestyle='--', linewidth=2)
     ax2.set_xlabel('Scaling Factor')
     ax2.set_yticks(y)
@@ -224,40 +325,38 @@ def plot_summary_dashboard(data, output_dir):
     
     # HEFT improvement subplot
     ax3 = fig.add_subplot(2, 2, 3)
-    improvements = [(c['2x_baseline']['scaling_factor'] - c['2x_heft']['scaling_factor']) / c['2x_baseline']['scaling_factor'] * 100 
-                   if c['2x_baseline']['scaling_factor'] > 0 else 0 
-                   for c in data['comparisons']]
+    improvements = soa['heft_improvement']
     colors = ['green' if imp > 0 else 'red' for imp in improvements]
     ax3.bar(platforms, improvements, color=colors, alpha=0.8)
     ax3.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     ax3.set_ylabel('HEFT Improvement (%)')
     ax3.set_title('HEFT Scaling Improvement', fontweight='bold')
+    _text = ax3.text
     for i, imp in enumerate(improvements):
-        ax3.text(i, imp + 1, f'{imp:.1f}%', ha='center', fontsize=10, fontweight='bold')
+        _text(i, imp + 1, f'{imp:.1f}%', ha='center', fontsize=10, fontweight='bold')
     
     # Summary text
     ax4 = fig.add_subplot(2, 2, 4)
     ax4.axis('off')
     
-    summary = "📊 SCALE COMPARISON KEY FINDINGS\n\n"
-    for comp in data['comparisons']:
-        sf = comp['2x_baseline']['scaling_factor']
-        sf_heft = comp['2x_heft']['scaling_factor']
+    parts = ["📊 SCALE COMPARISON KEY FINDINGS", ""]
+    for platform, sf, sf_heft in zip(soa['platform'], soa['sf_2x'], soa['sf_2x_heft']):
         emoji = "✅" if sf <= 2.2 else "⚠️" if sf <= 2.5 else "❌"
-        summary += f"{emoji} {comp['platform']}:\n"
-        summary += f"   2x Baseline: {sf:.2f}x\n"
-        summary += f"   2x HEFT: {sf_heft:.2f}x\n\n"
-    
-    summary += "\n🎯 Ideal scaling factor = 2.0x\n"
-    summary += "   (Double work should take double time)"
+        parts.extend([f"{emoji} {platform}:",
+                      f"   2x Baseline: {sf:.2f}x",
+                      f"   2x HEFT: {sf_heft:.2f}x",
+                      ""])
+    parts.extend(["",
+                  "🎯 Ideal scaling factor = 2.0x",
+                  "   (Double work should take double time)"])
+    summary = "\n".join(parts)
     
     ax4.text(0.05, 0.5, summary, fontsize=11, verticalalignment='center',
             fontfamily='monospace', transform=ax4.transAxes,
             bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '05_scale_comparison_dashboard.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.05, right=0.98, top=0.93, bottom=0.04, wspace=0.17, hspace=0.19)
+    fig.savefig(os.path.join(output_dir, '05_scale_comparison_dashboard.png'), dpi=150, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 05_scale_comparison_dashboard.png")
 
 
@@ -269,17 +368,21 @@ def main():
     base_dir = '/home/snu/kubernetes/comparison-logs'
     
     print(f"\nLoading data from {base_dir}...")
-    data = load_data(base_dir)
+    soa = load_data(base_dir)
     
     output_dir = create_output_dir(base_dir)
     print(f"Output directory: {output_dir}")
     
     print("\nGenerating visualizations...")
-    plot_mean_comparison(data, output_dir)
-    plot_scaling_factor(data, output_dir)
-    plot_per_platform_comparison(data, output_dir)
-    plot_efficiency_radar(data, output_dir)
-    plot_summary_dashboard(data, output_dir)
+    # The charts are independent, so they are rendered in parallel; each
+    # worker clears and reuses one figure, and the progress lines are
+    # printed in chart order once all are done
+    plots = (plot_mean_comparison, plot_scaling_factor, plot_per_platform_comparison,
+             plot_efficiency_radar, plot_summary_dashboard)
+    with ProcessPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1),
+                             initializer=_init_worker) as ex:
+        sys.stdout.write(''.join(ex.map(_render_in_worker, plots,
+                                        [soa] * len(plots), [output_dir] * len(plots))))
     
     print("\n" + "=" * 60)
     print("SCALE COMPARISON VISUALIZATION COMPLETE!")
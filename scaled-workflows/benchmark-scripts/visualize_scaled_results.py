@@ -4,15 +4,62 @@ Scaled (2x) Benchmark Visualization Generator
 Creates charts for scaled workflow results.
 """
 
+import io
 import os
 import sys
 import json
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # PNG output only: skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['figure.figsize'] = (14, 10)
-plt.rcParams['font.size'] = 12
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The seaborn-v0_8-whitegrid style inlined, plus this script's own settings,
+# so start-up does not read and parse a style file
+plt.rcParams.update({
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 1.0,
+    'figure.facecolor': 'white',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'image.cmap': 'Greys',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0,
+    'figure.figsize': (14, 10),
+    'font.size': 12,
+})
+
+# Resolution of the per-topic charts (the summary dashboard stays at 150 dpi)
+DPI = int(os.environ.get('CHART_DPI', '100'))
+# zlib level for the PNG writer (Pillow defaults to 6): these are developer
+# charts, so trade a slightly larger file for much faster encoding
+PNG_PIL_KWARGS = {'compress_level': 1}
+# Each chart sets fixed subplot margins (calibrated once against tight_layout)
+# and saves the whole figure, so no layout pass runs per chart
 
 COLORS = {
     'Argo_Scaled': '#FF6B35',
@@ -32,15 +79,83 @@ LABELS = {
     'GitHubActions_Scaled_HEFT': 'GitHub Actions (2x HEFT)',
 }
 
+# (baseline, HEFT, title) platform pairs of plot_baseline_vs_heft
+PAIRS = (
+    ('Argo_Scaled', 'Argo_Scaled_HEFT', 'Argo Workflows'),
+    ('NativeK8s_Scaled', 'NativeK8s_Scaled_HEFT', 'Native Kubernetes'),
+    ('GitHubActions_Scaled', 'GitHubActions_Scaled_HEFT', 'GitHub Actions'),
+)
+
+# Workflow steps of the 2x DAG, in execution order, and their tick labels
+STEPS = ('HEALTH_CHECKS_6X', 'NODE_SIMULATION_1', 'NODE_SIMULATION_2',
+         'INTERIM_HEALTH_CHECK_1', 'INTERIM_HEALTH_CHECK_2',
+         'RACK_SIMULATION_1', 'RACK_SIMULATION_2',
+         'FINAL_HEALTH_CHECK_1', 'FINAL_HEALTH_CHECK_2')
+STEP_LABELS = ('6x Health\nChecks', 'Node\nSim 1', 'Node\nSim 2',
+               'Interim\nHC 1', 'Interim\nHC 2',
+               'Rack\nSim 1', 'Rack\nSim 2',
+               'Final\nHC 1', 'Final\nHC 2')
+STEPS_X = np.arange(len(STEPS))
+
+# Shared read-only default for missing platforms/steps in .get() chains
+_EMPTY = {}
+
 
 def load_data(base_dir):
+    """Load the scaled report, keeping only the fields the charts read (see _project_data)."""
     json_file = os.path.join(base_dir, 'scaled_detailed_comparison.json')
     if not os.path.exists(json_file):
         print(f"Error: {json_file} not found. Run aggregate_scaled_results.py first.")
         sys.exit(1)
     
-    with open(json_file, 'r') as f:
-        return json.load(f)
+    if ORJSON_AVAILABLE:
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+    return _project_data(data)
+
+
+def _project_data(data):
+    """
+    Slim copy of the report: per platform only the run count, success rate and
+    overall statistics; the per-step stats collapse into one float64
+    (platforms x STEPS) array of means, whose rows step_rows maps by name.
+    This is also what gets pickled to each chart worker.
+    """
+    platforms = {}
+    step_means = np.zeros((len(data['platforms']), len(STEPS)))
+    for i, (name, p) in enumerate(data['platforms'].items()):
+        platforms[name] = {
+            'total_runs': p['total_runs'],
+            'success_rate': p['success_rate'],
+            'overall_statistics': p['overall_statistics'],
+        }
+        step_stats = p.get('step_statistics', _EMPTY)
+        step_means[i] = [step_stats.get(s, _EMPTY).get('mean', 0.0) for s in STEPS]
+    return {
+        'platforms': platforms,
+        'step_means': step_means,
+        'step_rows': {name: i for i, name in enumerate(platforms)},
+    }
+
+
+_FIG = None
+
+
+def _init_worker():
+    """Pool initializer: one figure per worker process, reused for each chart it renders."""
+    global _FIG
+    _FIG = plt.figure()
+
+
+def _render_in_worker(plot, data, output_dir):
+    """Run one plot_* function in a pool worker and return what it printed."""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        plot(_FIG, data, output_dir)
+    return out.getvalue()
 
 
 def create_output_dir(base_dir):
@@ -49,81 +164,83 @@ def create_output_dir(base_dir):
     return output_dir
 
 
-def plot_overall_comparison(data, output_dir):
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+_SUBPLOT_PARAMS = ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+
+
+def _reset_figure(fig, width, height):
+    """
+    Blank the shared figure for the next chart. clear() keeps the subplot
+    params the previous chart set, so put back the rc defaults.
+    """
+    fig.clear()
+    fig.set_size_inches(width, height)
+    fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}'] for k in _SUBPLOT_PARAMS})
+
+
+def plot_overall_comparison(fig, data, output_dir):
+    _reset_figure(fig, 16, 12)
+    axes = fig.subplots(2, 2)
     fig.suptitle('Scaled (2x) Workflow Performance Comparison', fontsize=18, fontweight='bold')
     
     platforms = list(data['platforms'].keys())
     x = np.arange(len(platforms))
     width = 0.6
+    colors = [data['colors'][p] for p in platforms]
+    labels15 = [data['labels'][p][:15] for p in platforms]
     
     # Success Rate
     ax1 = axes[0, 0]
     success_rates = [data['platforms'][p]['success_rate'] for p in platforms]
-    bars1 = ax1.bar(x, success_rates, width, color=[COLORS.get(p, '#666') for p in platforms])
+    bars1 = ax1.bar(x, success_rates, width, color=colors)
     ax1.set_ylabel('Success Rate (%)')
     ax1.set_title('Success Rate')
     ax1.set_xticks(x)
-    ax1.set_xticklabels([LABELS.get(p, p)[:15] for p in platforms], rotation=25, ha='right')
+    ax1.set_xticklabels(labels15, rotation=25, ha='right')
     ax1.set_ylim(0, 105)
-    for bar, rate in zip(bars1, success_rates):
-        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                f'{rate:.1f}%', ha='center', fontweight='bold', fontsize=9)
+    ax1.bar_label(bars1, labels=[f'{rate:.1f}%' for rate in success_rates], padding=3, fontweight='bold', fontsize=9)
     
     # Mean Duration
     ax2 = axes[0, 1]
     means = [data['platforms'][p]['overall_statistics'].get('mean', 0) for p in platforms]
-    bars2 = ax2.bar(x, means, width, color=[COLORS.get(p, '#666') for p in platforms])
+    bars2 = ax2.bar(x, means, width, color=colors)
     ax2.set_ylabel('Duration (seconds)')
     ax2.set_title('Mean Execution Duration')
     ax2.set_xticks(x)
-    ax2.set_xticklabels([LABELS.get(p, p)[:15] for p in platforms], rotation=25, ha='right')
-    for bar, dur in zip(bars2, means):
-        ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 10, 
-                f'{dur:.0f}s', ha='center', fontweight='bold', fontsize=9)
+    ax2.set_xticklabels(labels15, rotation=25, ha='right')
+    ax2.bar_label(bars2, labels=[f'{dur:.0f}s' for dur in means], padding=3, fontweight='bold', fontsize=9)
     
     # Median Duration
     ax3 = axes[1, 0]
     medians = [data['platforms'][p]['overall_statistics'].get('median', 0) for p in platforms]
-    bars3 = ax3.bar(x, medians, width, color=[COLORS.get(p, '#666') for p in platforms])
+    bars3 = ax3.bar(x, medians, width, color=colors)
     ax3.set_ylabel('Duration (seconds)')
     ax3.set_title('Median Execution Duration')
     ax3.set_xticks(x)
-    ax3.set_xticklabels([LABELS.get(p, p)[:15] for p in platforms], rotation=25, ha='right')
-    for bar, dur in zip(bars3, medians):
-        ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 10, 
-                f'{dur:.0f}s', ha='center', fontweight='bold', fontsize=9)
+    ax3.set_xticklabels(labels15, rotation=25, ha='right')
+    ax3.bar_label(bars3, labels=[f'{dur:.0f}s' for dur in medians], padding=3, fontweight='bold', fontsize=9)
     
     # Consistency (StdDev)
     ax4 = axes[1, 1]
     stdevs = [data['platforms'][p]['overall_statistics'].get('stdev', 0) for p in platforms]
-    bars4 = ax4.bar(x, stdevs, width, color=[COLORS.get(p, '#666') for p in platforms])
+    bars4 = ax4.bar(x, stdevs, width, color=colors)
     ax4.set_ylabel('Standard Deviation (seconds)')
     ax4.set_title('Execution Variability (Lower = More Consistent)')
     ax4.set_xticks(x)
-    ax4.set_xticklabels([LABELS.get(p, p)[:15] for p in platforms], rotation=25, ha='right')
-    for bar, std in zip(bars4, stdevs):
-        ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2, 
-                f'{std:.0f}s', ha='center', fontweight='bold', fontsize=9)
-    
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '01_scaled_overall_comparison.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    ax4.set_xticklabels(labels15, rotation=25, ha='right')
+    ax4.bar_label(bars4, labels=[f'{std:.0f}s' for std in stdevs], padding=3, fontweight='bold', fontsize=9)
+    
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.93, bottom=0.08, wspace=0.13, hspace=0.26)
+    fig.savefig(os.path.join(output_dir, '01_scaled_overall_comparison.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 01_scaled_overall_comparison.png")
 
 
-def plot_baseline_vs_heft(data, output_dir):
+def plot_baseline_vs_heft(fig, data, output_dir):
     """Compare Baseline scaled vs HEFT scaled for each platform."""
-    fig, axes = plt.subplots(1, 3, figsize=(16, 6))
+    _reset_figure(fig, 16, 6)
+    axes = fig.subplots(1, 3)
     fig.suptitle('Scaled (2x): Baseline vs HEFT Comparison', fontsize=16, fontweight='bold')
     
-    pairs = [
-        ('Argo_Scaled', 'Argo_Scaled_HEFT', 'Argo Workflows'),
-        ('NativeK8s_Scaled', 'NativeK8s_Scaled_HEFT', 'Native Kubernetes'),
-        ('GitHubActions_Scaled', 'GitHubActions_Scaled_HEFT', 'GitHub Actions'),
-    ]
-    
-    for ax, (baseline, heft, title) in zip(axes, pairs):
+    for ax, (baseline, heft, title) in zip(axes, PAIRS):
         b_stats = data['platforms'].get(baseline, {}).get('overall_statistics', {})
         h_stats = data['platforms'].get(heft, {}).get('overall_statistics', {})
         
@@ -143,53 +260,42 @@ def plot_baseline_vs_heft(data, output_dir):
         ax.set_xticklabels(metrics)
         ax.legend()
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '02_scaled_baseline_vs_heft.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.86, bottom=0.07, wspace=0.21)
+    fig.savefig(os.path.join(output_dir, '02_scaled_baseline_vs_heft.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 02_scaled_baseline_vs_heft.png")
 
 
-def plot_step_comparison(data, output_dir):
+def plot_step_comparison(fig, data, output_dir):
     """Compare step-level durations for scaled workflows."""
-    fig, ax = plt.subplots(figsize=(16, 8))
-    
-    steps = ['HEALTH_CHECKS_6X', 'NODE_SIMULATION_1', 'NODE_SIMULATION_2',
-             'INTERIM_HEALTH_CHECK_1', 'INTERIM_HEALTH_CHECK_2',
-             'RACK_SIMULATION_1', 'RACK_SIMULATION_2',
-             'FINAL_HEALTH_CHECK_1', 'FINAL_HEALTH_CHECK_2']
-    
-    step_labels = ['6x Health\nChecks', 'Node\nSim 1', 'Node\nSim 2',
-                   'Interim\nHC 1', 'Interim\nHC 2',
-                   'Rack\nSim 1', 'Rack\nSim 2',
-                   'Final\nHC 1', 'Final\nHC 2']
+    _reset_figure(fig, 16, 8)
+    ax = fig.subplots()
     
     baseline_platforms = ['Argo_Scaled', 'NativeK8s_Scaled', 'GitHubActions_Scaled']
-    x = np.arange(len(steps))
+    x = STEPS_X
     width = 0.25
     
     for i, platform in enumerate(baseline_platforms):
-        step_stats = data['platforms'].get(platform, {}).get('step_statistics', {})
-        means = [step_stats.get(s, {}).get('mean', 0) for s in steps]
+        row = data['step_rows'].get(platform)
+        means = data['step_means'][row] if row is not None else np.zeros(len(STEPS))
         offset = (i - 1) * width
-        ax.bar(x + offset, means, width, label=LABELS.get(platform, platform), 
-               color=COLORS.get(platform, '#666'), alpha=0.85)
+        ax.bar(x + offset, means, width, label=data['labels'][platform], 
+               color=data['colors'][platform], alpha=0.85)
     
     ax.set_ylabel('Mean Duration (seconds)')
     ax.set_title('Scaled (2x) Step-Level Duration Comparison', fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels(step_labels, fontsize=9)
+    ax.set_xticklabels(STEP_LABELS, fontsize=9)
     ax.legend(loc='upper right')
     ax.yaxis.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '03_scaled_step_comparison.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.94, bottom=0.07)
+    fig.savefig(os.path.join(output_dir, '03_scaled_step_comparison.png'), dpi=DPI, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 03_scaled_step_comparison.png")
 
 
-def plot_summary_dashboard(data, output_dir):
+def plot_summary_dashboard(fig, data, output_dir):
     """Create comprehensive summary dashboard."""
-    fig = plt.figure(figsize=(18, 12))
+    _reset_figure(fig, 18, 12)
     fig.suptitle('Scaled (2x) Workflow Benchmark Summary Dashboard', fontsize=18, fontweight='bold', y=0.98)
     
     platforms = list(data['platforms'].keys())
@@ -198,38 +304,28 @@ def plot_summary_dashboard(data, output_dir):
     ax1 = fig.add_subplot(2, 2, 1)
     ax1.axis('off')
     
-    table_data = []
+    # Monospace text block rather than ax.table(): one Text artist instead of
+    # a Rectangle and a Text per cell
+    rows = [f"{'Platform':<20} {'Runs':>5} {'Success':>8} {'Mean':>7} {'Median':>7}"]
     for p in platforms:
         stats = data['platforms'][p]['overall_statistics']
-        heft_label = "(HEFT)" if "HEFT" in p else ""
-        row = [
-            LABELS.get(p, p)[:20],
-            f"{data['platforms'][p]['total_runs']}",
-            f"{data['platforms'][p]['success_rate']:.1f}%",
-            f"{stats.get('mean', 0):.0f}s",
-            f"{stats.get('median', 0):.0f}s",
-        ]
-        table_data.append(row)
-    
-    table = ax1.table(
-        cellText=table_data,
-        colLabels=['Platform', 'Runs', 'Success', 'Mean', 'Median'],
-        loc='center',
-        cellLoc='center'
-    )
-    table.auto_set_font_size(False)
-    table.set_fontsize(9)
-    table.scale(1.2, 1.8)
+        rows.append(f"{data['labels'][p][:20]:<20} {data['platforms'][p]['total_runs']:>5} "
+                    f"{data['platforms'][p]['success_rate']:>7.1f}% "
+                    f"{stats.get('mean', 0):>6.0f}s {stats.get('median', 0):>6.0f}s")
+    
+    ax1.text(0.5, 0.5, '\n'.join(rows), fontsize=12, fontfamily='monospace',
+             horizontalalignment='center', verticalalignment='center', linespacing=1.8,
+             transform=ax1.transAxes)
     ax1.set_title('Scaled Performance Metrics', fontsize=12, fontweight='bold', pad=20)
     
     # Bar chart - Median comparison
     ax2 = fig.add_subplot(2, 2, 2)
     x = np.arange(len(platforms))
     medians = [data['platforms'][p]['overall_statistics'].get('median', 0) for p in platforms]
-    bars = ax2.bar(x, medians, color=[COLORS.get(p, '#666') for p in platforms])
+    bars = ax2.bar(x, medians, color=[data['colors'][p] for p in platforms])
     ax2.set_ylabel('Median Duration (s)')
     ax2.set_xticks(x)
-    ax2.set_xticklabels([LABELS.get(p, p)[:12] for p in platforms], rotation=30, ha='right', fontsize=8)
+    ax2.set_xticklabels([data['labels'][p][:12] for p in platforms], rotation=30, ha='right', fontsize=8)
     ax2.set_title('Median Execution Time', fontsize=12, fontweight='bold')
     
     # Stacked comparison - Baseline vs HEFT
@@ -269,10 +365,10 @@ def plot_summary_dashboard(data, output_dir):
     
     ✅ Total Runs: {total_runs}
     
-    ⚡ Fastest Platform: {LABELS.get(best_speed, best_speed)}
+    ⚡ Fastest Platform: {data['labels'][best_speed]}
        ({data['platforms'][best_speed]['overall_statistics'].get('median', 0):.0f}s median)
     
-    🎯 Highest Success: {LABELS.get(best_success, best_success)}
+    🎯 Highest Success: {data['labels'][best_success]}
        ({data['platforms'][best_success]['success_rate']:.1f}%)
     
     📈 Scale: 2x (6 HC, 2 Node, 2 Rack, 2 Final)
@@ -282,9 +378,8 @@ def plot_summary_dashboard(data, output_dir):
             fontfamily='monospace', transform=ax4.transAxes,
             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.3))
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '04_scaled_summary_dashboard.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.subplots_adjust(left=0.05, right=0.99, top=0.91, bottom=0.04, wspace=0.2, hspace=0.14)
+    fig.savefig(os.path.join(output_dir, '04_scaled_summary_dashboard.png'), dpi=150, pil_kwargs=PNG_PIL_KWARGS)
     print("  Created: 04_scaled_summary_dashboard.png")
 
 
@@ -297,15 +392,24 @@ def main():
     
     print(f"\nLoading data from {base_dir}...")
     data = load_data(base_dir)
+    # Display names and colors resolved once, for every chart; the step chart
+    # also draws the baseline platforms when they are missing from the report
+    names = [*data['platforms'], *(baseline for baseline, _, _ in PAIRS)]
+    data['labels'] = {p: LABELS.get(p, p) for p in names}
+    data['colors'] = {p: COLORS.get(p, '#666') for p in names}
     
     output_dir = create_output_dir(base_dir)
     print(f"Output directory: {output_dir}")
     
     print("\nGenerating visualizations...")
-    plot_overall_comparison(data, output_dir)
-    plot_baseline_vs_heft(data, output_dir)
-    plot_step_comparison(data, output_dir)
-    plot_summary_dashboard(data, output_dir)
+    # The charts are independent, so they are rendered in parallel; each
+    # worker clears and reuses one figure, and the progress lines are
+    # printed in chart order once all are done
+    plots = (plot_overall_comparison, plot_baseline_vs_heft, plot_step_comparison, plot_summary_dashboard)
+    with ProcessPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1),
+                             initializer=_init_worker) as ex:
+        sys.stdout.write(''.join(ex.map(_render_in_worker, plots,
+                                        [data] * len(plots), [output_dir] * len(plots))))
     
     print("\n" + "=" * 60)
     print("SCALED VISUALIZATION COMPLETE!")